@@ -13,16 +13,26 @@ Supports:
 
 import os
 import io
+import sys
+import csv
 import json
 import re
+import html
 import time
+import hashlib
+import random
+import importlib.util
+import concurrent.futures
 from datetime import datetime
-from typing import Optional, Dict, List, Any
-from urllib.parse import urlparse
-from collections import defaultdict
+from typing import Optional, Dict, List, Any, Tuple
+from urllib.parse import urlparse, unquote
+from collections import defaultdict, deque, Counter
+from itertools import islice
 
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
+import numpy as np
 
 # Import configuration from centralized config
 from config import (
@@ -37,7 +47,12 @@ from config import (
 )
 
 # Import session state initialization
-from utils.session_state import init_session_state
+from utils.session_state import (
+    init_session_state, reset_pending_count, set_approved_action, set_approved_actions, build_rc_index,
+)
+
+# Import cached WordPress connection
+from utils.wp_connection import get_wp_client, disconnect_wp_client
 
 # Import Claude API service
 from services.claude_api import (
@@ -45,6 +60,7 @@ from services.claude_api import (
     get_ai_alt_text_suggestion,
     track_event,
     is_anthropic_available,
+    transient_api_errors,
 )
 
 # Import sidebar/integrations components
@@ -73,27 +89,47 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Optional imports - Anthropic is now handled by services/claude_api.py
+# Optional imports - Anthropic is now handled by services/claude_api.py (imported on first use)
 ANTHROPIC_AVAILABLE = is_anthropic_available()
 
+# The WordPress client itself is imported by utils/wp_connection.py when connecting
+WP_AVAILABLE = importlib.util.find_spec("wordpress_client") is not None
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+    from openpyxl.worksheet.cell_range import CellRange
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
 try:
-    from wordpress_client import WordPressClient
-    WP_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    WP_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 
 # =============================================================================
 # APPLY CSS
 # =============================================================================
 
-st.markdown(get_app_css(), unsafe_allow_html=True)
+# The stylesheet is a constant string; st.html inserts it as-is each rerun without a markdown parse
+st.html(get_app_css())
 
 
 # =============================================================================
 # DATA PROCESSING
 # =============================================================================
 
+# Archive/category/tag pages are generated by WordPress and have no editable Post ID
+_ARCHIVE_RE = re.compile(r'/(?:category|tag|author|page|archive)/', re.IGNORECASE)
+
+# Leading scheme and www. prefix, hidden when URLs are shown in the review rows
+_URL_STRIP_RE = re.compile(r'^(?:https?://)?(?:www\.)?', re.IGNORECASE)
+
+
 def detect_domain(urls: List[str]) -> Optional[str]:
     """Detect primary domain from URLs"""
     counts = defaultdict(int)
@@ -120,6 +156,11 @@ def is_internal(url: str, domain: str) -> bool:
         return False
 
 
+def _intern_url(value):
+    """Intern URL strings so the same URL is one object across dicts and sets"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def parse_csv(uploaded_file) -> Optional[pd.DataFrame]:
     """Parse uploaded CSV"""
     try:
@@ -153,6 +194,10 @@ def parse_csv(uploaded_file) -> Optional[pd.DataFrame]:
             if filtered > 0:
                 st.info(f"📍 Filtered to Content links only ({filtered} non-content links excluded for safety)")
         
+        # URLs become keys in broken_urls, sources and post_id_cache
+        for col in ('Source', 'Destination'):
+            df[col] = df[col].map(_intern_url)
+        
         return df
     except Exception as e:
         st.error(f"Error parsing CSV: {e}")
@@ -282,7 +327,7 @@ def group_redirect_chains(df: pd.DataFrame, domain: str) -> tuple:
     Group redirect chains by unique Address -> Final Address pairs.
     Also separates out sitewide links and loops.
     
-    Returns: (redirects_dict, sitewide_list, loops_list)
+    Returns: (redirects_dict sorted by count, sitewide_list, loops_list)
     """
     redirects = {}
     sitewide = []
@@ -381,6 +426,17 @@ def group_redirect_chains(df: pd.DataFrame, domain: str) -> tuple:
         loops_consolidated[key]['sources'].append(item['source'])
         loops_consolidated[key]['count'] += 1
     
+    # Keep redirects in impact order (most pages affected first) so views can page lazily
+    redirects = dict(sorted(redirects.items(), key=lambda kv: kv[1]['count'], reverse=True))
+    
+    # Display forms for the review rows (protocol/www stripped, HTML-escaped)
+    for info in redirects.values():
+        for field in ('address', 'final_address'):
+            display = _URL_STRIP_RE.sub('', info[field], count=1)
+            info[f'{field}_display'] = display
+            info[f'{field}_escaped'] = html.escape(info[field])
+            info[f'{field}_display_escaped'] = html.escape(display)
+    
     return redirects, list(sitewide_consolidated.values()), list(loops_consolidated.values())
 
 
@@ -558,6 +614,9 @@ def group_images_for_alt_text(df: pd.DataFrame, domain: str) -> tuple:
         if key not in images:
             images[key] = {
                 'image_url': destination,
+                'image_url_escaped': html.escape(destination),
+                'widget_key': hashlib.blake2b(destination.encode(), digest_size=6).hexdigest(),  # Short id for widget keys
+                'filename_escaped': html.escape(unquote(destination).split('/')[-1][:50]),  # Row label
                 'current_alt': alt_text if pd.notna(alt_text) else '',
                 'alt_status': reason,  # 'missing', 'filename', 'too_short'
                 'img_type': img_type,  # 'Image' or 'Hyperlink'
@@ -575,6 +634,9 @@ def group_images_for_alt_text(df: pd.DataFrame, domain: str) -> tuple:
         if pd.notna(row.get('post_id')):
             images[key]['source_post_ids'][source] = int(row['post_id'])
     
+    # Keep images in impact order (most pages affected first) so filtering preserves the sort
+    images = dict(sorted(images.items(), key=lambda kv: kv[1]['count'], reverse=True))
+    
     return images, excluded_count
 
 
@@ -631,7 +693,7 @@ def parse_post_id_csv(uploaded_file) -> Dict[str, int]:
             if pd.notna(url) and pd.notna(post_id):
                 try:
                     # Handle potential float values from CSV
-                    post_id_map[str(url).strip()] = int(float(post_id))
+                    post_id_map[sys.intern(str(url).strip())] = int(float(post_id))
                 except (ValueError, TypeError):
                     continue
         
@@ -655,8 +717,7 @@ def match_post_ids_to_sources(source_urls: List[str]) -> tuple:
             matched += 1
         else:
             # Check if it's an archive/category page (expected to be unmatched)
-            url_lower = url.lower()
-            is_archive = any(x in url_lower for x in ['/category/', '/tag/', '/author/', '/page/', '/archive/'])
+            is_archive = bool(_ARCHIVE_RE.search(url))
             unmatched.append({
                 'url': url,
                 'is_archive': is_archive
@@ -767,7 +828,6 @@ def render_upload_section():
 
     # Handle scroll to upload section
     if st.session_state.get('scroll_to_upload'):
-        import streamlit.components.v1 as components
         components.html("""
             <script>
                 setTimeout(function() {
@@ -905,6 +965,7 @@ def render_upload_section():
             with col2:
                 if st.button("✕", key="clear_post_ids_upload", help="Clear Post IDs"):
                     st.session_state.post_id_cache = {}
+                    st.session_state.post_id_negative_cache = {}
                     st.session_state.post_id_file_uploaded = False
                     st.session_state.post_id_file_count = 0
                     st.session_state.has_post_ids = False
@@ -928,6 +989,11 @@ def render_upload_section():
                     st.session_state.df = None
                     st.session_state.broken_urls = {}
                     st.session_state.decisions = {}
+                    reset_pending_count('decisions')
+                    st.session_state.broken_url_index = {}
+                    st.session_state.broken_url_counts = None
+                    st.session_state.broken_urls_total_impact = 0
+                    st.session_state.sources_by_broken_url = {}
                     st.session_state.domain = None
                     if st.session_state.current_task == 'broken_links':
                         st.session_state.current_task = 'redirect_chains' if has_redirect_chains else ('image_alt_text' if has_image_alt_text else None)
@@ -951,6 +1017,8 @@ def render_upload_section():
                     st.session_state.rc_df = None
                     st.session_state.rc_redirects = {}
                     st.session_state.rc_decisions = {}
+                    reset_pending_count('rc_decisions')
+                    build_rc_index()
                     st.session_state.rc_domain = None
                     st.session_state.rc_sitewide = []
                     st.session_state.rc_loops = []
@@ -982,6 +1050,7 @@ def render_upload_section():
                     st.session_state.iat_df = None
                     st.session_state.iat_images = {}
                     st.session_state.iat_decisions = {}
+                    reset_pending_count('iat_decisions')
                     st.session_state.iat_domain = None
                     st.session_state.iat_excluded_count = 0
                     if st.session_state.current_task == 'image_alt_text':
@@ -1124,6 +1193,8 @@ def process_redirect_chains_upload(uploaded_file) -> bool:
         st.session_state.rc_domain = domain
         st.session_state.rc_redirects = redirects
         st.session_state.rc_decisions = decisions
+        reset_pending_count('rc_decisions')
+        build_rc_index()
         st.session_state.rc_sitewide = sitewide
         st.session_state.rc_loops = loops
         st.session_state.task_type = 'redirect_chains'
@@ -1191,6 +1262,17 @@ def process_broken_links_upload(uploaded_file) -> bool:
         st.session_state.domain = domain
         st.session_state.broken_urls = broken_urls
         st.session_state.decisions = decisions
+        reset_pending_count('decisions')
+        
+        # Page counts as an array for fast impact sums
+        st.session_state.broken_url_index = {url: i for i, url in enumerate(broken_urls)}
+        st.session_state.broken_url_counts = np.fromiter(
+            (info['count'] for info in broken_urls.values()), dtype=np.int64, count=len(broken_urls)
+        )
+        st.session_state.broken_urls_total_impact = int(st.session_state.broken_url_counts.sum())
+        
+        # Broken URL -> set of pages it appears on, for fast page set unions
+        st.session_state.sources_by_broken_url = {url: frozenset(info['sources']) for url, info in broken_urls.items()}
         st.session_state.task_type = 'broken_links'
         st.session_state.current_task = 'broken_links'
         
@@ -1254,6 +1336,7 @@ def process_image_alt_text_upload(uploaded_file) -> bool:
         st.session_state.iat_domain = domain
         st.session_state.iat_images = images
         st.session_state.iat_decisions = decisions
+        reset_pending_count('iat_decisions')
         st.session_state.iat_excluded_count = excluded_count
         st.session_state.task_type = 'image_alt_text'
         st.session_state.current_task = 'image_alt_text'
@@ -1499,8 +1582,8 @@ AI will review each broken link and suggest the best fix:
             if ai_ready:
                 if st.button(f"✅ Approve All AI ({len(ai_ready)})", use_container_width=True, help="Approve all pending AI suggestions"):
                     for url in ai_ready:
-                        decisions[url]['approved_action'] = decisions[url]['ai_action']
-                        decisions[url]['approved_fix'] = decisions[url]['ai_suggestion']
+                        d = decisions[url]
+                        set_approved_action('decisions', d, d['ai_action'], d['ai_suggestion'])
                     st.toast(f"✅ Approved {len(ai_ready)} AI suggestions", icon="✅")
                     time.sleep(0.3)
                     st.rerun()
@@ -1565,20 +1648,27 @@ AI will review each broken link and suggest the best fix:
             label_visibility="collapsed"
         )
     
-    # Apply filters
+    # Apply filters (read filter state once, not per URL)
+    ss = st.session_state
+    show_internal = ss.filter_internal
+    show_external = ss.filter_external
+    status_filter = ss.filter_status
+    show_approved = ss.show_approved
+    show_pending = ss.show_pending
+    
     filtered_urls = []
     for url, info in broken_urls.items():
-        if info['is_internal'] and not st.session_state.filter_internal:
+        if info['is_internal'] and not show_internal:
             continue
-        if not info['is_internal'] and not st.session_state.filter_external:
+        if not info['is_internal'] and not show_external:
             continue
         # Status code filter
-        if st.session_state.get('filter_status') and info['status_code'] != st.session_state.filter_status:
+        if status_filter and info['status_code'] != status_filter:
             continue
         has_approval = bool(decisions[url]['approved_action'])
-        if has_approval and not st.session_state.show_approved:
+        if has_approval and not show_approved:
             continue
-        if not has_approval and not st.session_state.show_pending:
+        if not has_approval and not show_pending:
             continue
         filtered_urls.append(url)
     
@@ -1611,15 +1701,14 @@ AI will review each broken link and suggest the best fix:
     
     # Build descriptive header based on active filters
     # Link type description
-    if st.session_state.filter_internal and st.session_state.filter_external:
+    if show_internal and show_external:
         link_type_desc = ""
-    elif st.session_state.filter_internal:
+    elif show_internal:
         link_type_desc = "internal "
     else:
         link_type_desc = "external "
     
     # Status code description
-    status_filter = st.session_state.get('filter_status')
     if status_filter:
         status_desc = f" with {status_filter} errors"
     else:
@@ -1664,14 +1753,64 @@ AI will review each broken link and suggest the best fix:
                 st.rerun()
 
 
-def get_batch_ai_suggestions(urls_batch: List[Dict], domain: str, api_key: str) -> List[Dict]:
-    """Get AI suggestions for a batch of URLs (up to 10 at a time)"""
+# Bulk AI batch sizing: grow while batches are fast and clean, halve on rate limits/timeouts
+BULK_AI_BATCH_DEFAULT = 10
+BULK_AI_BATCH_MIN = 5
+BULK_AI_BATCH_MAX = 25
+BULK_AI_BATCH_STEP = 2
+BULK_AI_FAST_BATCH_SECONDS = 10  # Latency EMA below this counts as "fast"
+BULK_AI_CLEAN_BATCHES_TO_GROW = 5
+BULK_AI_TOKENS_PER_URL = 200  # 10 URLs -> 2000 max_tokens
+BULK_AI_LATENCY_ALPHA = 0.3  # EMA smoothing factor
+BULK_AI_MAX_ATTEMPTS = 3  # Attempts per batch for transient (5xx/529 overloaded/connection) errors
+BULK_AI_RATE_LIMIT_PAUSE = 60  # Seconds to pause the bulk run after a rate limit
+
+
+@st.cache_resource
+def get_bulk_ai_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared worker pool for bulk AI batches (survives reruns)"""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="bulk-ai")
+
+
+def adapt_bulk_ai_batch_size(latency: Optional[float] = None, throttled: bool = False):
+    """Update the bulk AI batch size from the outcome of the last batch.
+
+    latency: seconds the batch took, or None if it failed
+    throttled: True on a rate limit or timeout
+    """
+    batch_size = st.session_state.get('bulk_ai_batch_size', BULK_AI_BATCH_DEFAULT)
+
+    if throttled:
+        st.session_state.bulk_ai_batch_size = max(BULK_AI_BATCH_MIN, batch_size // 2)
+        st.session_state.bulk_ai_clean_batches = 0
+        return
+
+    if latency is None:
+        st.session_state.bulk_ai_clean_batches = 0
+        return
+
+    ema = st.session_state.get('batch_lat_ema')
+    ema = latency if ema is None else BULK_AI_LATENCY_ALPHA * latency + (1 - BULK_AI_LATENCY_ALPHA) * ema
+    st.session_state.batch_lat_ema = ema
+
+    clean_batches = st.session_state.get('bulk_ai_clean_batches', 0) + 1
+    st.session_state.bulk_ai_clean_batches = clean_batches
+
+    if ema < BULK_AI_FAST_BATCH_SECONDS and clean_batches >= BULK_AI_CLEAN_BATCHES_TO_GROW:
+        st.session_state.bulk_ai_batch_size = min(BULK_AI_BATCH_MAX, batch_size + BULK_AI_BATCH_STEP)
+
+
+def get_batch_ai_suggestions(urls_batch: List[Dict], domain: str, api_key: str, max_tokens: int = 2000) -> List[Dict]:
+    """Get AI suggestions for a batch of URLs (BULK_AI_BATCH_MIN to BULK_AI_BATCH_MAX at a time)"""
     
     if not ANTHROPIC_AVAILABLE:
         return [{'url': item['url'], 'action': 'remove', 'replacement': None, 'notes': 'Anthropic library not installed.'} for item in urls_batch]
     
     try:
-        client = Anthropic(api_key=api_key)
+        from anthropic import Anthropic, RateLimitError
+        
+        # Retries are handled below so rate limits reach the pause logic immediately
+        client = Anthropic(api_key=api_key, max_retries=0)
         
         # Build batch prompt
         urls_list = []
@@ -1703,16 +1842,27 @@ Respond with a JSON array, one object per URL in order:
 
 Only output the JSON array, nothing else."""
 
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
-            tools=[{
-                "type": "web_search_20250305",
-                "name": "web_search",
-                "max_uses": 10
-            }],
-            messages=[{"role": "user", "content": prompt}]
-        )
+        # Retry transient failures with exponential backoff + jitter
+        for attempt in range(BULK_AI_MAX_ATTEMPTS):
+            try:
+                response = client.messages.create(
+                    model="claude-sonnet-4-20250514",
+                    max_tokens=max_tokens,
+                    tools=[{
+                        "type": "web_search_20250305",
+                        "name": "web_search",
+                        "max_uses": 10
+                    }],
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                break
+            except RateLimitError:
+                raise Exception("RATE_LIMIT")
+            except transient_api_errors():
+                # Connection errors, 5xx and 529 overloaded (rate limits are handled above)
+                if attempt == BULK_AI_MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep((2 ** attempt) + random.random())
         
         result_text = ""
         for block in response.content:
@@ -1855,7 +2005,7 @@ def render_bulk_ai_modal(pending_urls: List[str], broken_urls: Dict, domain: str
         analyze_count = min(total_unanalyzed, 100)
     
     # Time estimate (batch of 10 takes ~8 seconds)
-    batches = (analyze_count + 9) // 10
+    batches = (analyze_count + BULK_AI_BATCH_DEFAULT - 1) // BULK_AI_BATCH_DEFAULT
     est_seconds = batches * 8
     est_time = f"{est_seconds // 60}m {est_seconds % 60}s" if est_seconds >= 60 else f"{est_seconds}s"
     
@@ -1876,8 +2026,10 @@ def render_bulk_ai_modal(pending_urls: List[str], broken_urls: Dict, domain: str
             st.session_state.bulk_ai_urls_to_process = unanalyzed_urls[:analyze_count]
             st.session_state.bulk_ai_results_summary = {'replace': 0, 'remove': 0, 'error': 0}
             st.session_state.bulk_ai_start_time = time.time()
-            if 'bulk_ai_analyzed_urls' not in st.session_state:
-                st.session_state.bulk_ai_analyzed_urls = set()
+            st.session_state.bulk_ai_batch_size = BULK_AI_BATCH_DEFAULT
+            st.session_state.bulk_ai_batches_done = 0
+            st.session_state.bulk_ai_clean_batches = 0
+            st.session_state.batch_lat_ema = None
             st.rerun()
     with col2:
         if st.button("Cancel", use_container_width=True):
@@ -1885,6 +2037,19 @@ def render_bulk_ai_modal(pending_urls: List[str], broken_urls: Dict, domain: str
             st.rerun()
 
 
+@st.fragment(run_every=1)
+def render_rate_limit_countdown():
+    """Countdown for a rate-limit pause; resumes the bulk run by rerunning the app at zero"""
+    remaining_wait = st.session_state.get('bulk_ai_paused_until', 0) - time.time()
+    if remaining_wait <= 0:
+        st.session_state.bulk_ai_paused_until = 0
+        st.session_state.bulk_ai_pause_reason = ''
+        st.rerun(scope="app")
+    
+    st.progress(min(1.0, max(0.0, 1 - remaining_wait / BULK_AI_RATE_LIMIT_PAUSE)))
+    st.markdown(f"⏱️ Auto-resuming in: **{int(remaining_wait) + 1} seconds**")
+
+
 def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domain: str):
     """Render the progress view during bulk AI analysis with detailed feedback"""
     
@@ -1893,7 +2058,11 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
     urls_to_process = st.session_state.get('bulk_ai_urls_to_process', [])
     results_summary = st.session_state.get('bulk_ai_results_summary', {'replace': 0, 'remove': 0, 'error': 0})
     start_time = st.session_state.get('bulk_ai_start_time', time.time())
-    recent_results = st.session_state.get('bulk_ai_recent_results', [])
+    if not isinstance(st.session_state.get('bulk_ai_recent_results'), deque):
+        st.session_state.bulk_ai_recent_results = deque(maxlen=10)
+    recent_results = st.session_state.bulk_ai_recent_results
+    batch_size = st.session_state.get('bulk_ai_batch_size', BULK_AI_BATCH_DEFAULT)
+    batches_done = st.session_state.get('bulk_ai_batches_done', 0)
     
     # Check for paused state (rate limit)
     paused_until = st.session_state.get('bulk_ai_paused_until', 0)
@@ -1904,19 +2073,14 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
     
     # Handle rate limit pause with countdown
     if paused_until and time.time() < paused_until:
-        remaining_wait = int(paused_until - time.time())
-        
         st.markdown("### ⏸️ Rate Limit Reached")
         st.markdown("""
         Your AI provider limits how many requests can be made per minute. 
         This is normal for large batches.
         """)
         
-        # Countdown progress bar
-        total_wait = 60
-        wait_progress = (total_wait - remaining_wait) / total_wait
-        st.progress(wait_progress)
-        st.markdown(f"⏱️ Auto-resuming in: **{remaining_wait} seconds**")
+        # The countdown fragment reruns only itself each second, and the whole app once it reaches zero
+        render_rate_limit_countdown()
         
         st.markdown(f"Progress saved: **{progress} of {total}** complete")
         
@@ -1932,10 +2096,6 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
                 st.session_state.bulk_ai_paused_until = 0
                 st.session_state.bulk_ai_just_completed = True
                 st.rerun()
-        
-        # Auto-refresh countdown
-        time.sleep(1)
-        st.rerun()
         return
     
     # Clear pause state if time has passed
@@ -1981,11 +2141,12 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
         with col2:
             if st.button("⏭️ Skip & Continue", use_container_width=True):
                 # Skip current batch
-                batch_size = min(10, total - progress)
-                st.session_state.bulk_ai_progress = progress + batch_size
+                skip_count = min(batch_size, total - progress)
+                st.session_state.bulk_ai_progress = progress + skip_count
+                st.session_state.bulk_ai_batches_done = batches_done + 1
                 st.session_state.bulk_ai_error_state = None
                 # Mark skipped URLs
-                for i in range(batch_size):
+                for i in range(skip_count):
                     if progress + i < len(urls_to_process):
                         url = urls_to_process[progress + i]
                         st.session_state.decisions[url]['ai_action'] = ''
@@ -2019,10 +2180,10 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
         st.markdown(f"⏱️ Elapsed: **{elapsed_str}** | Remaining: **~{remaining_str}**")
     
     # Batch info
-    current_batch = (progress // 10) + 1
-    total_batches = (total + 9) // 10
+    current_batch = batches_done + 1
+    total_batches = batches_done + (total - progress + batch_size - 1) // batch_size
     batch_start = progress + 1
-    batch_end = min(progress + 10, total)
+    batch_end = min(progress + batch_size, total)
     
     st.markdown(f"📦 **Processing batch {current_batch} of {total_batches}** (URLs {batch_start}-{batch_end})")
     
@@ -2045,7 +2206,7 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
     # Recent results feed
     if recent_results:
         st.markdown("**Recent results:**")
-        for result in recent_results[-5:]:  # Show last 5
+        for result in list(recent_results)[-5:]:  # Show last 5
             url_short = result['url'].replace('https://', '').replace('http://', '')
             if len(url_short) > 40:
                 url_short = url_short[:37] + "..."
@@ -2080,7 +2241,7 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
     
     # Process next batch
     if progress < total:
-        batch_urls = urls_to_process[progress:min(progress + 10, total)]
+        batch_urls = urls_to_process[progress:min(progress + batch_size, total)]
         
         if batch_urls:
             # Prepare batch data
@@ -2101,20 +2262,22 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
             if api_key:
                 try:
                     # Process batch with timeout
-                    import concurrent.futures
-                    
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(get_batch_ai_suggestions, batch_data, domain, api_key)
-                        try:
-                            results = future.result(timeout=45)  # 45 second timeout
-                        except concurrent.futures.TimeoutError:
-                            st.session_state.bulk_ai_error_state = {
-                                'type': 'timeout',
-                                'message': 'Request took longer than 45 seconds',
-                                'batch': current_batch
-                            }
-                            st.rerun()
-                            return
+                    batch_start_time = time.time()
+                    future = get_bulk_ai_executor().submit(
+                        get_batch_ai_suggestions, batch_data, domain, api_key,
+                        max_tokens=len(batch_data) * BULK_AI_TOKENS_PER_URL
+                    )
+                    try:
+                        results = future.result(timeout=45)  # 45 second timeout
+                    except concurrent.futures.TimeoutError:
+                        adapt_bulk_ai_batch_size(throttled=True)
+                        st.session_state.bulk_ai_error_state = {
+                            'type': 'timeout',
+                            'message': 'Request took longer than 45 seconds',
+                            'batch': current_batch
+                        }
+                        st.rerun()
+                        return
                     
                     # Apply results
                     new_recent = []
@@ -2141,12 +2304,13 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
                         else:
                             results_summary['error'] += 1
                     
-                    # Update recent results
+                    # Update recent results (deque keeps the last 10)
                     recent_results.extend(new_recent)
-                    st.session_state.bulk_ai_recent_results = recent_results[-10:]  # Keep last 10
                     
                     st.session_state.bulk_ai_results_summary = results_summary
                     st.session_state.bulk_ai_progress = progress + len(batch_urls)
+                    st.session_state.bulk_ai_batches_done = batches_done + 1
+                    adapt_bulk_ai_batch_size(latency=time.time() - batch_start_time)
                     
                     # Decrement free suggestions if using agent key
                     if not st.session_state.anthropic_key and AGENT_MODE_API_KEY:
@@ -2159,10 +2323,12 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
                     
                     if "RATE_LIMIT" in error_str or "429" in error_str or "rate" in error_str.lower():
                         # Set pause state with countdown
-                        st.session_state.bulk_ai_paused_until = time.time() + 60
+                        adapt_bulk_ai_batch_size(throttled=True)
+                        st.session_state.bulk_ai_paused_until = time.time() + BULK_AI_RATE_LIMIT_PAUSE
                         st.session_state.bulk_ai_pause_reason = 'rate_limit'
                         st.rerun()
                     elif "timeout" in error_str.lower() or "timed out" in error_str.lower():
+                        adapt_bulk_ai_batch_size(throttled=True)
                         st.session_state.bulk_ai_error_state = {
                             'type': 'timeout',
                             'message': error_str[:100],
@@ -2170,6 +2336,7 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
                         }
                         st.rerun()
                     elif "connection" in error_str.lower() or "network" in error_str.lower():
+                        adapt_bulk_ai_batch_size()
                         st.session_state.bulk_ai_error_state = {
                             'type': 'connection',
                             'message': error_str[:100],
@@ -2177,6 +2344,7 @@ def render_bulk_ai_progress(unanalyzed_urls: List[str], broken_urls: Dict, domai
                         }
                         st.rerun()
                     else:
+                        adapt_bulk_ai_batch_size()
                         st.session_state.bulk_ai_error_state = {
                             'type': 'unknown',
                             'message': error_str[:150],
@@ -2211,8 +2379,15 @@ def render_bulk_ai_completion(total_pending: int, total_analyzed: int, broken_ur
         st.markdown(f"- **{results_summary['error']}** → Could not determine (review manually)")
     
     # Impact summary
-    analyzed_impact = sum(broken_urls[url]['count'] for url in analyzed_urls if url in broken_urls)
-    total_impact = sum(info['count'] for info in broken_urls.values())
+    url_index = st.session_state.get('broken_url_index', {})
+    counts = st.session_state.get('broken_url_counts')
+    if counts is not None and len(counts) == len(broken_urls):
+        analyzed_idx = [url_index[url] for url in analyzed_urls if url in url_index]
+        analyzed_impact = int(counts[analyzed_idx].sum())
+        total_impact = st.session_state.get('broken_urls_total_impact', 0)
+    else:
+        analyzed_impact = sum(broken_urls[url]['count'] for url in analyzed_urls if url in broken_urls)
+        total_impact = sum(info['count'] for info in broken_urls.values())
     impact_pct = (analyzed_impact / total_impact * 100) if total_impact > 0 else 0
     
     st.markdown(f"📊 These links affect **{analyzed_impact:,}** pages ({impact_pct:.0f}% of total impact)")
@@ -2238,15 +2413,13 @@ def render_bulk_ai_completion(total_pending: int, total_analyzed: int, broken_ur
 
 def render_compact_url_row(url: str, info: Dict, decision: Dict, domain: str):
     """Render a compact inline-editable URL row with 4 columns"""
-    import html
-    
     # Determine current state
     has_ai = bool(decision['ai_action'])
     is_approved = bool(decision['approved_action'])
     is_editing = st.session_state.editing_url == url
     
     # Display URL - strip protocol for display only, keep full URL for link
-    display_url = url.replace('https://', '').replace('http://', '').replace('www.', '')
+    display_url = _URL_STRIP_RE.sub('', url, count=1)
     
     # Truncate display only if very long (80+ chars)
     if len(display_url) > 80:
@@ -2274,7 +2447,7 @@ def render_compact_url_row(url: str, info: Dict, decision: Dict, domain: str):
                 elif decision['approved_action'] == 'replace':
                     fix_url = decision['approved_fix']
                     fix_url_escaped = html.escape(fix_url)
-                    fix_display = fix_url.replace('https://', '').replace('http://', '').replace('www.', '')
+                    fix_display = _URL_STRIP_RE.sub('', fix_url, count=1)
                     if len(fix_display) > 50:
                         fix_display = fix_display[:47] + "..."
                     fix_display_escaped = html.escape(fix_display)
@@ -2287,7 +2460,7 @@ def render_compact_url_row(url: str, info: Dict, decision: Dict, domain: str):
                 else:
                     ai_url = decision['ai_suggestion']
                     ai_url_escaped = html.escape(ai_url)
-                    ai_display = ai_url.replace('https://', '').replace('http://', '').replace('www.', '')
+                    ai_display = _URL_STRIP_RE.sub('', ai_url, count=1)
                     if len(ai_display) > 50:
                         ai_display = ai_display[:47] + "..."
                     ai_display_escaped = html.escape(ai_display)
@@ -2303,8 +2476,7 @@ def render_compact_url_row(url: str, info: Dict, decision: Dict, domain: str):
             elif has_ai:
                 # Has AI suggestion - show clickable approve checkbox
                 if st.button("☐", key=f"approve_ai_{url}", help="Approve AI suggestion"):
-                    decision['approved_action'] = decision['ai_action']
-                    decision['approved_fix'] = decision['ai_suggestion']
+                    set_approved_action('decisions', decision, decision['ai_action'], decision['ai_suggestion'])
                     st.toast("✅ Approved", icon="✅")
                     st.rerun()
             else:
@@ -2331,8 +2503,51 @@ def render_compact_url_row(url: str, info: Dict, decision: Dict, domain: str):
             render_inline_edit(url, info, decision, domain)
 
 
+class _UncachedSuggestion(Exception):
+    """Carries a failed AI suggestion out of the cache so it isn't memoized"""
+
+    def __init__(self, result: Dict[str, str]):
+        super().__init__(result.get('notes', ''))
+        self.result = result
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _cached_ai_suggestion(broken_url: str, domain: str, info_hash: str, key_hash: str,
+                          _info: Dict, _api_key: str) -> Dict[str, Any]:
+    """Memoized get_ai_suggestion keyed on URL, domain, URL info and API key hash"""
+    result = get_ai_suggestion(broken_url, _info, domain, _api_key)
+    if result['action'] == 'error' or str(result.get('notes', '')).startswith('Error:'):
+        raise _UncachedSuggestion(result)
+    return {**result, 'fetched_at': time.time()}
+
+
+def get_cached_ai_suggestion(broken_url: str, info: Dict, domain: str, api_key: str) -> tuple:
+    """Get an AI suggestion, reusing an earlier result for the same inputs.
+
+    Returns (result, from_cache).
+    """
+    call_time = time.time()
+    try:
+        result = _cached_ai_suggestion(
+            broken_url,
+            domain,
+            _hash_session_dict(info),
+            hashlib.sha256(api_key.encode()).hexdigest(),
+            info,
+            api_key,
+        )
+    except _UncachedSuggestion as e:
+        return e.result, False
+    return result, result['fetched_at'] < call_time
+
+
+@st.fragment
 def render_inline_edit(url: str, info: Dict, decision: Dict, domain: str):
-    """Render compact inline edit form"""
+    """Render compact inline edit form.
+
+    Runs as a fragment so edits rerun only this panel; actions that change
+    the row's status or close the editor rerun the full app.
+    """
     
     with st.container():
         st.markdown("---")
@@ -2350,19 +2565,17 @@ def render_inline_edit(url: str, info: Dict, decision: Dict, domain: str):
         
         with action_cols[0]:
             if st.button("🗑️ Remove", key=f"quick_remove_{url}", use_container_width=True, help="Remove the link, keep anchor text"):
-                decision['approved_action'] = 'remove'
-                decision['approved_fix'] = ''
+                set_approved_action('decisions', decision, 'remove')
                 st.session_state.editing_url = None
                 st.toast("✅ Set to Remove", icon="✅")
-                st.rerun()
+                st.rerun(scope="app")
         
         with action_cols[1]:
             if st.button("⏭️ Ignore", key=f"quick_ignore_{url}", use_container_width=True, help="Skip this URL"):
-                decision['approved_action'] = 'ignore'
-                decision['approved_fix'] = ''
+                set_approved_action('decisions', decision, 'ignore')
                 st.session_state.editing_url = None
                 st.toast("✅ Ignored", icon="✅")
-                st.rerun()
+                st.rerun(scope="app")
         
         with action_cols[2]:
             # Single AI button
@@ -2371,13 +2584,13 @@ def render_inline_edit(url: str, info: Dict, decision: Dict, domain: str):
                 if st.button("🤖 Get AI", key=f"quick_ai_{url}", use_container_width=True, help="Get AI suggestion"):
                     api_key = st.session_state.anthropic_key or AGENT_MODE_API_KEY
                     with st.spinner("AI analyzing..."):
-                        result = get_ai_suggestion(url, info, domain, api_key)
+                        result, from_cache = get_cached_ai_suggestion(url, info, domain, api_key)
                         decision['ai_action'] = result['action']
                         decision['ai_suggestion'] = result['url'] or ''
                         decision['ai_notes'] = result['notes']
-                        if not st.session_state.anthropic_key:
+                        # Cached answers don't use up free suggestions
+                        if not st.session_state.anthropic_key and not from_cache:
                             st.session_state.ai_suggestions_remaining = max(0, st.session_state.ai_suggestions_remaining - 1)
-                    st.rerun()
             else:
                 st.button("🤖 Get AI", key=f"quick_ai_{url}", use_container_width=True, disabled=True, help="Add API key first")
         
@@ -2387,32 +2600,33 @@ def render_inline_edit(url: str, info: Dict, decision: Dict, domain: str):
         with action_cols[4]:
             if st.button("❌ Close", key=f"close_edit_{url}", use_container_width=True):
                 st.session_state.editing_url = None
-                st.rerun()
+                st.rerun(scope="app")
         
         # Show AI suggestion if available
-        if decision['ai_action']:
+        ai_action = decision['ai_action']
+        if ai_action:
             st.markdown("**AI Suggestion:**")
-            if decision['ai_action'] == 'error':
+            notes = decision.get('ai_notes', '')
+            if ai_action == 'error':
                 # Show error with helpful message about API key
                 st.warning(f"⚠️ {decision.get('ai_notes', 'API key error. Please add a valid Claude API key in the Integrations Setup section above.')}")
-            elif decision['ai_action'] == 'remove':
-                st.info(f"🗑️ **Remove link** — {decision['ai_notes'][:100]}..." if len(decision.get('ai_notes', '')) > 100 else f"🗑️ **Remove link** — {decision.get('ai_notes', 'No suitable replacement found')}")
+            elif ai_action == 'remove':
+                notes_short = f"{notes[:100]}..." if len(notes) > 100 else decision.get('ai_notes', 'No suitable replacement found')
+                st.info(f"🗑️ **Remove link** — {notes_short}")
             else:
                 st.success(f"🔗 **Replace with:** `{decision['ai_suggestion']}`")
-                if decision.get('ai_notes'):
-                    st.caption(decision['ai_notes'][:150] + "..." if len(decision['ai_notes']) > 150 else decision['ai_notes'])
+                if notes:
+                    st.caption(notes[:150] + "..." if len(notes) > 150 else notes)
             
             # Only show accept button if not an error
-            if decision['ai_action'] != 'error' and st.button("✅ Accept AI Suggestion", key=f"accept_ai_{url}", type="primary", use_container_width=True):
-                decision['approved_action'] = decision['ai_action']
-                decision['approved_fix'] = decision['ai_suggestion']
+            if ai_action != 'error' and st.button("✅ Accept AI Suggestion", key=f"accept_ai_{url}", type="primary", use_container_width=True):
+                set_approved_action('decisions', decision, ai_action, decision['ai_suggestion'])
                 st.session_state.editing_url = None
                 st.toast("✅ Approved", icon="✅")
-                st.rerun()
+                st.rerun(scope="app")
         
         # Manual replacement input
         st.markdown("**Or enter replacement URL:**")
-        manual_cols = st.columns([4, 1])
         
         # Get base URL from domain - only for internal links
         is_internal = info.get('is_internal', True)
@@ -2427,34 +2641,38 @@ def render_inline_edit(url: str, info: Dict, decision: Dict, domain: str):
         existing_value = decision.get('manual_fix', '')
         default_value = existing_value if existing_value else base_url
         
-        with manual_cols[0]:
-            manual_url = st.text_input(
-                "Replacement URL",
-                value=default_value,
-                placeholder=placeholder,
-                key=f"manual_input_{url}",
-                label_visibility="collapsed"
-            )
-        with manual_cols[1]:
+        # Form holds keystrokes until Save (or Enter) so typing doesn't rerun
+        with st.form(f"manual_form_{url}", border=False):
+            manual_cols = st.columns([4, 1])
+            with manual_cols[0]:
+                st.text_input(
+                    "Replacement URL",
+                    value=default_value,
+                    placeholder=placeholder,
+                    key=f"manual_input_{url}",
+                    label_visibility="collapsed"
+                )
+            with manual_cols[1]:
+                save_manual = st.form_submit_button("✓ Save", type="primary", use_container_width=True)
+        
+        if save_manual:
+            manual_url = st.session_state[f"manual_input_{url}"]
             # Check if URL has content
             has_valid_url = manual_url and len(manual_url.strip()) > 10 and manual_url.startswith('http')
-            if st.button("✓ Save", key=f"save_manual_{url}", type="primary", use_container_width=True):
-                if has_valid_url:
-                    decision['approved_action'] = 'replace'
-                    decision['approved_fix'] = manual_url
-                    decision['manual_fix'] = manual_url
-                    st.session_state.editing_url = None
-                    st.toast("✅ Saved", icon="✅")
-                    st.rerun()
-                else:
-                    st.toast("⚠️ Enter a full URL path", icon="⚠️")
+            if has_valid_url:
+                set_approved_action('decisions', decision, 'replace', manual_url)
+                decision['manual_fix'] = manual_url
+                st.session_state.editing_url = None
+                st.toast("✅ Saved", icon="✅")
+                st.rerun(scope="app")
+            else:
+                st.toast("⚠️ Enter a full URL path", icon="⚠️")
         
         # Reset button if already approved
         if decision['approved_action']:
             if st.button("↩️ Reset to Pending", key=f"reset_{url}"):
-                decision['approved_action'] = ''
-                decision['approved_fix'] = ''
-                st.rerun()
+                set_approved_action('decisions', decision, '')
+                st.rerun(scope="app")
         
         st.markdown("---")
 
@@ -2469,10 +2687,7 @@ def render_wordpress_section():
             st.success("✅ Connected to WordPress")
         with col2:
             if st.button("Disconnect"):
-                if st.session_state.wp_client:
-                    st.session_state.wp_client.close()
-                st.session_state.wp_connected = False
-                st.session_state.wp_client = None
+                disconnect_wp_client()
                 st.rerun()
     else:
         st.markdown("""
@@ -2509,28 +2724,32 @@ def render_wordpress_section():
             - **Getting 403 errors?** Your user account may not have permission to edit posts. Ask a site admin for help.
             """)
         
-        col1, col2 = st.columns(2)
-        with col1:
-            site_url = st.text_input(
-                "Site URL",
-                placeholder="https://your-site.com",
-                help="Your WordPress site URL (without /wp-json)"
-            )
-        with col2:
-            username = st.text_input(
-                "Username",
-                placeholder="admin",
-                help="Your WordPress admin username"
+        # Form batches the inputs so typing doesn't rerun the app per keystroke
+        with st.form("wp_connect_form", clear_on_submit=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                site_url = st.text_input(
+                    "Site URL",
+                    placeholder="https://your-site.com",
+                    help="Your WordPress site URL (without /wp-json)"
+                )
+            with col2:
+                username = st.text_input(
+                    "Username",
+                    placeholder="admin",
+                    help="Your WordPress admin username"
+                )
+            
+            app_password = st.text_input(
+                "Application Password ⚠️ This is NOT your WordPress login password — see instructions above",
+                type="password",
+                placeholder="xxxx xxxx xxxx xxxx xxxx xxxx",
+                help="Generate this in WordPress under Users → Profile → Application Passwords. This is a separate password specifically for API access."
             )
+            
+            submitted = st.form_submit_button("🔌 Connect to WordPress", type="primary")
         
-        app_password = st.text_input(
-            "Application Password ⚠️ This is NOT your WordPress login password — see instructions above",
-            type="password",
-            placeholder="xxxx xxxx xxxx xxxx xxxx xxxx",
-            help="Generate this in WordPress under Users → Profile → Application Passwords. This is a separate password specifically for API access."
-        )
-        
-        if st.button("🔌 Connect to WordPress", type="primary"):
+        if submitted:
             if not all([site_url, username, app_password]):
                 st.error("Please fill in all fields")
             elif not WP_AVAILABLE:
@@ -2538,16 +2757,11 @@ def render_wordpress_section():
             else:
                 with st.spinner("Connecting..."):
                     try:
-                        client = WordPressClient(site_url, username, app_password)
-                        result = client.test_connection()
-                        
-                        if result["success"]:
-                            st.session_state.wp_connected = True
-                            st.session_state.wp_client = client
-                            st.success(f"✅ {result['message']}")
-                            st.rerun()
-                        else:
-                            st.error(result["message"])
+                        st.session_state.wp_client = get_wp_client(site_url, username, app_password)
+                        st.session_state.wp_connected = True
+                        st.rerun()
+                    except ConnectionError as e:
+                        st.error(str(e))
                     except Exception as e:
                         st.error(f"Connection failed: {str(e)}")
         
@@ -2558,71 +2772,121 @@ def render_wordpress_section():
         """, unsafe_allow_html=True)
 
 
-def create_gsheets_report() -> bytes:
-    """Create a professional Excel report optimized for Google Sheets upload"""
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-    from openpyxl.formatting.rule import FormulaRule
-    from io import BytesIO
-    
-    decisions = st.session_state.decisions
-    broken_urls = st.session_state.broken_urls
-    domain = st.session_state.domain or "Unknown"
-    
-    wb = Workbook()
-    
-    # =========================================================================
-    # TAB 1: SUMMARY (Executive Overview)
-    # =========================================================================
-    summary = wb.active
-    summary.title = "Summary"
-    
-    # Styling
-    header_fill = PatternFill(start_color="1a365d", end_color="1a365d", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    metric_font = Font(bold=True, size=24, color="1a365d")
-    label_font = Font(size=11, color="64748b")
-    section_font = Font(bold=True, size=14, color="1a365d")
-    
-    thin_border = Border(
-        left=Side(style='thin', color='e2e8f0'),
-        right=Side(style='thin', color='e2e8f0'),
-        top=Side(style='thin', color='e2e8f0'),
-        bottom=Side(style='thin', color='e2e8f0')
+_DEFAULT_LINK_POSITIONS = ('Content',)
+_REPORT_NUMPY_THRESHOLD = 1000  # Use columnar aggregation for report stats above this many URLs
+
+# Excel report styles
+if OPENPYXL_AVAILABLE:
+    _REPORT_HEADER_FILL = PatternFill(start_color="1a365d", end_color="1a365d", fill_type="solid")
+    _REPORT_TABLE_HEADER_FILL = PatternFill(start_color="f1f5f9", end_color="f1f5f9", fill_type="solid")
+    _REPORT_PENDING_HEADER_FILL = PatternFill(start_color="fef3c7", end_color="fef3c7", fill_type="solid")
+    _FILL_REMOVE = PatternFill(start_color="fef2f2", end_color="fef2f2", fill_type="solid")
+    _FILL_REPLACE = PatternFill(start_color="f0fdf4", end_color="f0fdf4", fill_type="solid")
+    _FILL_DEFAULT = PatternFill(start_color="f8fafc", end_color="f8fafc", fill_type="solid")
+    _REPORT_HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+    _REPORT_TITLE_FONT = Font(bold=True, size=20, color="1a365d")
+    _REPORT_METRIC_FONT = Font(bold=True, size=24, color="1a365d")
+    _REPORT_LABEL_FONT = Font(size=11, color="64748b")
+    _REPORT_SECTION_FONT = Font(bold=True, size=14, color="1a365d")
+    _REPORT_BOLD_FONT = Font(bold=True)
+    _REPORT_CENTER = Alignment(horizontal='center')
+    _REPORT_THIN_SIDE = Side(style='thin', color='e2e8f0')
+    _REPORT_THIN_BORDER = Border(
+        left=_REPORT_THIN_SIDE,
+        right=_REPORT_THIN_SIDE,
+        top=_REPORT_THIN_SIDE,
+        bottom=_REPORT_THIN_SIDE
     )
+
+
+def _hash_session_dict(d: Dict) -> str:
+    """Content hash for session dicts passed to cached builders"""
+    return hashlib.sha1(json.dumps(d, sort_keys=True, default=str).encode()).hexdigest()
+
+
+# Report tabs, in workbook order
+REPORT_SHEETS = ('summary', 'fixes', 'details', 'pending')
+REPORT_SHEET_LABELS = {
+    'summary': "📈 Summary",
+    'fixes': "✅ Fixes",
+    'details': "📋 Detailed Log",
+    'pending': "⏳ Pending Review",
+}
+_FIX_ROW_STYLES = {'remove': "fix_remove", 'replace': "fix_replace"}
+
+
+def _styled_row(ws, values, **styles) -> List:
+    """Build a row of write-only cells sharing the given style attributes"""
+    row_cells = []
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
+        for attr, style in styles.items():
+            setattr(cell, attr, style)
+        row_cells.append(cell)
+    return row_cells
+
+
+def _build_summary_sheet(wb, decisions: Dict, broken_urls: Dict, domain: str):
+    """TAB 1: SUMMARY (Executive Overview)"""
+    summary = wb.create_sheet("Summary")
+    label_font = _REPORT_LABEL_FONT
+    section_font = _REPORT_SECTION_FONT
     
-    # Title
-    summary['A1'] = "🔗 Broken Links Audit Report"
-    summary['A1'].font = Font(bold=True, size=20, color="1a365d")
-    summary.merge_cells('A1:F1')
+    # Column widths
+    summary.column_dimensions['A'].width = 18
+    summary.column_dimensions['B'].width = 12
+    summary.column_dimensions['C'].width = 12
+    summary.column_dimensions['D'].width = 25
+    summary.column_dimensions['E'].width = 15
+    summary.column_dimensions['F'].width = 15
     
-    # Metadata
-    summary['A2'] = f"Site: {domain}"
-    summary['A2'].font = Font(size=11, color="64748b")
-    summary['D2'] = f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
-    summary['D2'].font = Font(size=11, color="64748b")
-    summary.merge_cells('A2:C2')
-    summary.merge_cells('D2:F2')
+    for merged_range in ('A1:F1', 'A2:C2', 'D2:F2', 'A4:F4'):
+        summary.merged_cells.add(CellRange(merged_range))
     
     # Calculate stats
     total_broken = len(broken_urls)
-    total_fixed = sum(1 for d in decisions.values() if d['approved_action'] in ['remove', 'replace'])
-    total_ignored = sum(1 for d in decisions.values() if d['approved_action'] == 'ignore')
-    total_pending = sum(1 for d in decisions.values() if not d['approved_action'])
-    total_remove = sum(1 for d in decisions.values() if d['approved_action'] == 'remove')
-    total_replace = sum(1 for d in decisions.values() if d['approved_action'] == 'replace')
-    
-    total_pages_affected = sum(info['count'] for info in broken_urls.values())
-    internal_count = sum(1 for info in broken_urls.values() if info['is_internal'])
+    action_counts = Counter(d['approved_action'] or 'pending' for d in decisions.values())
+    total_remove = action_counts['remove']
+    total_replace = action_counts['replace']
+    total_fixed = total_remove + total_replace
+    total_ignored = action_counts['ignore']
+    total_pending = action_counts['pending']
+    
+    # Page, internal and status code totals
+    if total_broken > _REPORT_NUMPY_THRESHOLD:
+        # Large audits: sum the count and internal columns with numpy
+        infos = broken_urls.values()
+        total_pages_affected = int(np.fromiter(
+            (info['count'] for info in infos), dtype=np.int64, count=total_broken
+        ).sum())
+        internal_count = int(np.fromiter(
+            (bool(info['is_internal']) for info in infos), dtype=bool, count=total_broken
+        ).sum())
+        status_counts = Counter(info['status_code'] for info in infos)
+    else:
+        total_pages_affected = 0
+        internal_count = 0
+        status_counts = Counter()
+        for info in broken_urls.values():
+            total_pages_affected += info['count']
+            internal_count += bool(info['is_internal'])
+            status_counts[info['status_code']] += 1
     external_count = total_broken - internal_count
     
-    # Key Metrics Section
-    summary['A4'] = "KEY METRICS"
-    summary['A4'].font = section_font
-    summary.merge_cells('A4:F4')
+    # Row 1: Title
+    summary.append(_styled_row(summary, ["🔗 Broken Links Audit Report"], font=_REPORT_TITLE_FONT))
+    
+    # Row 2: Metadata
+    summary.append(
+        _styled_row(summary, [f"Site: {domain}", None, None], font=label_font)
+        + _styled_row(summary, [f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"], font=label_font)
+    )
+    summary.append([])
+    
+    # Row 4: Key Metrics Section
+    summary.append(_styled_row(summary, ["KEY METRICS"], font=section_font))
     
-    # Metrics row
+    # Rows 5-6: Metrics
     metrics = [
         ("Total Broken", total_broken),
         ("Fixed", total_fixed),
@@ -2630,22 +2894,14 @@ def create_gsheets_report() -> bytes:
         ("Pending", total_pending),
         ("Pages Affected", total_pages_affected),
     ]
+    summary.append(_styled_row(summary, [value for _, value in metrics], font=_REPORT_METRIC_FONT, alignment=_REPORT_CENTER))
+    summary.append(_styled_row(summary, [label for label, _ in metrics], font=label_font, alignment=_REPORT_CENTER))
+    summary.append([])
     
-    for i, (label, value) in enumerate(metrics):
-        col = get_column_letter(i + 1)
-        summary[f'{col}5'] = value
-        summary[f'{col}5'].font = metric_font
-        summary[f'{col}5'].alignment = Alignment(horizontal='center')
-        summary[f'{col}6'] = label
-        summary[f'{col}6'].font = label_font
-        summary[f'{col}6'].alignment = Alignment(horizontal='center')
-    
-    # Breakdown Section
-    summary['A8'] = "BREAKDOWN"
-    summary['A8'].font = section_font
+    # Row 8: Breakdown Section
+    summary.append(_styled_row(summary, ["BREAKDOWN"], font=section_font))
     
     breakdown_data = [
-        ["Category", "Count", "Percentage"],
         ["Internal Links", internal_count, f"{internal_count/total_broken*100:.1f}%" if total_broken > 0 else "0%"],
         ["External Links", external_count, f"{external_count/total_broken*100:.1f}%" if total_broken > 0 else "0%"],
         ["", "", ""],
@@ -2655,27 +2911,21 @@ def create_gsheets_report() -> bytes:
         ["Pending Review", total_pending, f"{total_pending/total_broken*100:.1f}%" if total_broken > 0 else "0%"],
     ]
     
-    for row_idx, row_data in enumerate(breakdown_data, start=9):
-        for col_idx, value in enumerate(row_data, start=1):
-            cell = summary.cell(row=row_idx, column=col_idx, value=value)
-            cell.border = thin_border
-            if row_idx == 9:  # Header row
-                cell.fill = PatternFill(start_color="f1f5f9", end_color="f1f5f9", fill_type="solid")
-                cell.font = Font(bold=True)
-    
-    # Status codes breakdown
-    status_counts = {}
-    for info in broken_urls.values():
-        code = info['status_code']
-        status_counts[code] = status_counts.get(code, 0) + 1
-    
-    summary['A19'] = "STATUS CODES"
-    summary['A19'].font = section_font
-    
-    status_row = 20
-    summary.cell(row=status_row, column=1, value="Status Code").font = Font(bold=True)
-    summary.cell(row=status_row, column=2, value="Count").font = Font(bold=True)
-    summary.cell(row=status_row, column=3, value="Meaning").font = Font(bold=True)
+    # Rows 9-16: header + breakdown
+    summary.append(_styled_row(
+        summary, ["Category", "Count", "Percentage"],
+        border=_REPORT_THIN_BORDER,
+        fill=_REPORT_TABLE_HEADER_FILL,
+        font=_REPORT_BOLD_FONT
+    ))
+    for row_data in breakdown_data:
+        summary.append(_styled_row(summary, row_data, style="bordered"))
+    summary.append([])
+    summary.append([])
+    
+    # Row 19-20: Status codes section + header
+    summary.append(_styled_row(summary, ["STATUS CODES"], font=section_font))
+    summary.append(_styled_row(summary, ["Status Code", "Count", "Meaning"], font=_REPORT_BOLD_FONT))
     
     status_meanings = {
         400: "Bad Request",
@@ -2688,205 +2938,211 @@ def create_gsheets_report() -> bytes:
         503: "Service Unavailable"
     }
     
-    for i, (code, count) in enumerate(sorted(status_counts.items()), start=1):
-        row = status_row + i
-        summary.cell(row=row, column=1, value=code)
-        summary.cell(row=row, column=2, value=count)
-        summary.cell(row=row, column=3, value=status_meanings.get(code, "Other Error"))
+    for code, count in sorted(status_counts.items()):
+        summary.append([code, count, status_meanings.get(code, "Other Error")])
+
+
+def _build_fixes_sheet(wb, decisions: Dict, broken_urls: Dict):
+    """TAB 2: FIXES (Action Log)"""
+    fixes = wb.create_sheet("Fixes")
     
     # Column widths
-    summary.column_dimensions['A'].width = 18
-    summary.column_dimensions['B'].width = 12
-    summary.column_dimensions['C'].width = 12
-    summary.column_dimensions['D'].width = 25
-    summary.column_dimensions['E'].width = 15
-    summary.column_dimensions['F'].width = 15
+    fixes.column_dimensions['A'].width = 50
+    fixes.column_dimensions['B'].width = 12
+    fixes.column_dimensions['C'].width = 10
+    fixes.column_dimensions['D'].width = 15
+    fixes.column_dimensions['E'].width = 50
+    fixes.column_dimensions['F'].width = 12
+    fixes.column_dimensions['G'].width = 30
+    fixes.column_dimensions['H'].width = 40
     
-    # =========================================================================
-    # TAB 2: FIXES (Action Log)
-    # =========================================================================
-    fixes = wb.create_sheet("Fixes")
+    # Freeze header row
+    fixes.freeze_panes = 'A2'
     
     # Header
     fix_headers = ["Broken URL", "Status Code", "Type", "Action", "New URL", "Pages Affected", "Anchor Text", "AI Notes"]
-    for col, header in enumerate(fix_headers, start=1):
-        cell = fixes.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center')
+    fixes.append(_styled_row(
+        fixes, fix_headers, fill=_REPORT_HEADER_FILL, font=_REPORT_HEADER_FONT, alignment=_REPORT_CENTER
+    ))
     
     # Data rows
-    row = 2
     for url, decision in decisions.items():
-        if not decision['approved_action']:
+        action = decision['approved_action']
+        if not action:
             continue  # Skip pending
             
         info = broken_urls.get(url, {})
+        anchors_list = info.get('anchors') or ()
         
         # Determine action text
-        if decision['approved_action'] == 'remove':
+        if action == 'remove':
             action_text = "🗑️ Remove Link"
             new_url = ""
-        elif decision['approved_action'] == 'replace':
+        elif action == 'replace':
             action_text = "🔗 Replace"
             new_url = decision['approved_fix']
-        elif decision['approved_action'] == 'ignore':
+        elif action == 'ignore':
             action_text = "⏭️ Ignored"
             new_url = ""
         else:
-            action_text = decision['approved_action']
+            action_text = action
             new_url = decision['approved_fix']
         
-        anchors = ", ".join(info.get('anchors', [])[:3])
-        if len(info.get('anchors', [])) > 3:
-            anchors += f" (+{len(info['anchors'])-3} more)"
-        
-        fixes.cell(row=row, column=1, value=url)
-        fixes.cell(row=row, column=2, value=info.get('status_code', ''))
-        fixes.cell(row=row, column=3, value="Internal" if info.get('is_internal') else "External")
-        fixes.cell(row=row, column=4, value=action_text)
-        fixes.cell(row=row, column=5, value=new_url)
-        fixes.cell(row=row, column=6, value=info.get('count', 0))
-        fixes.cell(row=row, column=7, value=anchors)
-        fixes.cell(row=row, column=8, value=decision.get('ai_notes', ''))
+        anchors = ", ".join(anchors_list[:3])
+        if len(anchors_list) > 3:
+            anchors += f" (+{len(anchors_list)-3} more)"
         
         # Color code rows
-        if decision['approved_action'] == 'remove':
-            fill = PatternFill(start_color="fef2f2", end_color="fef2f2", fill_type="solid")
-        elif decision['approved_action'] == 'replace':
-            fill = PatternFill(start_color="f0fdf4", end_color="f0fdf4", fill_type="solid")
-        else:
-            fill = PatternFill(start_color="f8fafc", end_color="f8fafc", fill_type="solid")
-        
-        for col in range(1, 9):
-            fixes.cell(row=row, column=col).fill = fill
-            fixes.cell(row=row, column=col).border = thin_border
-        
-        row += 1
+        fixes.append(_styled_row(fixes, [
+            url,
+            info.get('status_code', ''),
+            "Internal" if info.get('is_internal') else "External",
+            action_text,
+            new_url,
+            info.get('count', 0),
+            anchors,
+            decision.get('ai_notes', ''),
+        ], style=_FIX_ROW_STYLES.get(action, "fix_other")))
+
+
+def _build_details_sheet(wb, decisions: Dict, broken_urls: Dict, post_id_cache: Dict):
+    """TAB 3: DETAILED LOG (Every source page)"""
+    details = wb.create_sheet("Detailed Log")
     
     # Column widths
-    fixes.column_dimensions['A'].width = 50
-    fixes.column_dimensions['B'].width = 12
-    fixes.column_dimensions['C'].width = 10
-    fixes.column_dimensions['D'].width = 15
-    fixes.column_dimensions['E'].width = 50
-    fixes.column_dimensions['F'].width = 12
-    fixes.column_dimensions['G'].width = 30
-    fixes.column_dimensions['H'].width = 40
+    details.column_dimensions['A'].width = 50
+    details.column_dimensions['B'].width = 10
+    details.column_dimensions['C'].width = 50
+    details.column_dimensions['D'].width = 25
+    details.column_dimensions['E'].width = 12
+    details.column_dimensions['F'].width = 50
+    details.column_dimensions['G'].width = 15
     
     # Freeze header row
-    fixes.freeze_panes = 'A2'
-    
-    # =========================================================================
-    # TAB 3: DETAILED LOG (Every source page)
-    # =========================================================================
-    details = wb.create_sheet("Detailed Log")
+    details.freeze_panes = 'A2'
     
     # Header
     detail_headers = ["Source Page", "Post ID", "Broken URL", "Anchor Text", "Action", "New URL", "Link Position"]
-    for col, header in enumerate(detail_headers, start=1):
-        cell = details.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
+    details.append(_styled_row(details, detail_headers, fill=_REPORT_HEADER_FILL, font=_REPORT_HEADER_FONT))
     
     # Data - one row per source page affected
-    row = 2
     for url, decision in decisions.items():
-        if not decision['approved_action'] or decision['approved_action'] == 'ignore':
+        action = decision['approved_action']
+        if not action or action == 'ignore':
             continue
             
         info = broken_urls.get(url, {})
         
         # Get action and new URL
-        if decision['approved_action'] == 'remove':
+        if action == 'remove':
             action_text = "Remove"
             new_url = ""
         else:
             action_text = "Replace"
             new_url = decision['approved_fix']
         
+        # Same anchor and link position for every source page of this URL
+        anchors_list = info.get('anchors')
+        anchor = anchors_list[0] if anchors_list else ''
+        link_position = (info.get('link_positions') or _DEFAULT_LINK_POSITIONS)[0]
+        
         # One row per source page
-        for source in info.get('sources', []):
-            post_id = st.session_state.post_id_cache.get(source, "")
-            anchor = info.get('anchors', [''])[0] if info.get('anchors') else ''
-            
-            details.cell(row=row, column=1, value=source)
-            details.cell(row=row, column=2, value=post_id)
-            details.cell(row=row, column=3, value=url)
-            details.cell(row=row, column=4, value=anchor)
-            details.cell(row=row, column=5, value=action_text)
-            details.cell(row=row, column=6, value=new_url)
-            details.cell(row=row, column=7, value=info.get('link_positions', ['Content'])[0] if info.get('link_positions') else 'Content')
-            
-            for col in range(1, 8):
-                details.cell(row=row, column=col).border = thin_border
-            
-            row += 1
+        for source in info.get('sources', ()):
+            post_id = post_id_cache.get(source, "")
+            details.append(_styled_row(
+                details, [source, post_id, url, anchor, action_text, new_url, link_position], style="bordered"
+            ))
+
+
+def _build_pending_sheet(wb, decisions: Dict, broken_urls: Dict):
+    """TAB 4: PENDING (Still needs review)"""
+    pending = wb.create_sheet("Pending Review")
     
     # Column widths
-    details.column_dimensions['A'].width = 50
-    details.column_dimensions['B'].width = 10
-    details.column_dimensions['C'].width = 50
-    details.column_dimensions['D'].width = 25
-    details.column_dimensions['E'].width = 12
-    details.column_dimensions['F'].width = 50
-    details.column_dimensions['G'].width = 15
-    
-    # Freeze header row
-    details.freeze_panes = 'A2'
+    pending.column_dimensions['A'].width = 50
+    pending.column_dimensions['B'].width = 12
+    pending.column_dimensions['C'].width = 10
+    pending.column_dimensions['D'].width = 12
+    pending.column_dimensions['E'].width = 30
+    pending.column_dimensions['F'].width = 40
     
-    # =========================================================================
-    # TAB 4: PENDING (Still needs review)
-    # =========================================================================
-    pending = wb.create_sheet("Pending Review")
+    pending.freeze_panes = 'A2'
     
     # Header
     pending_headers = ["Broken URL", "Status Code", "Type", "Pages Affected", "Anchor Text", "AI Suggestion"]
-    for col, header in enumerate(pending_headers, start=1):
-        cell = pending.cell(row=1, column=col, value=header)
-        cell.fill = PatternFill(start_color="fef3c7", end_color="fef3c7", fill_type="solid")
-        cell.font = Font(bold=True)
+    pending.append(_styled_row(
+        pending, pending_headers,
+        fill=_REPORT_PENDING_HEADER_FILL,
+        font=_REPORT_BOLD_FONT
+    ))
     
     # Data
-    row = 2
     for url, decision in decisions.items():
         if decision['approved_action']:
             continue  # Skip approved
             
         info = broken_urls.get(url, {})
-        anchors = ", ".join(info.get('anchors', [])[:2])
+        anchors = ", ".join((info.get('anchors') or ())[:2])
         
         ai_suggestion = ""
-        if decision.get('ai_action'):
-            if decision['ai_action'] == 'remove':
+        ai_action = decision.get('ai_action')
+        if ai_action:
+            if ai_action == 'remove':
                 ai_suggestion = "AI suggests: Remove"
             else:
                 ai_suggestion = f"AI suggests: {decision.get('ai_suggestion', '')}"
         
-        pending.cell(row=row, column=1, value=url)
-        pending.cell(row=row, column=2, value=info.get('status_code', ''))
-        pending.cell(row=row, column=3, value="Internal" if info.get('is_internal') else "External")
-        pending.cell(row=row, column=4, value=info.get('count', 0))
-        pending.cell(row=row, column=5, value=anchors)
-        pending.cell(row=row, column=6, value=ai_suggestion)
-        
-        for col in range(1, 7):
-            pending.cell(row=row, column=col).border = thin_border
-        
-        row += 1
-    
-    # Column widths
-    pending.column_dimensions['A'].width = 50
-    pending.column_dimensions['B'].width = 12
-    pending.column_dimensions['C'].width = 10
-    pending.column_dimensions['D'].width = 12
-    pending.column_dimensions['E'].width = 30
-    pending.column_dimensions['F'].width = 40
-    
-    pending.freeze_panes = 'A2'
+        pending.append(_styled_row(pending, [
+            url,
+            info.get('status_code', ''),
+            "Internal" if info.get('is_internal') else "External",
+            info.get('count', 0),
+            anchors,
+            ai_suggestion,
+        ], style="bordered"))
+
+
+def create_gsheets_report(sheets: Tuple[str, ...] = REPORT_SHEETS) -> bytes:
+    """Create a professional Excel report optimized for Google Sheets upload"""
+    return _build_gsheets_report(
+        st.session_state.decisions,
+        st.session_state.broken_urls,
+        st.session_state.domain or "Unknown",
+        st.session_state.post_id_cache,
+        tuple(sheet for sheet in REPORT_SHEETS if sheet in sheets),
+    )
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False, hash_funcs={dict: _hash_session_dict})
+def _build_gsheets_report(decisions: Dict, broken_urls: Dict, domain: str, post_id_cache: Dict,
+                          sheets: Tuple[str, ...] = REPORT_SHEETS) -> bytes:
+    """Build the Excel report bytes for the requested tabs (cached on the content of the inputs)"""
+    if not OPENPYXL_AVAILABLE:
+        raise ImportError("openpyxl is required. Install with: pip install openpyxl")
+    if not sheets:
+        raise ValueError("Select at least one tab to include in the report.")
+    
+    # Write-only mode streams each row to XML on append(), so rows must be
+    # written top to bottom and column widths/freeze panes set first
+    wb = Workbook(write_only=True)
+    
+    # Shared row styles (stored once per workbook and referenced by name)
+    wb.add_named_style(NamedStyle(name="bordered", border=_REPORT_THIN_BORDER))
+    for style_name, fill in (("fix_remove", _FILL_REMOVE), ("fix_replace", _FILL_REPLACE), ("fix_other", _FILL_DEFAULT)):
+        wb.add_named_style(NamedStyle(name=style_name, fill=fill, border=_REPORT_THIN_BORDER))
+    
+    # Only the requested tabs are built
+    if 'summary' in sheets:
+        _build_summary_sheet(wb, decisions, broken_urls, domain)
+    if 'fixes' in sheets:
+        _build_fixes_sheet(wb, decisions, broken_urls)
+    if 'details' in sheets:
+        _build_details_sheet(wb, decisions, broken_urls, post_id_cache)
+    if 'pending' in sheets:
+        _build_pending_sheet(wb, decisions, broken_urls)
     
     # Save to BytesIO
-    output = BytesIO()
+    output = io.BytesIO()
     wb.save(output)
     output.seek(0)
     return output.getvalue()
@@ -2907,21 +3163,35 @@ def render_gsheets_export_modal():
     - ⏳ **Pending Review** — URLs still needing attention
     """)
     
+    # Tabs to include (unticked tabs are never built)
+    st.markdown("**Include tabs:**")
+    tab_cols = st.columns(len(REPORT_SHEETS))
+    selected_sheets = tuple(
+        sheet for sheet, tab_col in zip(REPORT_SHEETS, tab_cols)
+        if tab_col.checkbox(REPORT_SHEET_LABELS[sheet], value=True, key=f"gsheets_tab_{sheet}")
+    )
+    
+    # A report built for a different tab selection is stale
+    if st.session_state.gsheets_export_sheets != selected_sheets:
+        st.session_state.gsheets_export_data = None
+    
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("📥 Generate Report", type="primary", use_container_width=True):
+        if st.button("📥 Generate Report", type="primary", use_container_width=True, disabled=not selected_sheets):
             with st.spinner("Creating your report..."):
                 try:
-                    xlsx_data = create_gsheets_report()
+                    xlsx_data = create_gsheets_report(selected_sheets)
                     
                     # Track export
                     track_event("export", {
                         "format": "xlsx_gsheets",
-                        "total_urls": len(st.session_state.broken_urls)
+                        "total_urls": len(st.session_state.broken_urls),
+                        "sheets": list(selected_sheets)
                     })
                     
                     st.session_state.gsheets_export_data = xlsx_data
+                    st.session_state.gsheets_export_sheets = selected_sheets
                     st.success("✅ Report ready!")
                 except Exception as e:
                     st.error(f"Error creating report: {str(e)}")
@@ -2955,19 +3225,66 @@ def render_gsheets_export_modal():
         """)
 
 
+# Static HTML for the WordPress apply banners; only the numbers are filled in per render
+_QUICK_START_TEST_RUN_BANNER = """
+<div style="background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%); padding: 1.25rem; border-radius: 10px; margin-bottom: 1rem; border: 1px solid #7dd3fc;">
+    <div style="font-weight: 600; color: #0c4a6e; margin-bottom: 0.5rem;">🤖 Quick Start Mode: Test Run</div>
+    <div style="color: #0369a1; font-size: 0.95rem;">
+        You have {pages_to_fix} pages, but Quick Start Mode handles {limit} at a time.<br>
+        <strong>Let's fix the first {limit} pages</strong> so you can see the tool in action!
+    </div>
+</div>
+"""
+
+_TEST_RUN_BANNER = """
+<div style="background: #eff6ff; padding: 0.75rem 1rem; border-radius: 8px; border: 1px solid #bfdbfe; margin-bottom: 1rem;">
+    <span style="font-weight: 600; color: #1e40af;">🧪 Test Run:</span>
+    <span style="color: #3730a3;">Fixing {url_count} broken URLs across {pages_to_fix} pages (first {limit} pages only)</span>
+</div>
+"""
+
+_TEST_RUN_SUCCESS_BANNER = """
+<div style="background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%); padding: 1.25rem; border-radius: 10px; border: 1px solid #6ee7b7;">
+    <div style="font-weight: 600; color: #065f46; font-size: 1.1rem; margin-bottom: 0.5rem;">✅ Test Run Successful!</div>
+    <div style="color: #047857; margin-bottom: 1rem;">
+        You've verified that Screaming Fixes works on your site. 
+        <strong>{remaining_pages} more pages</strong> are waiting to be fixed.
+    </div>
+    <div style="font-weight: 600; color: #065f46; margin-bottom: 0.5rem;">Next Steps:</div>
+    <div style="color: #047857;">
+        1. Set up <strong>Fast Mode</strong> in Screaming Frog (2 min setup)<br>
+        2. Re-crawl your site to capture Post IDs<br>
+        3. Re-upload your CSV — all {total_pages} pages will be ready to fix
+    </div>
+</div>
+"""
+
+
+def _track_export(export_format: str, export_data: List[Dict]):
+    """Track an export with per-row action counts (counts only, no URLs)"""
+    action_counts = Counter(row['action'] for row in export_data)
+    track_event("export", {
+        "format": export_format,
+        "total_fixes": len(export_data),
+        "remove_count": action_counts['remove'],
+        "replace_count": action_counts['replace']
+    })
+
+
 def render_export_section():
     """Render export section"""
     decisions = st.session_state.decisions
-    broken_urls = st.session_state.broken_urls
     
-    approved = [(url, d) for url, d in decisions.items() if d['approved_action'] and d['approved_action'] != 'ignore']
-    has_approved = len(approved) > 0
+    approved_count = sum(
+        1 for d in decisions.values() if d['approved_action'] and d['approved_action'] != 'ignore'
+    )
+    has_approved = approved_count > 0
     
     st.markdown('<p class="section-header">Export & Apply</p>', unsafe_allow_html=True)
     
     # Status message based on approved count
     if has_approved:
-        st.markdown(f"✅ **{len(approved)} fixes approved** and ready")
+        st.markdown(f"✅ **{approved_count} fixes approved** and ready")
     else:
         st.markdown("No fixes approved yet. Approve fixes above to enable export.")
     
@@ -2983,16 +3300,9 @@ def render_export_section():
             export_data = create_export_data()
             
             # Track export (counts only, no URLs)
-            remove_count = sum(1 for d in export_data if d['action'] == 'remove')
-            replace_count = sum(1 for d in export_data if d['action'] == 'replace')
-            track_event("export", {
-                "format": "csv",
-                "total_fixes": len(export_data),
-                "remove_count": remove_count,
-                "replace_count": replace_count
-            })
+            _track_export("csv", export_data)
             
-            csv_data = pd.DataFrame(export_data).to_csv(index=False)
+            csv_data = records_to_csv(export_data)
             st.download_button(
                 "Download CSV",
                 data=csv_data,
@@ -3006,16 +3316,9 @@ def render_export_section():
             export_data = create_export_data()
             
             # Track export (counts only, no URLs)
-            remove_count = sum(1 for d in export_data if d['action'] == 'remove')
-            replace_count = sum(1 for d in export_data if d['action'] == 'replace')
-            track_event("export", {
-                "format": "json",
-                "total_fixes": len(export_data),
-                "remove_count": remove_count,
-                "replace_count": replace_count
-            })
+            _track_export("json", export_data)
             
-            json_data = json.dumps(export_data, indent=2)
+            json_data = records_to_json(export_data)
             st.download_button(
                 "Download JSON",
                 data=json_data,
@@ -3040,11 +3343,11 @@ def render_export_section():
         st.info("Approve some fixes above first")
         return
     
+    approved = [(url, d) for url, d in decisions.items() if d['approved_action'] and d['approved_action'] != 'ignore']
+    
     # Count how many source pages need fixes
-    source_pages_to_fix = set()
-    for url, decision in approved:
-        for source in broken_urls[url]['sources']:
-            source_pages_to_fix.add(source)
+    sources_by_broken_url = st.session_state.sources_by_broken_url
+    source_pages_to_fix = set().union(*(sources_by_broken_url[url] for url, _ in approved))
     
     pages_to_fix = len(source_pages_to_fix)
     has_post_ids = st.session_state.has_post_ids
@@ -3096,25 +3399,21 @@ def render_export_section():
             # Over limit - offer test run
             pages_over = pages_to_fix - AGENT_MODE_LIMIT
             
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%); padding: 1.25rem; border-radius: 10px; margin-bottom: 1rem; border: 1px solid #7dd3fc;">
-                <div style="font-weight: 600; color: #0c4a6e; margin-bottom: 0.5rem;">🤖 Quick Start Mode: Test Run</div>
-                <div style="color: #0369a1; font-size: 0.95rem;">
-                    You have {pages_to_fix} pages, but Quick Start Mode handles {AGENT_MODE_LIMIT} at a time.<br>
-                    <strong>Let's fix the first {AGENT_MODE_LIMIT} pages</strong> so you can see the tool in action!
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            if not st.session_state.apply_in_progress:
+                st.markdown(
+                    _QUICK_START_TEST_RUN_BANNER.format(pages_to_fix=pages_to_fix, limit=AGENT_MODE_LIMIT),
+                    unsafe_allow_html=True
+                )
             
             # Select first 25 pages
             test_run_pages = list(source_pages_to_fix)[:AGENT_MODE_LIMIT]
+            test_run_pages_set = set(test_run_pages)
             
             # Filter approved fixes to only those affecting test run pages
-            test_run_approved = []
-            for url, decision in approved:
-                sources_in_test = [s for s in broken_urls[url]['sources'] if s in test_run_pages]
-                if sources_in_test:
-                    test_run_approved.append((url, decision))
+            test_run_approved = [
+                (url, decision) for url, decision in approved
+                if sources_by_broken_url[url] & test_run_pages_set
+            ]
             
             st.markdown(f"**Test run:** {len(test_run_approved)} broken URLs across {len(test_run_pages)} pages")
             
@@ -3125,28 +3424,89 @@ def render_export_section():
             else:
                 if st.session_state.post_id_check_passed:
                     st.success("✅ Compatibility check passed!")
-                    render_wordpress_execute_ui(test_run_approved, set(test_run_pages), is_test_run=True)
+                    render_wordpress_execute_ui(test_run_approved, test_run_pages_set, is_test_run=True)
                 else:
                     st.error("❌ Automatic Post ID lookup failed.")
                     st.info("💡 Try setting up Full Mode for more reliable Post ID handling.")
 
 
-def run_post_id_sample_check(sample_urls: List[str]):
-    """Run sample check on a few URLs to verify Post ID discovery works"""
-    client = st.session_state.wp_client
+WP_LOOKUP_WORKERS = 8  # Concurrent Post ID lookups against the WordPress site
+WP_APPLY_WORKERS = 8  # Concurrent post rewrites when applying redirect and alt text fixes
+POST_ID_NEGATIVE_TTL = 600  # Seconds before a failed Post ID lookup is retried
+WP_LOG_WINDOW = 50  # Log lines shown while applying fixes
+
+
+def find_post_ids_concurrently(client, urls: List[str]) -> Dict[str, Optional[int]]:
+    """
+    Look up Post IDs for several pages at once.
+    Slugs are resolved in bulk; only pages without a slug match fall back to
+    fetching their HTML for a shortlink (blocking HTTP, run in parallel).
+    """
+    if not urls:
+        return {}
+    resolved = dict.fromkeys(urls)
+    resolved.update(client.find_post_ids_by_slug(urls))
+    rest = [url for url, post_id in resolved.items() if not post_id]
+    if rest:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(WP_LOOKUP_WORKERS, len(rest))) as pool:
+            resolved.update(zip(rest, pool.map(client.find_post_id_by_shortlink, rest)))
+    return resolved
+
+
+def resolve_post_ids(client, urls: List[str]) -> Dict[str, Optional[int]]:
+    """
+    Resolve Post IDs for pages, checking the session caches first.
+    Only uncached pages hit the network; misses are remembered for POST_ID_NEGATIVE_TTL.
+    """
+    cache = st.session_state.post_id_cache
+    negative_cache = st.session_state.post_id_negative_cache
+    now = time.time()
+    
+    resolved = {}
+    to_lookup = []
+    for url in dict.fromkeys(urls):
+        if url in cache:
+            resolved[url] = cache[url]
+        elif now - negative_cache.get(url, 0) < POST_ID_NEGATIVE_TTL:
+            resolved[url] = None
+        else:
+            to_lookup.append(url)
+    
+    # Cache writes stay on the main thread
+    for url, post_id in find_post_ids_concurrently(client, to_lookup).items():
+        resolved[url] = post_id
+        if post_id:
+            cache[url] = post_id
+            negative_cache.pop(url, None)
+        else:
+            negative_cache[url] = now
+    
+    return resolved
+
+
+def resolve_post_id(client, url: str) -> Optional[int]:
+    """Resolve a single page's Post ID through the session caches"""
+    return resolve_post_ids(client, [url])[url]
+
+
+def run_post_id_sample_check(sample_urls: List[str]):
+    """Run sample check on a few URLs to verify Post ID discovery works"""
+    client = st.session_state.wp_client
     
     with st.status("Checking compatibility...", expanded=True) as status:
         found = 0
         failed = 0
         
+        # Look up all samples in parallel, then report from the main thread
+        post_ids = resolve_post_ids(client, sample_urls)
+        
         for url in sample_urls:
             st.write(f"Testing: `{url[:60]}...`")
-            post_id = client.find_post_id_by_url(url)
+            post_id = post_ids[url]
             
             if post_id:
                 st.write(f"  ✅ Found Post ID: {post_id}")
                 found += 1
-                st.session_state.post_id_cache[url] = post_id
             else:
                 st.write(f"  ❌ Post ID not found")
                 failed += 1
@@ -3161,6 +3521,7 @@ def run_post_id_sample_check(sample_urls: List[str]):
             st.session_state.post_id_check_passed = False
             status.update(label="❌ Compatibility check failed", state="error")
     
+    # One rerun per completed check so the page switches to the result
     st.rerun()
 
 
@@ -3218,19 +3579,18 @@ def render_large_dataset_instructions():
         """)
 
 
+@st.fragment
 def render_wordpress_execute_ui(approved: List, source_pages_to_fix: set, is_test_run: bool = False):
-    """Render the execute UI when ready to apply fixes"""
+    """Render the execute UI when ready to apply fixes (reruns on its own, not the whole app)"""
     pages_to_fix = len(source_pages_to_fix)
     
     st.markdown("---")
     
-    if is_test_run:
-        st.markdown(f"""
-        <div style="background: #eff6ff; padding: 0.75rem 1rem; border-radius: 8px; border: 1px solid #bfdbfe; margin-bottom: 1rem;">
-            <span style="font-weight: 600; color: #1e40af;">🧪 Test Run:</span>
-            <span style="color: #3730a3;">Fixing {len(approved)} broken URLs across {pages_to_fix} pages (first {AGENT_MODE_LIMIT} pages only)</span>
-        </div>
-        """, unsafe_allow_html=True)
+    if is_test_run and not st.session_state.apply_in_progress:
+        st.markdown(
+            _TEST_RUN_BANNER.format(url_count=len(approved), pages_to_fix=pages_to_fix, limit=AGENT_MODE_LIMIT),
+            unsafe_allow_html=True
+        )
     
     col1, col2 = st.columns(2)
     
@@ -3250,6 +3610,16 @@ def render_wordpress_execute_ui(approved: List, source_pages_to_fix: set, is_tes
 
 def run_agent_fixes(approved: List, source_pages_to_fix: set, is_test_run: bool = False):
     """Run the agent to apply fixes with live view"""
+    # Flag stays set only while fixes are being applied (cleared even if the run is interrupted)
+    st.session_state.apply_in_progress = True
+    try:
+        _apply_agent_fixes(approved, source_pages_to_fix, is_test_run)
+    finally:
+        st.session_state.apply_in_progress = False
+
+
+def _apply_agent_fixes(approved: List, source_pages_to_fix: set, is_test_run: bool):
+    """Apply approved fixes to WordPress and render the live log and summary"""
     client = st.session_state.wp_client
     broken_urls = st.session_state.broken_urls
     
@@ -3275,108 +3645,105 @@ def run_agent_fixes(approved: List, source_pages_to_fix: set, is_test_run: bool
     st.markdown("### 🤖 Applying Fixes")
     
     progress_bar = st.progress(0)
-    status_container = st.container()
     
-    with status_container:
-        for i, fix in enumerate(fixes_to_apply):
-            progress_bar.progress((i + 1) / total_fixes)
+    ready_fixes = []  # Fixes with a known Post ID, applied together below
+    
+    with st.status(f"Applying {total_fixes} fixes...", expanded=True) as status:
+        # One placeholder holds the whole log; only the last WP_LOG_WINDOW lines are re-rendered
+        log_placeholder = st.empty()
+        log_lines = []
+        
+        def log(*lines):
+            log_lines.extend(lines)
+            log_placeholder.markdown("\n\n".join(log_lines[-WP_LOG_WINDOW:]))
+        
+        # Step 1: Get Post IDs (all missing pages looked up in one parallel pass)
+        missing_sources = list(dict.fromkeys(fix['source_url'] for fix in fixes_to_apply if not fix['post_id']))
+        found_post_ids = {}
+        if missing_sources:
+            log(f"🔍 Finding Post IDs for {len(missing_sources)} pages...")
+            found_post_ids = resolve_post_ids(client, missing_sources)
+        
+        for fix in fixes_to_apply:
+            if fix['post_id']:
+                ready_fixes.append(fix)
+                continue
             
-            with st.status(f"Fix {i+1} of {total_fixes}", expanded=True) as status:
-                # Step 1: Get Post ID
-                post_id = fix['post_id']
-                
-                if not post_id:
-                    st.write(f"🔍 Finding Post ID for: `{fix['source_url'][:50]}...`")
-                    post_id = client.find_post_id_by_url(fix['source_url'])
-                    
-                    if post_id:
-                        st.write(f"   ✅ Found Post ID: {post_id}")
-                        st.session_state.post_id_cache[fix['source_url']] = post_id
-                    else:
-                        # Check if it's a category/archive/tag page
-                        source_lower = fix['source_url'].lower()
-                        is_archive = any(x in source_lower for x in ['/category/', '/tag/', '/author/', '/page/', '/archive/'])
-                        
-                        if is_archive:
-                            st.write(f"   ℹ️ This is an archive/category page (dynamically generated)")
-                            st.write(f"   💡 Fix the links on individual posts — archive pages will update automatically")
-                            msg = 'Archive/category page - fix individual posts instead'
-                        else:
-                            st.write(f"   ❌ Post ID not found — skipping")
-                            msg = 'Post ID not found'
-                        
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'broken_url': fix['broken_url'],
-                            'action': fix['action'],
-                            'status': 'skipped',
-                            'message': msg
-                        })
-                        skipped_for_retry.append(fix)
-                        status.update(label=f"⏭️ Skipped", state="error")
-                        continue
+            post_id = found_post_ids.get(fix['source_url'])
+            if post_id:
+                fix['post_id'] = post_id
+                ready_fixes.append(fix)
+                continue
+            
+            # Check if it's a category/archive/tag page
+            is_archive = bool(_ARCHIVE_RE.search(fix['source_url']))
+            
+            if is_archive:
+                log(f"ℹ️ `{fix['source_url'][:50]}...` is an archive/category page (dynamically generated) — "
+                    f"fix the links on individual posts instead")
+                msg = 'Archive/category page - fix individual posts instead'
+            else:
+                log(f"⏭️ `{fix['source_url'][:50]}...` — Post ID not found, skipping")
+                msg = 'Post ID not found'
+            
+            results.append({
+                'source_url': fix['source_url'],
+                'broken_url': fix['broken_url'],
+                'action': fix['action'],
+                'status': 'skipped',
+                'message': msg
+            })
+            skipped_for_retry.append(fix)
+        
+        progress_bar.progress(0.5)
+        
+        # Step 2: Apply fixes (one content fetch per post, batched saves)
+        failed_count = 0
+        if ready_fixes:
+            post_count = len({fix['post_id'] for fix in ready_fixes})
+            log(f"🔧 Applying {len(ready_fixes)} fixes across {post_count} pages...")
+            try:
+                apply_results = client.batch_apply_fixes(ready_fixes)
+            except Exception as e:
+                apply_results = [{'success': False, 'message': str(e)}] * len(ready_fixes)
+            
+            new_lines = []
+            for fix, result in zip(ready_fixes, apply_results):
+                target = f"**{fix['action'].upper()}** `{fix['broken_url'][:50]}...` (Post ID {fix['post_id']})"
+                if result['success']:
+                    new_lines.append(f"✅ {target}: {result['message']}")
                 else:
-                    st.write(f"📄 Post ID: {post_id} (from CSV)")
-                
-                # Step 2: Apply fix
-                st.write(f"🔧 Applying: **{fix['action'].upper()}**")
-                st.write(f"   Target: `{fix['broken_url'][:50]}...`")
+                    failed_count += 1
+                    line = f"❌ {target}: {result['message']}"
+                    # Provide helpful context for "URL not found" errors
+                    if 'not found' in result['message'].lower():
+                        line += " — link may be in a widget, shortcode, custom field, or theme template"
+                    new_lines.append(line)
                 
-                try:
-                    if fix['action'] == 'remove':
-                        result = client.remove_link(post_id, fix['broken_url'], dry_run=False)
-                    else:
-                        result = client.replace_link(post_id, fix['broken_url'], fix['replacement_url'], dry_run=False)
-                    
-                    if result['success']:
-                        st.write(f"   ✅ {result['message']}")
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'broken_url': fix['broken_url'],
-                            'action': fix['action'],
-                            'status': 'success',
-                            'message': result['message']
-                        })
-                        status.update(label=f"✅ Success", state="complete")
-                    else:
-                        # Provide helpful context for "URL not found" errors
-                        if 'not found' in result['message'].lower():
-                            st.write(f"   ❌ {result['message']}")
-                            st.write(f"   💡 Common reasons: link may be in a widget, shortcode, custom field, or theme template")
-                        else:
-                            st.write(f"   ❌ {result['message']}")
-                        
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'broken_url': fix['broken_url'],
-                            'action': fix['action'],
-                            'status': 'failed',
-                            'message': result['message']
-                        })
-                        status.update(label=f"❌ Failed", state="error")
-                        
-                except Exception as e:
-                    st.write(f"   ❌ Error: {str(e)}")
-                    results.append({
-                        'source_url': fix['source_url'],
-                        'broken_url': fix['broken_url'],
-                        'action': fix['action'],
-                        'status': 'failed',
-                        'message': str(e)
-                    })
-                    status.update(label=f"❌ Error", state="error")
-            
-            # Small delay to be nice to the server
-            time.sleep(0.3)
+                results.append({
+                    'source_url': fix['source_url'],
+                    'broken_url': fix['broken_url'],
+                    'action': fix['action'],
+                    'status': 'success' if result['success'] else 'failed',
+                    'message': result['message']
+                })
+            log(*new_lines)
+        
+        progress_bar.progress(1.0)
+        if failed_count or skipped_for_retry:
+            status.update(label=f"⚠️ Done with {failed_count} failed, {len(skipped_for_retry)} skipped", state="error")
+        else:
+            status.update(label=f"✅ Applied {len(ready_fixes)} fixes", state="complete")
     
     # Store results
     st.session_state.wp_execute_results = results
     st.session_state.wp_was_test_run = is_test_run
     
     # Track execution
-    success = sum(1 for r in results if r['status'] == 'success')
-    skipped = sum(1 for r in results if r['status'] == 'skipped')
-    failed = sum(1 for r in results if r['status'] == 'failed')
+    status_counts = Counter(r['status'] for r in results)
+    success = status_counts['success']
+    skipped = status_counts['skipped']
+    failed = status_counts['failed']
     
     track_event("wordpress_apply", {
         "mode": "agent_test_run" if is_test_run else "agent",
@@ -3407,21 +3774,10 @@ def run_agent_fixes(approved: List, source_pages_to_fix: set, is_test_run: bool
         remaining_pages = total_pages - AGENT_MODE_LIMIT
         
         st.markdown("---")
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%); padding: 1.25rem; border-radius: 10px; border: 1px solid #6ee7b7;">
-            <div style="font-weight: 600; color: #065f46; font-size: 1.1rem; margin-bottom: 0.5rem;">✅ Test Run Successful!</div>
-            <div style="color: #047857; margin-bottom: 1rem;">
-                You've verified that Screaming Fixes works on your site. 
-                <strong>{remaining_pages} more pages</strong> are waiting to be fixed.
-            </div>
-            <div style="font-weight: 600; color: #065f46; margin-bottom: 0.5rem;">Next Steps:</div>
-            <div style="color: #047857;">
-                1. Set up <strong>Fast Mode</strong> in Screaming Frog (2 min setup)<br>
-                2. Re-crawl your site to capture Post IDs<br>
-                3. Re-upload your CSV — all {total_pages} pages will be ready to fix
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            _TEST_RUN_SUCCESS_BANNER.format(remaining_pages=remaining_pages, total_pages=total_pages),
+            unsafe_allow_html=True
+        )
         
         with st.expander("📋 Set up Fast Mode now", expanded=True):
             render_post_id_extraction_guide()
@@ -3468,12 +3824,19 @@ def apply_fixes_to_wordpress(dry_run: bool = True):
     with st.status(f"Running {mode}...", expanded=True) as status:
         results = []
         
+        # Resolve Post IDs and fetch post content up front
+        post_ids = resolve_post_ids(client, [fix['source_url'] for fix in export_data])
+        post_contents = {
+            post_id: content
+            for post_id, (_, content) in client.get_posts_content([pid for pid in post_ids.values() if pid]).items()
+        }
+        
         for i, fix in enumerate(export_data):
             st.write(f"Processing {i+1}/{len(export_data)}: `{fix['source_url'][:50]}...`")
             
             try:
                 # Find post ID from source URL
-                post_id = client.find_post_id_by_url(fix['source_url'])
+                post_id = post_ids[fix['source_url']]
                 if not post_id:
                     results.append({
                         'source_url': fix['source_url'],
@@ -3485,10 +3848,17 @@ def apply_fixes_to_wordpress(dry_run: bool = True):
                     continue
                 
                 # Apply fix (or preview)
+                content = post_contents.get(post_id)
                 if fix['action'] == 'remove':
-                    result = client.remove_link(post_id, fix['broken_url'], dry_run=dry_run)
+                    result = client.remove_link(post_id, fix['broken_url'], dry_run=dry_run, content=content)
                 else:
-                    result = client.replace_link(post_id, fix['broken_url'], fix['replacement_url'], dry_run=dry_run)
+                    result = client.replace_link(
+                        post_id, fix['broken_url'], fix['replacement_url'], dry_run=dry_run, content=content
+                    )
+                
+                # Later fixes on the same post build on this one's result
+                if result['success']:
+                    post_contents[post_id] = result['content']
                 
                 results.append({
                     'source_url': fix['source_url'],
@@ -3515,9 +3885,10 @@ def apply_fixes_to_wordpress(dry_run: bool = True):
             st.session_state.wp_preview_done = False  # Reset for next batch
         
         # Summary
-        success = sum(1 for r in results if r['status'] == 'success')
-        skipped = sum(1 for r in results if r['status'] == 'skipped')
-        failed = sum(1 for r in results if r['status'] == 'failed')
+        status_counts = Counter(r['status'] for r in results)
+        success = status_counts['success']
+        skipped = status_counts['skipped']
+        failed = status_counts['failed']
         
         # Track WordPress apply (counts only, no URLs)
         track_event("wordpress_apply", {
@@ -3534,6 +3905,40 @@ def apply_fixes_to_wordpress(dry_run: bool = True):
         )
 
 
+def _truncate_column(col: pd.Series, limit: int) -> pd.Series:
+    """Shorten a string column to limit characters, marking cut values with '...'"""
+    return col.where(col.str.len() <= limit, col.str.slice(0, limit) + '...')
+
+
+_WP_STATUS_ICONS = {'success': "✅", 'skipped': "⏭️"}  # Anything else is a failure (❌)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_wp_results_markdown(results: List[Dict]) -> str:
+    """Full-URL listing of WordPress apply results as one markdown document"""
+    blocks = []
+    for i, r in enumerate(results):
+        status_icon = _WP_STATUS_ICONS.get(r['status'], "❌")
+        blocks.append(
+            f"**{status_icon} Result {i+1}**\n\n"
+            f"```\nSource URL: {r['source_url']}\nBroken URL: {r['broken_url']}\n```\n\n"
+            f"Action: `{r['action'].upper()}` | Status: `{r['status'].upper()}` | {r['message']}"
+        )
+    return "\n\n---\n\n".join(blocks)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_wp_results_table(results: List[Dict]) -> pd.DataFrame:
+    """Display table for WordPress apply results (results are fixed once a run completes)"""
+    df = pd.DataFrame.from_records(results, columns=['source_url', 'broken_url', 'action', 'status', 'message'])
+    df['source_url'] = _truncate_column(df['source_url'], 50)
+    df['broken_url'] = _truncate_column(df['broken_url'], 40)
+    df['action'] = df['action'].str.upper()
+    df['status'] = df['status'].str.upper()
+    df.columns = ['Source URL', 'Broken URL', 'Action', 'Status', 'Message']
+    return df
+
+
 def render_wp_results(is_test_run: bool = False):
     """Render WordPress results table"""
     # Show execute results if available, else preview results
@@ -3553,42 +3958,26 @@ def render_wp_results(is_test_run: bool = False):
         st.markdown("### Execution Results")
     
     # Summary metrics
+    status_counts = Counter(r['status'] for r in results)
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total", len(results))
     with col2:
-        st.metric("✅ Success", sum(1 for r in results if r['status'] == 'success'))
+        st.metric("✅ Success", status_counts['success'])
     with col3:
-        st.metric("⏭️ Skipped", sum(1 for r in results if r['status'] == 'skipped'))
+        st.metric("⏭️ Skipped", status_counts['skipped'])
     with col4:
-        st.metric("❌ Failed", sum(1 for r in results if r['status'] == 'failed'))
+        st.metric("❌ Failed", status_counts['failed'])
     
     # Results table (shortened for readability)
-    df = pd.DataFrame([
-        {
-            'Source URL': r['source_url'][:50] + '...' if len(r['source_url']) > 50 else r['source_url'],
-            'Broken URL': r['broken_url'][:40] + '...' if len(r['broken_url']) > 40 else r['broken_url'],
-            'Action': r['action'].upper(),
-            'Status': r['status'].upper(),
-            'Message': r['message']
-        }
-        for r in results
-    ])
-    
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(build_wp_results_table(results), use_container_width=True)
     
     # Full URLs expander for copy/paste
     with st.expander("📋 View Full URLs (for copy/paste)"):
-        for i, r in enumerate(results):
-            status_icon = "✅" if r['status'] == 'success' else ("⏭️" if r['status'] == 'skipped' else "❌")
-            st.markdown(f"**{status_icon} Result {i+1}**")
-            st.code(f"Source URL: {r['source_url']}\nBroken URL: {r['broken_url']}", language=None)
-            st.markdown(f"Action: `{r['action'].upper()}` | Status: `{r['status'].upper()}` | {r['message']}")
-            if i < len(results) - 1:
-                st.markdown("---")
+        st.markdown(build_wp_results_markdown(results))
     
     # Download results
-    csv_output = pd.DataFrame(results).to_csv(index=False)
+    csv_output = build_wp_results_csv(results)
     mode = "preview" if is_preview else "executed"
     
     st.download_button(
@@ -3600,11 +3989,40 @@ def render_wp_results(is_test_run: bool = False):
     )
 
 
+def records_to_csv(records: List[Dict]) -> str:
+    """Write a list of same-shaped dicts to CSV text (header from the first record)"""
+    output = io.StringIO()
+    if records:
+        writer = csv.DictWriter(output, fieldnames=list(records[0].keys()))
+        writer.writeheader()
+        writer.writerows(records)
+    return output.getvalue()
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def records_to_json(records: List[Dict], indent: bool = True) -> bytes:
+    """Serialize export records to JSON bytes, indented or compact (once per set of records)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(records, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(records)
+    if indent:
+        return json.dumps(records, indent=2).encode('utf-8')
+    return json.dumps(records, separators=(',', ':')).encode('utf-8')
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def build_wp_results_csv(results: List[Dict]) -> bytes:
+    """CSV download bytes for WordPress apply results (built once per results set)"""
+    return records_to_csv(results).encode('utf-8')
+
+
 def create_export_data() -> List[Dict]:
     """Create export data from approved decisions"""
-    decisions = st.session_state.decisions
-    broken_urls = st.session_state.broken_urls
-    
+    return _build_export_data(st.session_state.decisions, st.session_state.broken_urls)
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False, hash_funcs={dict: _hash_session_dict})
+def _build_export_data(decisions: Dict, broken_urls: Dict) -> List[Dict]:
+    """Build export rows (cached on the content of the inputs)"""
     export = []
     
     for url, decision in decisions.items():
@@ -3628,9 +4046,12 @@ def create_export_data() -> List[Dict]:
 
 def create_rc_export_data() -> List[Dict]:
     """Create export data from approved redirect chain decisions"""
-    decisions = st.session_state.rc_decisions
-    redirects = st.session_state.rc_redirects
-    
+    return _build_rc_export_data(st.session_state.rc_decisions, st.session_state.rc_redirects)
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False, hash_funcs={dict: _hash_session_dict})
+def _build_rc_export_data(decisions: Dict, redirects: Dict) -> List[Dict]:
+    """Build redirect chain export rows (cached on the content of the inputs)"""
     export = []
     
     for key, decision in decisions.items():
@@ -3655,14 +4076,15 @@ def create_rc_export_data() -> List[Dict]:
 def render_task_switcher():
     """Render task type switcher dropdown"""
     # Count items in each task type
+    # Pending counts are kept up to date by set_approved_action/reset_pending_count
     broken_count = len(st.session_state.broken_urls) if st.session_state.broken_urls else 0
-    broken_pending = sum(1 for d in st.session_state.decisions.values() if not d.get('approved_action')) if st.session_state.decisions else 0
+    broken_pending = st.session_state.broken_pending_count
 
     rc_count = len(st.session_state.rc_redirects) if st.session_state.rc_redirects else 0
-    rc_pending = sum(1 for d in st.session_state.rc_decisions.values() if not d.get('approved_action')) if st.session_state.rc_decisions else 0
+    rc_pending = st.session_state.rc_pending_count
 
     iat_count = len(st.session_state.iat_images) if st.session_state.iat_images else 0
-    iat_pending = sum(1 for d in st.session_state.iat_decisions.values() if not d.get('approved_action')) if st.session_state.iat_decisions else 0
+    iat_pending = st.session_state.iat_pending_count
 
     # Backlink Reclaim counts
     br_count = len(st.session_state.br_grouped_pages) if st.session_state.br_grouped_pages else 0
@@ -3710,16 +4132,13 @@ def render_task_switcher():
 
 def render_rc_metrics():
     """Render summary metrics for redirect chains"""
-    redirects = st.session_state.rc_redirects
-    decisions = st.session_state.rc_decisions
-    sitewide = st.session_state.rc_sitewide
-    loops = st.session_state.rc_loops
+    rc_index = st.session_state.rc_index
     
-    total = len(redirects)
-    permanent = sum(1 for r in redirects.values() if not r['is_temp_redirect'])
-    temporary = total - permanent
-    approved = sum(1 for d in decisions.values() if d['approved_action'])
-    pending = total - approved
+    # Counts come straight from the type/state index
+    total = len(st.session_state.rc_redirects)
+    permanent = len(rc_index['301'])
+    temporary = len(rc_index['302'])
+    approved = len(rc_index['approved'])
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -3732,59 +4151,117 @@ def render_rc_metrics():
         st.metric("✅ Approved", approved)
 
 
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking cut values with '...' (as _truncate_column does)"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def _clip(text: str, limit: int = 60) -> str:
+    """Escape text for HTML, cut to limit characters with an ellipsis"""
+    return html.escape(_truncate(text, limit))
+
+
+# One sitewide-link / redirect-loop entry in the warnings section
+_SITEWIDE_ITEM_HTML = """
+<div style="background: #fef3c7; padding: 0.75rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #f59e0b;">
+    <div style="font-family: monospace; font-size: 0.85rem; color: #92400e; word-break: break-all;">
+        {address}<br>
+        → {final_address}
+    </div>
+    <div style="font-size: 0.8rem; color: #a16207; margin-top: 0.25rem;">
+        Position: {position} • Affects {count} pages
+    </div>
+</div>
+"""
+
+_LOOP_ITEM_HTML = """
+<div style="background: #fee2e2; padding: 0.75rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #ef4444;">
+    <div style="font-family: monospace; font-size: 0.85rem; color: #991b1b; word-break: break-all;">
+        {address}<br>
+        → {final_address} (LOOP)
+    </div>
+    <div style="font-size: 0.8rem; color: #b91c1c; margin-top: 0.25rem;">
+        Affects {count} pages
+    </div>
+</div>
+"""
+
+
+def _sitewide_items_html(sitewide: List[Dict]) -> str:
+    """HTML for the first 10 sitewide links, as one block"""
+    return ''.join(_SITEWIDE_ITEM_HTML.format(
+        address=_clip(item['address']),
+        final_address=_clip(item['final_address']),
+        position=html.escape(item['position']),
+        count=item['count'],
+    ) for item in sitewide[:10])
+
+
+def _loop_items_html(loops: List[Dict]) -> str:
+    """HTML for the first 10 redirect loops, as one block"""
+    return ''.join(_LOOP_ITEM_HTML.format(
+        address=_clip(item['address']),
+        final_address=_clip(item['final_address']),
+        count=item['count'],
+    ) for item in loops[:10])
+
+
+def _toggle_rc_warning(state_key: str):
+    """Open or close a warnings section (runs before the rerun, so no extra rerun is needed)"""
+    st.session_state[state_key] = not st.session_state[state_key]
+
+
 def render_rc_warnings():
     """Render sitewide links and loops warnings"""
     sitewide = st.session_state.rc_sitewide
     loops = st.session_state.rc_loops
     
+    # Toggle buttons instead of st.expander, so collapsed sections build nothing
     if sitewide:
-        with st.expander(f"⚠️ Sitewide Links Detected ({len(sitewide)}) — Manual Fix Required", expanded=False):
+        is_open = st.session_state.rc_sitewide_open
+        st.button(f"{'▾' if is_open else '▸'} ⚠️ Sitewide Links Detected ({len(sitewide)}) — Manual Fix Required",
+                  key="rc_sitewide_toggle", use_container_width=True,
+                  on_click=_toggle_rc_warning, args=('rc_sitewide_open',))
+        
+        if is_open:
             st.markdown("""
             These redirect chains appear in your **header, footer, or sidebar** across your entire site.
             They should be updated manually in your theme or widget settings — fixing them in one place fixes them everywhere.
             """)
-            
-            for item in sitewide[:10]:  # Show first 10
-                st.markdown(f"""
-                <div style="background: #fef3c7; padding: 0.75rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #f59e0b;">
-                    <div style="font-family: monospace; font-size: 0.85rem; color: #92400e; word-break: break-all;">
-                        {item['address'][:60]}{'...' if len(item['address']) > 60 else ''}<br>
-                        → {item['final_address'][:60]}{'...' if len(item['final_address']) > 60 else ''}
-                    </div>
-                    <div style="font-size: 0.8rem; color: #a16207; margin-top: 0.25rem;">
-                        Position: {item['position']} • Affects {item['count']} pages
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(_sitewide_items_html(sitewide), unsafe_allow_html=True)
             
             if len(sitewide) > 10:
                 st.info(f"...and {len(sitewide) - 10} more sitewide links")
     
     if loops:
-        with st.expander(f"🔄 Redirect Loops Detected ({len(loops)}) — Cannot Auto-Fix", expanded=False):
+        is_open = st.session_state.rc_loops_open
+        st.button(f"{'▾' if is_open else '▸'} 🔄 Redirect Loops Detected ({len(loops)}) — Cannot Auto-Fix",
+                  key="rc_loops_toggle", use_container_width=True,
+                  on_click=_toggle_rc_warning, args=('rc_loops_open',))
+        
+        if is_open:
             st.markdown("""
             These URLs create **infinite redirect loops**. This is typically a server configuration issue, not a content issue.
             
             💡 **Tip:** Check your `.htaccess` file or redirect plugin for conflicting rules. Contact your hosting provider if unsure.
             """)
-            
-            for item in loops[:10]:  # Show first 10
-                st.markdown(f"""
-                <div style="background: #fee2e2; padding: 0.75rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #ef4444;">
-                    <div style="font-family: monospace; font-size: 0.85rem; color: #991b1b; word-break: break-all;">
-                        {item['address'][:60]}{'...' if len(item['address']) > 60 else ''}<br>
-                        → {item['final_address'][:60]}{'...' if len(item['final_address']) > 60 else ''} (LOOP)
-                    </div>
-                    <div style="font-size: 0.8rem; color: #b91c1c; margin-top: 0.25rem;">
-                        Affects {item['count']} pages
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(_loop_items_html(loops), unsafe_allow_html=True)
             
             if len(loops) > 10:
                 st.info(f"...and {len(loops) - 10} more loops")
 
 
+# Page summary plus column headers above the redirect rows
+_RC_PAGE_HEADER_HTML = """
+<div style="font-weight: 600;">Showing {first}-{last} of {total} redirect chains</div>
+<div style="display: flex; background: linear-gradient(135deg, #f0fdfa 0%, #ccfbf1 100%); border: 1px solid #99f6e4; border-radius: 8px; padding: 0.5rem 0.75rem; margin: 0.5rem 0;">
+    <div style="flex: 8; font-size: 0.75rem; color: #0d9488; font-weight: 700; text-transform: uppercase; letter-spacing: 0.05em;">Redirect (From → To)</div>
+    <div style="flex: 1; font-size: 0.75rem; color: #0d9488; font-weight: 700; text-transform: uppercase; letter-spacing: 0.05em; text-align: center;">Approve</div>
+    <div style="flex: 0.8; font-size: 0.75rem; color: #0d9488; font-weight: 700; text-transform: uppercase; letter-spacing: 0.05em; text-align: center;">Edit</div>
+</div>
+"""
+
+
 def render_rc_spreadsheet():
     """Render the redirect chains spreadsheet view"""
     redirects = st.session_state.rc_redirects
@@ -3816,11 +4293,12 @@ def render_rc_spreadsheet():
     with filter_cols[3]:
         st.session_state.rc_show_approved = st.checkbox("Approved", value=True, key="rc_approved")
     
-    # Count pending URLs for bulk actions
-    pending_keys = [k for k, d in decisions.items() if not d['approved_action']]
-    pending_301 = [k for k in pending_keys if not redirects[k]['is_temp_redirect']]
-    pending_302 = [k for k in pending_keys if redirects[k]['is_temp_redirect']]
-    approved_count = sum(1 for d in decisions.values() if d['approved_action'])
+    # Pending URLs for bulk actions, from the type/state index
+    rc_index = st.session_state.rc_index
+    pending_keys = set(rc_index['pending'])  # Snapshot - bulk approval mutates the index
+    pending_302 = pending_keys & rc_index['302']
+    pending_301 = pending_keys - pending_302
+    approved_count = len(rc_index['approved'])
     
     # Action bar (like Broken Links)
     st.markdown("---")
@@ -3835,9 +4313,7 @@ def render_rc_spreadsheet():
                     st.rerun()
                 else:
                     # No 302s, approve directly
-                    for key in pending_keys:
-                        st.session_state.rc_decisions[key]['approved_action'] = 'replace'
-                        st.session_state.rc_decisions[key]['approved_fix'] = redirects[key]['final_address']
+                    set_approved_actions('rc_decisions', {key: redirects[key]['final_address'] for key in pending_keys}, 'replace')
                     st.toast(f"✅ Approved {len(pending_keys)} redirects", icon="✅")
                     st.rerun()
         else:
@@ -3865,9 +4341,7 @@ def render_rc_spreadsheet():
         warn_cols = st.columns([1, 1, 2])
         with warn_cols[0]:
             if st.button("✅ Yes, Approve All", type="primary", use_container_width=True):
-                for key in pending_keys:
-                    st.session_state.rc_decisions[key]['approved_action'] = 'replace'
-                    st.session_state.rc_decisions[key]['approved_fix'] = redirects[key]['final_address']
+                set_approved_actions('rc_decisions', {key: redirects[key]['final_address'] for key in pending_keys}, 'replace')
                 st.session_state.rc_show_approve_warning = False
                 st.toast(f"✅ Approved {len(pending_keys)} redirects", icon="✅")
                 st.rerun()
@@ -3876,51 +4350,59 @@ def render_rc_spreadsheet():
                 st.session_state.rc_show_approve_warning = False
                 st.rerun()
     
-    # Apply filters
-    filtered_keys = []
-    for key, info in redirects.items():
-        # Filter by redirect type
-        if info['is_temp_redirect'] and not st.session_state.rc_filter_302:
-            continue
-        if not info['is_temp_redirect'] and not st.session_state.rc_filter_301:
-            continue
-        
-        # Filter by approval status
-        has_approval = bool(decisions[key]['approved_action'])
-        if has_approval and not st.session_state.rc_show_approved:
-            continue
-        if not has_approval and not st.session_state.rc_show_pending:
-            continue
-        
-        filtered_keys.append(key)
+    show_301 = st.session_state.rc_filter_301
+    show_302 = st.session_state.rc_filter_302
+    show_pending = st.session_state.rc_show_pending
+    show_approved = st.session_state.rc_show_approved
+    
+    # Default view shows everything - no per-key predicate needed
+    show_all = show_301 and show_302 and show_pending and show_approved
+    
+    def matching_keys():
+        # Redirects are stored in impact order, so matches come out already sorted
+        if show_all:
+            return iter(redirects)
+        return (
+            key for key, info in redirects.items()
+            if (show_302 if info['is_temp_redirect'] else show_301)
+            and (show_approved if decisions[key]['approved_action'] else show_pending)
+        )
     
-    if not filtered_keys:
+    # The match count is cached until the filters or a decision change
+    sig = (
+        show_301,
+        show_302,
+        show_pending,
+        show_approved,
+        len(redirects),
+        len(decisions),
+        st.session_state.rc_decisions_version,
+    )
+    if show_all:
+        st.session_state.rc_filtered_total = len(redirects)
+        st.session_state.rc_filtered_total_sig = sig
+    elif sig != st.session_state.rc_filtered_total_sig:
+        type_keys = (rc_index['301'] if show_301 else set()) | (rc_index['302'] if show_302 else set())
+        state_keys = (rc_index['pending'] if show_pending else set()) | (rc_index['approved'] if show_approved else set())
+        st.session_state.rc_filtered_total = len(type_keys & state_keys)
+        st.session_state.rc_filtered_total_sig = sig
+    total = st.session_state.rc_filtered_total
+    
+    if not total:
         st.info("No redirects match your filters")
         return
     
-    # Sort by impact (most pages affected first)
-    filtered_keys.sort(key=lambda k: redirects[k]['count'], reverse=True)
-    
-    # Pagination
-    total = len(filtered_keys)
+    # Pagination - only the current page's keys are collected
     per_page = 10
     total_pages = max(1, (total + per_page - 1) // per_page)
     page = min(st.session_state.rc_page, total_pages - 1)
     
     start = page * per_page
     end = min(start + per_page, total)
-    page_keys = filtered_keys[start:end]
-    
-    st.markdown(f"**Showing {start+1}-{end} of {total} redirect chains**")
+    page_keys = list(islice(matching_keys(), start, end))
     
-    # Column headers - matching Broken Links style
-    st.markdown("""
-    <div style="display: flex; background: linear-gradient(135deg, #f0fdfa 0%, #ccfbf1 100%); border: 1px solid #99f6e4; border-radius: 8px; padding: 0.5rem 0.75rem; margin: 0.5rem 0;">
-        <div style="flex: 8; font-size: 0.75rem; color: #0d9488; font-weight: 700; text-transform: uppercase; letter-spacing: 0.05em;">Redirect (From → To)</div>
-        <div style="flex: 1; font-size: 0.75rem; color: #0d9488; font-weight: 700; text-transform: uppercase; letter-spacing: 0.05em; text-align: center;">Approve</div>
-        <div style="flex: 0.8; font-size: 0.75rem; color: #0d9488; font-weight: 700; text-transform: uppercase; letter-spacing: 0.05em; text-align: center;">Edit</div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Page summary and column headers in one element - matching Broken Links style
+    st.markdown(_RC_PAGE_HEADER_HTML.format(first=start + 1, last=end, total=total), unsafe_allow_html=True)
     
     # Render each redirect
     for key in page_keys:
@@ -3941,130 +4423,141 @@ def render_rc_spreadsheet():
                 st.rerun()
 
 
+# Row button callbacks run before the click's own rerun, so no second st.rerun() is needed
+
+def _approve_rc_redirect(key: str, close_editor: bool = False):
+    """Approve a redirect's final address as its fix"""
+    set_approved_action(
+        'rc_decisions', st.session_state.rc_decisions[key], 'replace',
+        st.session_state.rc_redirects[key]['final_address'], key=key
+    )
+    if close_editor:
+        st.session_state.rc_editing_url = None
+    st.toast("✅ Approved!", icon="✅")
+
+
+def _reset_rc_redirect(key: str):
+    """Return a redirect to pending"""
+    set_approved_action('rc_decisions', st.session_state.rc_decisions[key], '', key=key)
+    st.session_state.rc_editing_url = None
+    st.toast("↩️ Reset", icon="↩️")
+
+
+def _set_rc_editing(key: Optional[str]):
+    """Open a redirect's review panel (or close it with None)"""
+    st.session_state.rc_editing_url = key
+
+
+def _toggle_rc_sources(key: str):
+    """Show or hide a redirect's affected-pages list"""
+    st.session_state.rc_sources_open[key] = not st.session_state.rc_sources_open.get(key, False)
+
+
+# 301/302 type badge, keyed by is_temp_redirect
+_RC_TYPE_BADGES = {
+    False: "<span style='background: #d1fae5; color: #059669; padding: 2px 6px; border-radius: 4px; font-size: 0.7rem; margin-left: 0.5rem;'>301</span>",
+    True: "<span style='background: #fef3c7; color: #b45309; padding: 2px 6px; border-radius: 4px; font-size: 0.7rem; margin-left: 0.5rem;'>302</span>",
+}
+_RC_PAGE_COUNT_HTML = "<span style='color: #94a3b8; font-size: 0.75rem; margin-left: 0.5rem;'>({count} pages)</span>"
+
+# Stacked FROM/TO markup for a redirect review row
+_RC_ROW_HTML = """
+<div style="margin-bottom: 0.25rem;">
+    <span style="color: #64748b; font-size: 0.75rem; margin-right: 0.5rem;">FROM:</span>
+    <a href='{old_href}' target='_blank' style='color: #dc2626; text-decoration: {old_decoration}; font-size: 0.85rem; word-break: break-all;' title='Click to open'>{old_text}</a>
+    {badge}{page_info}
+</div>
+<div>
+    <span style="color: #64748b; font-size: 0.75rem; margin-right: 0.5rem;">TO:</span>
+    <a href='{new_href}' target='_blank' style='color: #059669; text-decoration: none; font-size: 0.85rem; word-break: break-all;' title='Click to open'>{new_text}</a>
+</div>
+"""
+
+
 def render_rc_row(key: str, info: Dict, decision: Dict):
     """Render a single redirect chain row - stacked layout with full URLs"""
-    import html
-    
     is_editing = st.session_state.rc_editing_url == key
     is_approved = bool(decision['approved_action'])
     
-    # Full URLs for display (strip protocol for cleaner look)
-    old_url_display = info['address'].replace('https://', '').replace('http://', '').replace('www.', '')
-    new_url_display = info['final_address'].replace('https://', '').replace('http://', '').replace('www.', '')
-    
-    old_url_escaped = html.escape(info['address'])
-    new_url_escaped = html.escape(info['final_address'])
-    old_url_display_escaped = html.escape(old_url_display)
-    new_url_display_escaped = html.escape(new_url_display)
-    
-    # Type badge HTML (301/302)
-    badge_color = "#fef3c7" if info['is_temp_redirect'] else "#d1fae5"
-    badge_text_color = "#b45309" if info['is_temp_redirect'] else "#059669"
-    badge_text = "302" if info['is_temp_redirect'] else "301"
-    type_badge = f"<span style='background: {badge_color}; color: {badge_text_color}; padding: 2px 6px; border-radius: 4px; font-size: 0.7rem; margin-left: 0.5rem;'>{badge_text}</span>"
+    # Full URLs for display, precomputed at upload
+    old_url_escaped = info['address_escaped']
+    new_url_escaped = info['final_address_escaped']
+    old_url_display_escaped = info['address_display_escaped']
+    new_url_display_escaped = info['final_address_display_escaped']
+    
+    # Build stacked row with APPROVE column (columns only, no extra container)
+    cols = st.columns([8, 1, 0.8])
+    
+    with cols[0]:
+        # Stacked URLs with badge inline on FROM line; approved rows strike the old URL
+        st.markdown(_RC_ROW_HTML.format(
+            old_href=old_url_escaped,
+            old_text=old_url_display_escaped,
+            old_decoration='line-through' if is_approved else 'none',
+            badge=_RC_TYPE_BADGES[bool(info['is_temp_redirect'])],
+            page_info='' if is_approved else _RC_PAGE_COUNT_HTML.format(count=info['count']),
+            new_href=new_url_escaped,
+            new_text=new_url_display_escaped,
+        ), unsafe_allow_html=True)
+    
+    with cols[1]:
+        # APPROVE column - checkbox style (like Broken Links)
+        if is_approved:
+            st.markdown("<span style='color: #22c55e; font-size: 1.2rem;'>✓</span>", unsafe_allow_html=True)
+        else:
+            # Clickable checkbox to approve directly
+            st.button("☐", key=f"rc_quick_approve_{key}", help="Approve redirect",
+                      on_click=_approve_rc_redirect, args=(key,))
     
-    # Page count
-    page_info = f"<span style='color: #94a3b8; font-size: 0.75rem; margin-left: 0.5rem;'>({info['count']} pages)</span>"
+    with cols[2]:
+        # Edit button
+        if is_editing:
+            st.button("✕", key=f"rc_close_{key}", help="Close", on_click=_set_rc_editing, args=(None,))
+        else:
+            st.button("📝", key=f"rc_edit_{key}", help="Review details", on_click=_set_rc_editing, args=(key,))
     
-    # Build stacked row with APPROVE column
-    with st.container():
-        cols = st.columns([8, 1, 0.8])
-        
-        with cols[0]:
-            # Stacked URLs with badge inline on FROM line
-            if is_approved:
-                st.markdown(f"""
-                <div style="margin-bottom: 0.25rem;">
-                    <span style="color: #64748b; font-size: 0.75rem; margin-right: 0.5rem;">FROM:</span>
-                    <a href='{old_url_escaped}' target='_blank' style='color: #dc2626; text-decoration: line-through; font-size: 0.85rem; word-break: break-all;' title='Click to open'>{old_url_display_escaped}</a>
-                    {type_badge}
-                </div>
-                <div>
-                    <span style="color: #64748b; font-size: 0.75rem; margin-right: 0.5rem;">TO:</span>
-                    <a href='{new_url_escaped}' target='_blank' style='color: #059669; text-decoration: none; font-size: 0.85rem; word-break: break-all;' title='Click to open'>{new_url_display_escaped}</a>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="margin-bottom: 0.25rem;">
-                    <span style="color: #64748b; font-size: 0.75rem; margin-right: 0.5rem;">FROM:</span>
-                    <a href='{old_url_escaped}' target='_blank' style='color: #dc2626; text-decoration: none; font-size: 0.85rem; word-break: break-all;' title='Click to open'>{old_url_display_escaped}</a>
-                    {type_badge}{page_info}
-                </div>
-                <div>
-                    <span style="color: #64748b; font-size: 0.75rem; margin-right: 0.5rem;">TO:</span>
-                    <a href='{new_url_escaped}' target='_blank' style='color: #059669; text-decoration: none; font-size: 0.85rem; word-break: break-all;' title='Click to open'>{new_url_display_escaped}</a>
-                </div>
-                """, unsafe_allow_html=True)
+    # Compact inline edit section
+    if is_editing:
+        st.markdown("---")
         
-        with cols[1]:
-            # APPROVE column - checkbox style (like Broken Links)
+        # Show warning for temp redirects
+        if info['is_temp_redirect']:
+            st.warning("⚠️ **302 Temporary** redirect - destination may revert. Only approve if confident it's stable.")
+        
+        # Affected pages behind a toggle - the list is only built when it is open
+        sources_open = st.session_state.rc_sources_open.get(key, False)
+        st.button(f"{'▾' if sources_open else '▸'} 📄 {len(info['sources'])} affected pages",
+                  key=f"rc_sources_{key}", on_click=_toggle_rc_sources, args=(key,))
+        if sources_open:
+            st.markdown('<ul>' + ''.join(
+                f"<li><code>{html.escape(source.replace('https://', '').replace('http://', '')[:70])}</code></li>"
+                for source in info['sources'][:10]
+            ) + '</ul>', unsafe_allow_html=True)
+            if len(info['sources']) > 10:
+                st.caption(f"...and {len(info['sources']) - 10} more")
+        
+        # Action buttons - compact row
+        btn_cols = st.columns([1, 1, 2])
+        with btn_cols[0]:
+            if not is_approved:
+                st.button("✅ Approve", key=f"rc_approve_{key}", type="primary", use_container_width=True,
+                          on_click=_approve_rc_redirect, args=(key, True))
+        
+        with btn_cols[1]:
             if is_approved:
-                st.markdown("<span style='color: #22c55e; font-size: 1.2rem;'>✓</span>", unsafe_allow_html=True)
-            else:
-                # Clickable checkbox to approve directly
-                if st.button("☐", key=f"rc_quick_approve_{key}", help="Approve redirect"):
-                    st.session_state.rc_decisions[key]['approved_action'] = 'replace'
-                    st.session_state.rc_decisions[key]['approved_fix'] = info['final_address']
-                    st.toast("✅ Approved!", icon="✅")
-                    st.rerun()
+                st.button("↩️ Reset", key=f"rc_reset_{key}", use_container_width=True,
+                          on_click=_reset_rc_redirect, args=(key,))
         
-        with cols[2]:
-            # Edit button
-            if is_editing:
-                if st.button("✕", key=f"rc_close_{key}", help="Close"):
-                    st.session_state.rc_editing_url = None
-                    st.rerun()
-            else:
-                if st.button("📝", key=f"rc_edit_{key}", help="Review details"):
-                    st.session_state.rc_editing_url = key
-                    st.rerun()
-        
-        # Compact inline edit section
-        if is_editing:
-            st.markdown("---")
-            
-            # Show warning for temp redirects
-            if info['is_temp_redirect']:
-                st.warning("⚠️ **302 Temporary** redirect - destination may revert. Only approve if confident it's stable.")
-            
-            # Affected pages in compact expander
-            with st.expander(f"📄 {len(info['sources'])} affected pages", expanded=False):
-                for source in info['sources'][:10]:
-                    short_source = source.replace('https://', '').replace('http://', '')[:70]
-                    st.markdown(f"- `{short_source}`")
-                if len(info['sources']) > 10:
-                    st.caption(f"...and {len(info['sources']) - 10} more")
-            
-            # Action buttons - compact row
-            btn_cols = st.columns([1, 1, 2])
-            with btn_cols[0]:
-                if not is_approved:
-                    if st.button("✅ Approve", key=f"rc_approve_{key}", type="primary", use_container_width=True):
-                        st.session_state.rc_decisions[key]['approved_action'] = 'replace'
-                        st.session_state.rc_decisions[key]['approved_fix'] = info['final_address']
-                        st.session_state.rc_editing_url = None
-                        st.toast("✅ Approved!", icon="✅")
-                        st.rerun()
-            
-            with btn_cols[1]:
-                if is_approved:
-                    if st.button("↩️ Reset", key=f"rc_reset_{key}", use_container_width=True):
-                        st.session_state.rc_decisions[key]['approved_action'] = ''
-                        st.session_state.rc_decisions[key]['approved_fix'] = ''
-                        st.session_state.rc_editing_url = None
-                        st.toast("↩️ Reset", icon="↩️")
-                        st.rerun()
-            
-            st.markdown("---")
+        st.markdown("---")
 
 
 def render_rc_export_section():
     """Render export section for redirect chains"""
     decisions = st.session_state.rc_decisions
-    redirects = st.session_state.rc_redirects
     
-    approved = [(k, d) for k, d in decisions.items() if d['approved_action']]
+    # Approved keys come from the type/state index; walk redirects to keep their impact order
+    approved_keys = st.session_state.rc_index['approved']
+    approved = [(k, decisions[k]) for k in st.session_state.rc_redirects if k in approved_keys]
     has_approved = len(approved) > 0
     
     st.markdown('<p class="section-header">Export & Apply</p>', unsafe_allow_html=True)
@@ -4072,7 +4565,7 @@ def render_rc_export_section():
     # Status message based on approved count
     if has_approved:
         # Count total pages affected
-        total_pages = sum(len(redirects[k]['sources']) for k, d in approved)
+        total_pages = sum(st.session_state.rc_source_pages_to_fix.values())
         st.markdown(f"✅ **{len(approved)} redirects approved** affecting {total_pages} pages")
     else:
         st.markdown("No redirects approved yet. Approve fixes above to enable export.")
@@ -4090,7 +4583,7 @@ def render_rc_export_section():
                 "total_fixes": len(export_data),
             })
             
-            csv_data = pd.DataFrame(export_data).to_csv(index=False)
+            csv_data = records_to_csv(export_data)
             st.download_button(
                 "Download CSV",
                 data=csv_data,
@@ -4110,7 +4603,7 @@ def render_rc_export_section():
                 "total_fixes": len(export_data),
             })
             
-            json_data = json.dumps(export_data, indent=2)
+            json_data = records_to_json(export_data)
             st.download_button(
                 "Download JSON",
                 data=json_data,
@@ -4131,11 +4624,8 @@ def render_rc_export_section():
         st.info("Approve some redirects above first")
         return
     
-    # Count how many source pages need fixes
-    source_pages_to_fix = set()
-    for key, decision in approved:
-        for source in redirects[key]['sources']:
-            source_pages_to_fix.add(source)
+    # Source pages that need fixes, maintained as redirects are approved/reset
+    source_pages_to_fix = st.session_state.rc_source_pages_to_fix.keys()
     
     pages_to_fix = len(source_pages_to_fix)
     selected_mode = st.session_state.get('selected_mode', 'quick_start')
@@ -4146,7 +4636,7 @@ def render_rc_export_section():
         if not st.session_state.post_id_check_done:
             st.markdown("Before applying, let's verify your site supports automatic Post ID discovery.")
             if st.button("🔍 Run Compatibility Check", use_container_width=True, key="rc_check"):
-                run_post_id_sample_check(list(source_pages_to_fix)[:3])
+                run_post_id_sample_check(list(islice(source_pages_to_fix, 3)))
         else:
             if st.session_state.post_id_check_passed:
                 st.success("✅ Compatibility check passed!")
@@ -4164,122 +4654,145 @@ def run_rc_agent_fixes(approved: List, source_pages_to_fix: set):
     client = st.session_state.wp_client
     redirects = st.session_state.rc_redirects
     
-    # Build list of all fixes to apply
+    # Build list of all fixes to apply, one per (source, old, new) triple
     fixes_to_apply = []
+    seen = set()
     for key, decision in approved:
         info = redirects[key]
         for source in info['sources']:
-            if source in source_pages_to_fix:
+            triple = (source, info['address'], info['final_address'])
+            if source in source_pages_to_fix and triple not in seen:
+                seen.add(triple)
                 fixes_to_apply.append({
                     'source_url': source,
                     'old_url': info['address'],
                     'new_url': info['final_address'],
-                    'post_id': st.session_state.post_id_cache.get(source)
                 })
     
-    total_fixes = len(fixes_to_apply)
+    # Post IDs for every source page, resolved concurrently up front.
+    # Archive/category pages have no Post ID, so they never hit the API.
+    post_ids = resolve_post_ids(
+        client, [fix['source_url'] for fix in fixes_to_apply if not _ARCHIVE_RE.search(fix['source_url'])]
+    )
+    
+    # One content rewrite per post covers all of its redirects
+    fixes_by_post = defaultdict(list)
+    unresolved_by_source = defaultdict(list)
+    for fix in fixes_to_apply:
+        post_id = post_ids.get(fix['source_url'])
+        if post_id:
+            fixes_by_post[post_id].append(fix)
+        else:
+            unresolved_by_source[fix['source_url']].append(fix)
+    
+    total_pages = len(fixes_by_post) + len(unresolved_by_source)
     results = []
     
+    def record(fix, status, message):
+        results.append({
+            'source_url': fix['source_url'],
+            'old_url': fix['old_url'],
+            'new_url': fix['new_url'],
+            'status': status,
+            'message': message
+        })
+    
+    def fix_count_label(fixes):
+        return f"{len(fixes)} fix{'es' if len(fixes) != 1 else ''}"
+    
     st.markdown("### 🔄 Applying Redirect Fixes")
     
     progress_bar = st.progress(0)
     status_container = st.container()
     
+    # Post content fetched in bulk, so each rewrite only needs its write
+    post_contents = {post_id: content for post_id, (_, content) in client.get_posts_content(list(fixes_by_post)).items()}
+    done = 0
+    
     with status_container:
-        for i, fix in enumerate(fixes_to_apply):
-            progress_bar.progress((i + 1) / total_fixes)
+        # Pages without a Post ID are reported first
+        for source_url, fixes in unresolved_by_source.items():
+            done += 1
+            progress_bar.progress(done / total_pages)
             
-            with st.status(f"Fix {i+1} of {total_fixes}", expanded=True) as status:
-                # Step 1: Get Post ID
-                post_id = fix['post_id']
+            with st.status(f"Page {done} of {total_pages} ({fix_count_label(fixes)})", expanded=True) as status:
+                st.write(f"🔍 Post ID for: `{source_url[:50]}...`")
                 
-                if not post_id:
-                    st.write(f"🔍 Finding Post ID for: `{fix['source_url'][:50]}...`")
-                    post_id = client.find_post_id_by_url(fix['source_url'])
-                    
-                    if post_id:
-                        st.write(f"   ✅ Found Post ID: {post_id}")
-                        st.session_state.post_id_cache[fix['source_url']] = post_id
-                    else:
-                        # Check if it's a category/archive/tag page
-                        source_lower = fix['source_url'].lower()
-                        is_archive = any(x in source_lower for x in ['/category/', '/tag/', '/author/', '/page/', '/archive/'])
-                        
-                        if is_archive:
-                            st.write(f"   ℹ️ This is an archive/category page (dynamically generated)")
-                            st.write(f"   💡 Fix the links on individual posts — archive pages will update automatically")
-                            msg = 'Archive/category page - fix individual posts instead'
-                        else:
-                            st.write(f"   ❌ Post ID not found — skipping")
-                            msg = 'Post ID not found'
-                        
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'old_url': fix['old_url'],
-                            'new_url': fix['new_url'],
-                            'status': 'skipped',
-                            'message': msg
-                        })
-                        status.update(label=f"⏭️ Skipped", state="error")
-                        continue
+                # Category/archive/tag pages were never looked up
+                if _ARCHIVE_RE.search(source_url):
+                    st.write(f"   ℹ️ This is an archive/category page (dynamically generated)")
+                    st.write(f"   💡 Fix the links on individual posts — archive pages will update automatically")
+                    msg = 'Archive/category page - fix individual posts instead'
                 else:
-                    st.write(f"📄 Post ID: {post_id}")
+                    st.write(f"   ❌ Post ID not found — skipping")
+                    msg = 'Post ID not found'
                 
-                # Step 2: Apply fix (replace old URL with new URL)
-                st.write(f"🔧 Replacing URL...")
-                st.write(f"   Old: `{fix['old_url'][:40]}...`")
-                st.write(f"   New: `{fix['new_url'][:40]}...`")
+                for fix in fixes:
+                    record(fix, 'skipped', msg)
+                status.update(label=f"⏭️ Skipped", state="error")
+        
+        # Rewrites are I/O-bound, so they run in parallel; results are shown as each post finishes
+        # Source URLs that resolve to the same post share its pairs, so each pair is sent once
+        pairs_by_post = {
+            post_id: list(dict.fromkeys((fix['old_url'], fix['new_url']) for fix in fixes))
+            for post_id, fixes in fixes_by_post.items()
+        }
+        with concurrent.futures.ThreadPoolExecutor(max_workers=WP_APPLY_WORKERS) as pool:
+            futures = {
+                pool.submit(client.replace_many, post_id, pairs, False, post_contents.get(post_id)): post_id
+                for post_id, pairs in pairs_by_post.items()
+            }
+            
+            for future in concurrent.futures.as_completed(futures):
+                post_id = futures[future]
+                fixes = fixes_by_post[post_id]
+                done += 1
+                progress_bar.progress(done / total_pages)
                 
-                try:
-                    result = client.replace_link(post_id, fix['old_url'], fix['new_url'], dry_run=False)
+                with st.status(f"Page {done} of {total_pages} ({fix_count_label(fixes)})", expanded=True) as status:
+                    st.write(f"📄 Post ID: {post_id} — `{fixes[0]['source_url'][:50]}...`")
+                    st.write(f"🔧 Replacing {len(fixes)} URL(s)...")
                     
-                    if result['success']:
-                        st.write(f"   ✅ {result['message']}")
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'old_url': fix['old_url'],
-                            'new_url': fix['new_url'],
-                            'status': 'success',
-                            'message': result['message']
-                        })
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        st.write(f"   ❌ Error: {str(e)}")
+                        for fix in fixes:
+                            record(fix, 'failed', str(e))
+                        status.update(label=f"❌ Error", state="error")
+                        continue
+                    
+                    counts = dict(zip(pairs_by_post[post_id], result['replacements']))
+                    for fix in fixes:
+                        count = counts[(fix['old_url'], fix['new_url'])]
+                        st.write(f"   Old: `{fix['old_url'][:40]}...`")
+                        st.write(f"   New: `{fix['new_url'][:40]}...`")
+                        if count:
+                            st.write(f"   ✅ Replaced {count} occurrence(s)")
+                            record(fix, 'success', f"Replaced {count} occurrence(s)")
+                        else:
+                            message = 'URL not found in content' if result['success'] or 'not found' in result['message'].lower() else result['message']
+                            st.write(f"   ❌ {message}")
+                            if 'not found' in message.lower():
+                                # Provide helpful context for "URL not found" errors
+                                st.write(f"   💡 Common reasons: link may be in a widget, shortcode, custom field, or theme template")
+                            record(fix, 'failed', message)
+                    
+                    if result['success'] and all(result['replacements']):
                         status.update(label=f"✅ Success", state="complete")
+                    elif result['success']:
+                        status.update(label=f"⚠️ Partially applied", state="error")
                     else:
-                        # Provide helpful context for "URL not found" errors
-                        if 'not found' in result['message'].lower():
-                            st.write(f"   ❌ {result['message']}")
-                            st.write(f"   💡 Common reasons: link may be in a widget, shortcode, custom field, or theme template")
-                        else:
-                            st.write(f"   ❌ {result['message']}")
-                        
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'old_url': fix['old_url'],
-                            'new_url': fix['new_url'],
-                            'status': 'failed',
-                            'message': result['message']
-                        })
                         status.update(label=f"❌ Failed", state="error")
-                        
-                except Exception as e:
-                    st.write(f"   ❌ Error: {str(e)}")
-                    results.append({
-                        'source_url': fix['source_url'],
-                        'old_url': fix['old_url'],
-                        'new_url': fix['new_url'],
-                        'status': 'failed',
-                        'message': str(e)
-                    })
-                    status.update(label=f"❌ Error", state="error")
-            
-            time.sleep(0.3)
     
     # Store results
     st.session_state.wp_execute_results = results
     
     # Summary
-    success = sum(1 for r in results if r['status'] == 'success')
-    skipped = sum(1 for r in results if r['status'] == 'skipped')
-    failed = sum(1 for r in results if r['status'] == 'failed')
+    status_counts = Counter(r['status'] for r in results)
+    success = status_counts['success']
+    skipped = status_counts['skipped']
+    failed = status_counts['failed']
     
     track_event("wordpress_apply", {
         "type": "redirect_chains",
@@ -4308,16 +4821,18 @@ def run_rc_agent_fixes(approved: List, source_pages_to_fix: set):
 def render_iat_metrics():
     """Render summary metrics for image alt text"""
     images = st.session_state.iat_images
-    decisions = st.session_state.iat_decisions
     excluded = st.session_state.iat_excluded_count
     
     total = len(images)
-    approved = sum(1 for d in decisions.values() if d['approved_action'])
-    pending = total - approved
+    pending = st.session_state.iat_pending_count
     
-    # Count by alt status
-    missing = sum(1 for img in images.values() if img['alt_status'] == 'missing')
-    filename = sum(1 for img in images.values() if img['alt_status'] == 'filename')
+    # Count by alt status, recounted only when the images reload
+    sig = (total, st.session_state.iat_decisions_version)
+    if sig != st.session_state.iat_alt_counts_sig:
+        st.session_state.iat_alt_counts = Counter(img['alt_status'] for img in images.values())
+        st.session_state.iat_alt_counts_sig = sig
+    missing = st.session_state.iat_alt_counts['missing']
+    filename = st.session_state.iat_alt_counts['filename']
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -4334,8 +4849,13 @@ def render_iat_metrics():
         st.caption(f"ℹ️ {excluded} images were filtered out (logos, icons, non-content pages, or already have good alt text)")
 
 
+@st.fragment
 def render_iat_spreadsheet():
-    """Render the image alt text spreadsheet view"""
+    """
+    Render the image alt text spreadsheet view.
+    Runs as a fragment: paging and opening/closing the editor rerun only this view;
+    saving a decision reruns the app so the metrics and export section update.
+    """
     images = st.session_state.iat_images
     decisions = st.session_state.iat_decisions
     
@@ -4352,17 +4872,15 @@ def render_iat_spreadsheet():
         show_approved = st.checkbox("Show Approved", value=st.session_state.iat_show_approved, key="iat_filter_approved")
         st.session_state.iat_show_approved = show_approved
     
-    # Filter images
-    filtered_keys = []
-    for key in images:
-        has_approval = bool(decisions[key]['approved_action'])
-        if has_approval and show_approved:
-            filtered_keys.append(key)
-        elif not has_approval and show_pending:
-            filtered_keys.append(key)
-    
-    # Sort by impact (pages affected)
-    filtered_keys.sort(key=lambda k: images[k]['count'], reverse=True)
+    # Filtered keys are cached until the filters or a decision change; images are
+    # already in impact order from upload, so paging only slices this list
+    sig = (show_pending, show_approved, len(images), st.session_state.iat_decisions_version)
+    if sig != st.session_state.iat_filtered_sig:
+        st.session_state.iat_filtered_keys = [
+            key for key in images if (show_approved if decisions[key]['approved_action'] else show_pending)
+        ]
+        st.session_state.iat_filtered_sig = sig
+    filtered_keys = st.session_state.iat_filtered_keys
     
     # Pagination
     page = st.session_state.iat_page
@@ -4379,9 +4897,10 @@ def render_iat_spreadsheet():
     
     st.markdown(f"**Showing {start_idx + 1}-{end_idx} of {len(filtered_keys)} images**")
     
-    # Render each image row
+    # Render each image row (any decision made <=> fewer pending than total)
+    any_approved = st.session_state.iat_pending_count < len(decisions)
     for i, key in enumerate(page_keys):
-        is_first_row = (i == 0 and page == 0 and not any(d['approved_action'] for d in decisions.values()))
+        is_first_row = (i == 0 and page == 0 and not any_approved)
         render_iat_row(key, images[key], decisions[key], is_first_row)
     
     # Pagination controls
@@ -4390,64 +4909,103 @@ def render_iat_spreadsheet():
         with pcol1:
             if st.button("← Previous", disabled=page == 0, key="iat_prev"):
                 st.session_state.iat_page = page - 1
-                st.rerun()
+                st.rerun(scope="fragment")
         with pcol2:
             st.markdown(f"<div style='text-align:center; padding-top: 0.5rem;'>Page {page+1} of {total_pages}</div>", unsafe_allow_html=True)
         with pcol3:
             if st.button("Next →", disabled=page >= total_pages - 1, key="iat_next"):
                 st.session_state.iat_page = page + 1
-                st.rerun()
+                st.rerun(scope="fragment")
+
+
+def _is_remote_image(img_url: str) -> bool:
+    """
+    Whether st.image can show this image. Streamlit passes http(s) URLs to the
+    browser as-is (no server-side fetch or decode); other strings are opened as local files.
+    """
+    return img_url.startswith(('http://', 'https://'))
+
+
+# Approval status badge, keyed by approved_action (anything else is pending)
+_IAT_STATUS_PENDING_HTML = "<span style='color: #b45309; font-weight: 500;'>⏳ Pending</span>"
+_IAT_STATUS_HTML = {
+    'ignore': "<span style='color: #64748b; font-weight: 500;'>⏭️ Ignored</span>",
+    'replace': "<span style='color: #059669; font-weight: 500;'>✅ Fixed</span>",
+}
+
+# Row thumbnail; broken images fall back to the alt text
+_IAT_THUMBNAIL_HTML = (
+    '<img src="{src}" width="60" loading="lazy" decoding="async" alt="No preview" '
+    'style="object-fit: cover; border-radius: 4px; font-size: 0.75rem; color: #94a3b8;">'
+)
+_IAT_NO_THUMBNAIL_HTML = "<span style='color: #94a3b8; font-size: 0.75rem;'>No preview</span>"
+
+# Static cells of an alt text review row (thumbnail, filename + page count, status) as one table row
+_IAT_ROW_HTML = """
+<table style="width: 100%; border: none; border-collapse: collapse; margin: 0;">
+<tr style="border: none;">
+    <td style="width: 20%; border: none; padding: 0 0.5rem 0 0; vertical-align: middle;">{thumbnail}</td>
+    <td style="width: 60%; border: none; padding: 0 0.5rem; vertical-align: middle; word-break: break-all;">
+        <strong>{filename}</strong><br>
+        <span style="color: #94a3b8; font-size: 0.85rem;">Affects {count} page(s)</span>
+    </td>
+    <td style="width: 20%; border: none; padding: 0 0.5rem; vertical-align: middle;">{status}</td>
+</tr>
+</table>
+"""
+
+# One-line summary for rows that already have a decision (no thumbnail)
+_IAT_DECIDED_ROW_HTML = (
+    "<div style='padding: 0.25rem 0; font-size: 0.85rem; word-break: break-all;'>"
+    "{status} <strong style='margin-left: 0.5rem;'>{filename}</strong>"
+    "<span style='color: #94a3b8; font-size: 0.75rem; margin-left: 0.5rem;'>({count} pages)</span></div>"
+)
 
 
 def render_iat_row(img_url: str, info: Dict, decision: Dict, is_first_row: bool = False):
     """Render a single image alt text row - simplified view"""
-    import html
-    from urllib.parse import unquote
-    
-    # Approval status
-    if decision['approved_action'] == 'ignore':
-        status_text = "⏭️ Ignored"
-        status_color = "#64748b"
-    elif decision['approved_action'] == 'replace':
-        status_text = "✅ Fixed"
-        status_color = "#059669"
-    else:
-        status_text = "⏳ Pending"
-        status_color = "#b45309"
-    
-    # Image filename - decode and escape
-    img_url_decoded = unquote(img_url)
-    img_filename = img_url_decoded.split('/')[-1][:50]
-    img_filename_escaped = html.escape(img_filename)
-    img_url_escaped = html.escape(img_url)
-    
-    # Simple row with thumbnail, filename, status, page count
-    col1, col2, col3, col4 = st.columns([1, 3, 1, 1])
-    
-    with col1:
-        # Thumbnail
-        try:
-            st.image(img_url, width=60)
-        except:
-            st.caption("No preview")
+    # Decoded filename and escaped URL, precomputed at upload
+    img_filename_escaped = info['filename_escaped']
+    img_url_escaped = info['image_url_escaped']
+    kid = info['widget_key']
+    
+    # Decided rows that aren't open collapse to one line with a small Edit button
+    if decision['approved_action'] and st.session_state.iat_editing_url != img_url:
+        col_info, col_action = st.columns([5, 1])
+        with col_info:
+            st.markdown(_IAT_DECIDED_ROW_HTML.format(
+                status=_IAT_STATUS_HTML.get(decision['approved_action'], _IAT_STATUS_PENDING_HTML),
+                filename=img_filename_escaped,
+                count=info['count'],
+            ), unsafe_allow_html=True)
+        with col_action:
+            if st.button("Edit", key=f"iat_edit_{kid}", use_container_width=True):
+                st.session_state.iat_editing_url = img_url
+                st.rerun(scope="fragment")
+        return
     
-    with col2:
-        st.markdown(f"**{img_filename_escaped}**")
-        st.caption(f"Affects {info['count']} page(s)")
+    # Simple row: static cells in one markdown element, only the button needs a column
+    col_info, col_action = st.columns([5, 1])
     
-    with col3:
-        st.markdown(f"<span style='color: {status_color}; font-weight: 500;'>{status_text}</span>", unsafe_allow_html=True)
+    with col_info:
+        # Lazy thumbnail - the browser defers fetching rows below the fold; anything non-remote has no preview
+        st.markdown(_IAT_ROW_HTML.format(
+            thumbnail=_IAT_THUMBNAIL_HTML.format(src=img_url_escaped) if _is_remote_image(img_url) else _IAT_NO_THUMBNAIL_HTML,
+            filename=img_filename_escaped,
+            count=info['count'],
+            status=_IAT_STATUS_HTML.get(decision['approved_action'], _IAT_STATUS_PENDING_HTML),
+        ), unsafe_allow_html=True)
     
-    with col4:
+    with col_action:
         is_editing = st.session_state.iat_editing_url == img_url
         if is_editing:
-            if st.button("✕ Close", key=f"iat_close_{img_url}", use_container_width=True):
+            if st.button("✕ Close", key=f"iat_close_{kid}", use_container_width=True):
                 st.session_state.iat_editing_url = None
-                st.rerun()
+                st.rerun(scope="fragment")
         else:
-            if st.button("Set Fix", key=f"iat_edit_{img_url}", type="primary", use_container_width=True):
+            if st.button("Set Fix", key=f"iat_edit_{kid}", type="primary", use_container_width=True):
                 st.session_state.iat_editing_url = img_url
-                st.rerun()
+                st.rerun(scope="fragment")
     
     # Show inline edit form if this image is being edited
     if st.session_state.iat_editing_url == img_url:
@@ -4455,15 +5013,16 @@ def render_iat_row(img_url: str, info: Dict, decision: Dict, is_first_row: bool
 
 
 def render_iat_edit_form(img_url: str, info: Dict, decision: Dict):
-    """Render the inline edit form for image alt text"""
+    """Render the inline edit form for image alt text (decision is the session's dict for img_url, updated in place)"""
+    kid = info['widget_key']
     
     # Use a Streamlit container with custom styling via CSS class
     with st.container():
         # Show image thumbnail
         st.markdown("**Image Preview:**")
-        try:
+        if _is_remote_image(img_url):
             st.image(img_url, width=300)
-        except:
+        else:
             st.caption("(Could not load image preview)")
         
         st.markdown("**Choose a fix for this image:**")
@@ -4484,7 +5043,7 @@ def render_iat_edit_form(img_url: str, info: Dict, decision: Dict):
             fix_options,
             index=default_idx,
             horizontal=True,
-            key=f"iat_fix_type_{img_url}",
+            key=f"iat_fix_type_{kid}",
             label_visibility='collapsed'
         )
     
@@ -4517,23 +5076,22 @@ def render_iat_edit_form(img_url: str, info: Dict, decision: Dict):
             "Enter alt text:",
             value=current_value,
             placeholder="Descriptive alt text for this image",
-            key=f"iat_manual_{img_url}",
+            key=f"iat_manual_{kid}",
             max_chars=200,
             label_visibility='collapsed'
         )
         
         if manual_alt != decision['manual_fix']:
-            st.session_state.iat_decisions[img_url]['manual_fix'] = manual_alt
+            decision['manual_fix'] = manual_alt
         
         # Always show Save button - enabled state, check for content on click
-        if st.button("💾 Save Selection", key=f"iat_save_manual_{img_url}", type="primary", use_container_width=True):
+        if st.button("💾 Save Selection", key=f"iat_save_manual_{kid}", type="primary", use_container_width=True):
             if manual_alt:
-                st.session_state.iat_decisions[img_url]['approved_action'] = 'replace'
-                st.session_state.iat_decisions[img_url]['approved_fix'] = manual_alt
+                set_approved_action('iat_decisions', decision, 'replace', manual_alt)
                 st.session_state.iat_editing_url = None
                 st.toast("✅ Saved: Replace Alt Text", icon="✅")
                 time.sleep(0.3)
-                st.rerun()
+                st.rerun(scope="app")
             else:
                 st.warning("Please enter alt text before saving")
     
@@ -4552,23 +5110,22 @@ def render_iat_edit_form(img_url: str, info: Dict, decision: Dict):
             if decision['ai_notes']:
                 st.markdown(f"**Why:** {decision['ai_notes']}")
             
-            if st.button("💾 Accept AI Suggestion", key=f"iat_save_ai_{img_url}", type="primary", use_container_width=True):
-                st.session_state.iat_decisions[img_url]['approved_action'] = 'replace'
-                st.session_state.iat_decisions[img_url]['approved_fix'] = decision['ai_suggestion']
+            if st.button("💾 Accept AI Suggestion", key=f"iat_save_ai_{kid}", type="primary", use_container_width=True):
+                set_approved_action('iat_decisions', decision, 'replace', decision['ai_suggestion'])
                 st.session_state.iat_editing_url = None
                 st.toast("✅ Saved: Replace Alt Text", icon="✅")
                 time.sleep(0.3)
-                st.rerun()
+                st.rerun(scope="app")
         else:
             if user_has_key:
                 st.success("✅ Using your API key")
-                if st.button("🔍 Get AI Suggestion", key=f"iat_ai_{img_url}", use_container_width=True):
+                if st.button("🔍 Get AI Suggestion", key=f"iat_ai_{kid}", use_container_width=True):
                     with st.spinner("AI is analyzing the image..."):
                         domain = st.session_state.iat_domain or ''
                         result = get_ai_alt_text_suggestion(img_url, info, domain, st.session_state.anthropic_key)
-                        st.session_state.iat_decisions[img_url]['ai_suggestion'] = result['alt_text']
-                        st.session_state.iat_decisions[img_url]['ai_notes'] = result['notes']
-                        st.rerun()
+                        decision['ai_suggestion'] = result['alt_text']
+                        decision['ai_notes'] = result['notes']
+                        st.rerun(scope="fragment")
             else:
                 st.info("🔑 Enter your Claude API key for AI-powered alt text suggestions")
                 
@@ -4576,50 +5133,53 @@ def render_iat_edit_form(img_url: str, info: Dict, decision: Dict):
                     "Your Claude API Key:",
                     type="password",
                     placeholder="sk-ant-...",
-                    key=f"iat_api_key_{img_url}",
+                    key=f"iat_api_key_{kid}",
                 )
                 if api_key_input:
                     st.session_state.anthropic_key = api_key_input
                     st.success("✅ API key saved!")
-                    st.rerun()
+                    st.rerun(scope="app")
                 
                 st.caption("Get your key at [console.anthropic.com](https://console.anthropic.com) • Keys are stored in your browser session only")
     
     elif selected_fix == "⏭️ Ignore":
         st.markdown("**What this does:** Marks this image as reviewed but takes no action. Use for decorative images, images with acceptable alt text, or ones you'll handle manually.")
         
-        if st.button("💾 Save Selection", key=f"iat_save_ignore_{img_url}", type="primary", use_container_width=True):
-            st.session_state.iat_decisions[img_url]['approved_action'] = 'ignore'
-            st.session_state.iat_decisions[img_url]['approved_fix'] = ''
+        if st.button("💾 Save Selection", key=f"iat_save_ignore_{kid}", type="primary", use_container_width=True):
+            set_approved_action('iat_decisions', decision, 'ignore')
             st.session_state.iat_editing_url = None
             st.toast("✅ Saved: Ignored", icon="✅")
             time.sleep(0.3)
-            st.rerun()
+            st.rerun(scope="app")
 
 
 def create_iat_export_data() -> List[Dict]:
     """Create export data from approved image alt text decisions"""
-    decisions = st.session_state.iat_decisions
-    images = st.session_state.iat_images
-    
-    export = []
-    
-    for img_url, decision in decisions.items():
-        if not decision['approved_action'] or decision['approved_action'] == 'ignore':
-            continue
-        
-        info = images[img_url]
-        
-        for source in info['sources']:
-            export.append({
-                'source_url': source,
-                'image_url': img_url,
-                'current_alt': info['current_alt'],
-                'new_alt': decision['approved_fix'],
-                'action': 'replace',
-            })
-    
-    return export
+    return _build_iat_export_data(st.session_state.iat_decisions, st.session_state.iat_images)
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False, hash_funcs={dict: _hash_session_dict})
+def _build_iat_export_data(decisions: Dict, images: Dict) -> List[Dict]:
+    """Build image alt text export rows in one pass (cached on the content of the inputs)"""
+    return [
+        {
+            'source_url': source,
+            'image_url': img_url,
+            'current_alt': images[img_url]['current_alt'],
+            'new_alt': decision['approved_fix'],
+            'action': 'replace',
+        }
+        for img_url, decision in decisions.items()
+        if decision['approved_action'] == 'replace'
+        for source in images[img_url]['sources']
+    ]
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False, hash_funcs={dict: _hash_session_dict})
+def _build_iat_export_files(decisions: Dict, images: Dict) -> Tuple[bytes, bytes]:
+    """Image alt text export as CSV and compact JSON bytes (serialized once per decision change)"""
+    records = _build_iat_export_data(decisions, images)
+    return records_to_csv(records).encode('utf-8'), records_to_json(records, indent=False)
 
 
 def render_iat_export_section():
@@ -4642,13 +5202,13 @@ def render_iat_export_section():
         st.info("Set alt text fixes above to enable export")
         return
     
-    # Export buttons
-    export_data = create_iat_export_data()
+    # Export buttons - both files come from one cache lookup
+    # (compact JSON - these files can run to tens of thousands of rows)
+    csv_output, json_output = _build_iat_export_files(decisions, images)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        csv_output = pd.DataFrame(export_data).to_csv(index=False)
         st.download_button(
             label="📥 Download CSV",
             data=csv_output,
@@ -4658,7 +5218,6 @@ def render_iat_export_section():
         )
     
     with col2:
-        json_output = json.dumps(export_data, indent=2)
         st.download_button(
             label="📥 Download JSON",
             data=json_output,
@@ -4684,16 +5243,23 @@ def render_iat_export_section():
     has_post_ids = st.session_state.has_post_ids
     post_id_count = len(st.session_state.post_id_cache)
     
-    # Count how many source pages need fixes
-    source_pages_to_fix = set()
-    for key, decision in approved:
-        for source in images[key]['sources']:
-            source_pages_to_fix.add(source)
+    # Fixes to apply and the source pages they touch, rebuilt only when a decision changes
+    sig = (len(images), st.session_state.iat_decisions_version)
+    if sig != st.session_state.iat_fix_targets_sig:
+        fixes_to_apply = [
+            {'source_url': source, 'image_url': key, 'new_alt': decision['approved_fix']}
+            for key, decision in approved
+            for source in images[key]['sources']
+        ]
+        st.session_state.iat_fixes_to_apply = fixes_to_apply
+        st.session_state.iat_fix_targets = frozenset(fix['source_url'] for fix in fixes_to_apply)
+        st.session_state.iat_fix_targets_sig = sig
+    source_pages_to_fix = st.session_state.iat_fix_targets
     
     pages_to_fix = len(source_pages_to_fix)
     
     # Count how many pages have Post IDs mapped
-    pages_with_post_ids = sum(1 for url in source_pages_to_fix if url in st.session_state.post_id_cache)
+    pages_with_post_ids = len(st.session_state.post_id_cache.keys() & source_pages_to_fix)
     
     if has_post_ids and pages_with_post_ids > 0:
         # Full Mode with Post IDs
@@ -4703,7 +5269,7 @@ def render_iat_export_section():
             st.warning(f"⚠️ {pages_to_fix - pages_with_post_ids} pages don't have Post IDs and will be skipped")
         
         if st.button("🚀 Apply Alt Text Fixes to WordPress", type="primary", use_container_width=True, key="iat_apply"):
-            run_iat_agent_fixes(approved, source_pages_to_fix)
+            run_iat_agent_fixes(st.session_state.iat_fixes_to_apply)
     else:
         # No Post IDs - explain what's needed
         st.warning(f"""
@@ -4717,126 +5283,103 @@ def render_iat_export_section():
         """)
 
 
-def run_iat_agent_fixes(approved: List, source_pages_to_fix: set):
-    """Run the agent to apply image alt text fixes"""
+def run_iat_agent_fixes(fixes_to_apply: List[Dict]):
+    """Run the agent to apply image alt text fixes (one {source_url, image_url, new_alt} per update)"""
     client = st.session_state.wp_client
-    images = st.session_state.iat_images
-    
-    # Build list of all fixes to apply
-    fixes_to_apply = []
-    for img_url, decision in approved:
-        info = images[img_url]
-        for source in info['sources']:
-            if source in source_pages_to_fix:
-                fixes_to_apply.append({
-                    'source_url': source,
-                    'image_url': img_url,
-                    'new_alt': decision['approved_fix'],
-                    'post_id': st.session_state.post_id_cache.get(source)
-                })
     
     total_fixes = len(fixes_to_apply)
     results = []
-    skipped_for_retry = []
     
-    # Helper function to truncate with ellipsis if needed
-    def truncate(text, max_len):
-        if len(text) <= max_len:
-            return text
-        return text[:max_len] + "..."
+    # Post IDs for every source page (session cache first), resolved concurrently up front
+    post_ids = resolve_post_ids(client, [fix['source_url'] for fix in fixes_to_apply])
+    
+    # Fixes grouped by post: a post's fixes run in order, different posts run in parallel
+    fixes_by_post = defaultdict(list)
+    unresolved = []
+    for fix in fixes_to_apply:
+        post_id = post_ids.get(fix['source_url'])
+        if post_id:
+            fixes_by_post[post_id].append(fix)
+        else:
+            unresolved.append(fix)
+    
+    def apply_group(post_id, group):
+        # Runs on a worker thread - no Streamlit calls here
+        outcomes = []
+        for fix in group:
+            try:
+                outcomes.append(client.update_alt_text(post_id, fix['image_url'], fix['new_alt'], dry_run=False))
+            except Exception as e:
+                outcomes.append({'success': False, 'message': str(e), 'error': True})
+        return outcomes
+    
+    progress_bar = st.progress(0)
     
     with st.status(f"Applying {total_fixes} alt text fixes...", expanded=True) as main_status:
-        for i, fix in enumerate(fixes_to_apply):
-            with st.status(f"Fix {i+1}/{total_fixes}", expanded=False) as status:
-                # Clickable page link (truncate display but full link)
-                page_url = fix['source_url']
-                page_display = truncate(page_url, 100)
-                st.markdown(f"📄 Page: [{page_display}]({page_url})")
-                
-                # Step 1: Get Post ID
-                post_id = fix.get('post_id')
-                if not post_id:
-                    st.write("🔍 Looking up Post ID...")
-                    post_id = client.find_post_id_by_url(fix['source_url'])
-                    
-                    if post_id:
-                        st.write(f"✅ Found Post ID: {post_id}")
-                        st.session_state.post_id_cache[fix['source_url']] = post_id
-                    else:
-                        st.write("❌ Could not find Post ID")
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'image_url': fix['image_url'],
-                            'status': 'skipped',
-                            'message': 'Post ID not found'
-                        })
-                        skipped_for_retry.append(fix)
-                        status.update(label=f"⏭️ Skipped", state="error")
-                        continue
-                else:
-                    st.write(f"📄 Post ID: {post_id}")
-                
-                # Step 2: Apply fix (update alt text)
-                st.write(f"🔧 Updating alt text...")
-                
-                # Full image filename (truncate at 80 chars)
-                img_filename = fix['image_url'].split('/')[-1]
-                img_display = truncate(img_filename, 80)
-                st.write(f"   Image: `{img_display}`")
-                
-                # Full alt text (truncate at 150 chars)
-                alt_display = truncate(fix['new_alt'], 150)
-                st.write(f"   New alt: `{alt_display}`")
-                
-                try:
-                    result = client.update_alt_text(post_id, fix['image_url'], fix['new_alt'], dry_run=False)
-                    
+        # One placeholder holds a rolling log of the last WP_LOG_WINDOW fixes
+        log_placeholder = st.empty()
+        log_lines = deque(maxlen=WP_LOG_WINDOW)
+        
+        def log(*lines):
+            log_lines.extend(lines)
+            log_placeholder.markdown("\n\n".join(log_lines))
+            progress_bar.progress(len(results) / max(total_fixes, 1))
+        
+        for fix in unresolved:
+            results.append({
+                'source_url': fix['source_url'],
+                'image_url': fix['image_url'],
+                'status': 'skipped',
+                'message': 'Post ID not found'
+            })
+        if unresolved:
+            log(*(f"⏭️ [{_truncate(fix['source_url'], 100)}]({fix['source_url']}) — Post ID not found, skipping"
+                  for fix in unresolved))
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=WP_APPLY_WORKERS) as pool:
+            futures = {pool.submit(apply_group, post_id, group): post_id for post_id, group in fixes_by_post.items()}
+            
+            for future in concurrent.futures.as_completed(futures):
+                post_id = futures[future]
+                new_lines = []
+                for fix, result in zip(fixes_by_post[post_id], future.result()):
+                    target = (f"[{_truncate(fix['source_url'], 100)}]({fix['source_url']}) (Post ID {post_id}) — "
+                              f"`{_truncate(fix['image_url'].split('/')[-1], 80)}` → `{_truncate(fix['new_alt'], 150)}`")
                     if result['success']:
-                        st.write(f"   ✅ {result['message']}")
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'image_url': fix['image_url'],
-                            'new_alt': fix['new_alt'],
-                            'status': 'success',
-                            'message': result['message']
-                        })
-                        status.update(label=f"✅ Success", state="complete")
+                        new_lines.append(f"✅ {target}: {result['message']}")
+                    elif result.get('error'):
+                        new_lines.append(f"❌ {target}: Error: {result['message']}")
                     else:
+                        line = f"❌ {target}: {result['message']}"
+                        # Provide helpful context for "not found" errors
                         if 'not found' in result['message'].lower():
-                            st.write(f"   ❌ {result['message']}")
-                            st.write(f"   💡 Common reasons: image may be in a widget, shortcode, or theme template")
-                        else:
-                            st.write(f"   ❌ {result['message']}")
-                        
-                        results.append({
-                            'source_url': fix['source_url'],
-                            'image_url': fix['image_url'],
-                            'new_alt': fix['new_alt'],
-                            'status': 'failed',
-                            'message': result['message']
-                        })
-                        status.update(label=f"❌ Failed", state="error")
-                        
-                except Exception as e:
-                    st.write(f"   ❌ Error: {str(e)}")
+                            line += " — image may be in a widget, shortcode, or theme template"
+                        new_lines.append(line)
+                    
                     results.append({
                         'source_url': fix['source_url'],
                         'image_url': fix['image_url'],
                         'new_alt': fix['new_alt'],
-                        'status': 'failed',
-                        'message': str(e)
+                        'status': 'success' if result['success'] else 'failed',
+                        'message': result['message']
                     })
-                    status.update(label=f"❌ Error", state="error")
-            
-            time.sleep(0.3)
+                log(*new_lines)
+        
+        progress_bar.progress(1.0)
+        failed_count = sum(1 for r in results if r['status'] == 'failed')
+        if failed_count or unresolved:
+            main_status.update(label=f"⚠️ Done with {failed_count} failed, {len(unresolved)} skipped", state="error")
+        else:
+            main_status.update(label=f"✅ Applied {total_fixes} alt text fixes", state="complete")
     
     # Store results
     st.session_state.wp_execute_results = results
     
     # Summary
-    success = sum(1 for r in results if r['status'] == 'success')
-    skipped = sum(1 for r in results if r['status'] == 'skipped')
-    failed = sum(1 for r in results if r['status'] == 'failed')
+    status_counts = Counter(r['status'] for r in results)
+    success = status_counts['success']
+    skipped = status_counts['skipped']
+    failed = status_counts['failed']
     
     track_event("wordpress_apply", {
         "type": "image_alt_text",
@@ -4992,78 +5535,83 @@ def render_footer():
 # MAIN
 # =============================================================================
 
-def render_progress_indicator():
-    """Render workflow progress indicator"""
-    decisions = st.session_state.decisions
-    
-    # Determine current state
-    has_upload = st.session_state.df is not None
-    has_reviewed = any(d['approved_action'] for d in decisions.values()) if decisions else False
-    all_reviewed = all(d['approved_action'] for d in decisions.values()) if decisions else False
-    approved_count = sum(1 for d in decisions.values() if d['approved_action'] and d['approved_action'] != 'ignore')
-    has_exports = approved_count > 0
-    
-    # Step states: 'complete', 'active', 'pending'
-    step1 = 'complete' if has_upload else 'active'
-    step2 = 'complete' if all_reviewed else ('active' if has_upload else 'pending')
-    step3 = 'complete' if has_exports else ('active' if has_reviewed else 'pending')
-    step4 = 'active' if has_exports else 'pending'
-    
-    def get_circle_style(state):
-        if state == 'complete':
-            return 'background: linear-gradient(135deg, #0d9488, #0891b2); color: white;'
-        elif state == 'active':
-            return 'background: linear-gradient(135deg, #ccfbf1, #a5f3fc); color: #0d9488; border: 2px solid #0d9488;'
-        else:
-            return 'background: #e2e8f0; color: #94a3b8;'
-    
-    def get_icon(state, num):
-        return '✓' if state == 'complete' else num
-    
-    def get_connector_style(prev_state):
-        if prev_state == 'complete':
-            return 'background: linear-gradient(90deg, #0d9488, #0891b2);'
-        else:
-            return 'background: #e2e8f0;'
-    
-    def get_label_style(state):
-        if state == 'complete':
-            return 'color: #0d9488; font-weight: 600;'
-        elif state == 'active':
-            return 'color: #0d9488; font-weight: 600;'
-        else:
-            return 'color: #94a3b8;'
-    
-    st.markdown(f"""
+# Progress step styles by step state ('complete', 'active' or 'pending')
+_STEP_CIRCLE_STYLES = {
+    'complete': 'background: linear-gradient(135deg, #0d9488, #0891b2); color: white;',
+    'active': 'background: linear-gradient(135deg, #ccfbf1, #a5f3fc); color: #0d9488; border: 2px solid #0d9488;',
+    'pending': 'background: #e2e8f0; color: #94a3b8;',
+}
+_STEP_LABEL_STYLES = {
+    'complete': 'color: #0d9488; font-weight: 600;',
+    'active': 'color: #0d9488; font-weight: 600;',
+    'pending': 'color: #94a3b8;',
+}
+# Connectors are keyed by the state of the step before them
+_STEP_CONNECTOR_STYLES = {
+    'complete': 'background: linear-gradient(90deg, #0d9488, #0891b2);',
+    'active': 'background: #e2e8f0;',
+    'pending': 'background: #e2e8f0;',
+}
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _progress_indicator_html(step1: str, step2: str, step3: str, step4: str) -> str:
+    """Workflow progress indicator markup for a set of step states (built once per combination)"""
+    return f"""
     <div style="display: flex; align-items: center; justify-content: center; margin: 0.5rem 0 1.5rem 0;">
         <!-- Step 1 -->
         <div style="display: flex; flex-direction: column; align-items: center; min-width: 70px;">
-            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {get_circle_style(step1)}">{get_icon(step1, '1')}</div>
-            <div style="font-size: 0.75rem; margin-top: 0.35rem; {get_label_style(step1)}">Upload</div>
+            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {_STEP_CIRCLE_STYLES[step1]}">{'✓' if step1 == 'complete' else '1'}</div>
+            <div style="font-size: 0.75rem; margin-top: 0.35rem; {_STEP_LABEL_STYLES[step1]}">Upload</div>
         </div>
         <!-- Connector 1-2 -->
-        <div style="width: 40px; height: 3px; {get_connector_style(step1)} margin: 0 -5px; margin-bottom: 1.2rem;"></div>
+        <div style="width: 40px; height: 3px; {_STEP_CONNECTOR_STYLES[step1]} margin: 0 -5px; margin-bottom: 1.2rem;"></div>
         <!-- Step 2 -->
         <div style="display: flex; flex-direction: column; align-items: center; min-width: 70px;">
-            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {get_circle_style(step2)}">{get_icon(step2, '2')}</div>
-            <div style="font-size: 0.75rem; margin-top: 0.35rem; {get_label_style(step2)}">Review</div>
+            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {_STEP_CIRCLE_STYLES[step2]}">{'✓' if step2 == 'complete' else '2'}</div>
+            <div style="font-size: 0.75rem; margin-top: 0.35rem; {_STEP_LABEL_STYLES[step2]}">Review</div>
         </div>
         <!-- Connector 2-3 -->
-        <div style="width: 40px; height: 3px; {get_connector_style(step2)} margin: 0 -5px; margin-bottom: 1.2rem;"></div>
+        <div style="width: 40px; height: 3px; {_STEP_CONNECTOR_STYLES[step2]} margin: 0 -5px; margin-bottom: 1.2rem;"></div>
         <!-- Step 3 -->
         <div style="display: flex; flex-direction: column; align-items: center; min-width: 70px;">
-            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {get_circle_style(step3)}">{get_icon(step3, '3')}</div>
-            <div style="font-size: 0.75rem; margin-top: 0.35rem; {get_label_style(step3)}">Approve</div>
+            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {_STEP_CIRCLE_STYLES[step3]}">{'✓' if step3 == 'complete' else '3'}</div>
+            <div style="font-size: 0.75rem; margin-top: 0.35rem; {_STEP_LABEL_STYLES[step3]}">Approve</div>
         </div>
         <!-- Connector 3-4 -->
-        <div style="width: 40px; height: 3px; {get_connector_style(step3)} margin: 0 -5px; margin-bottom: 1.2rem;"></div>
+        <div style="width: 40px; height: 3px; {_STEP_CONNECTOR_STYLES[step3]} margin: 0 -5px; margin-bottom: 1.2rem;"></div>
         <!-- Step 4 -->
         <div style="display: flex; flex-direction: column; align-items: center; min-width: 70px;">
-            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {get_circle_style(step4)}">{get_icon(step4, '4')}</div>
-            <div style="font-size: 0.75rem; margin-top: 0.35rem; {get_label_style(step4)}">Apply</div>
+            <div style="width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 0.85rem; {_STEP_CIRCLE_STYLES[step4]}">{'✓' if step4 == 'complete' else '4'}</div>
+            <div style="font-size: 0.75rem; margin-top: 0.35rem; {_STEP_LABEL_STYLES[step4]}">Apply</div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+def render_progress_indicator():
+    """Render workflow progress indicator"""
+    decisions = st.session_state.decisions
+    
+    # Determine current state (reviewed flags from the pending counter, fix count cached per decisions version)
+    has_upload = st.session_state.df is not None
+    pending = st.session_state.broken_pending_count
+    has_reviewed = bool(decisions) and pending < len(decisions)
+    all_reviewed = bool(decisions) and pending == 0
+    if st.session_state.broken_fix_count_sig != st.session_state.decisions_version:
+        st.session_state.broken_fix_count = sum(
+            1 for d in decisions.values() if d['approved_action'] and d['approved_action'] != 'ignore'
+        )
+        st.session_state.broken_fix_count_sig = st.session_state.decisions_version
+    has_exports = st.session_state.broken_fix_count > 0
+    
+    # Step states: 'complete', 'active', 'pending'
+    step1 = 'complete' if has_upload else 'active'
+    step2 = 'complete' if all_reviewed else ('active' if has_upload else 'pending')
+    step3 = 'complete' if has_exports else ('active' if has_reviewed else 'pending')
+    step4 = 'active' if has_exports else 'pending'
+    
+    st.markdown(_progress_indicator_html(step1, step2, step3, step4), unsafe_allow_html=True)
 
 
 def main():
@@ -5109,7 +5657,7 @@ def main():
 
     # If data is loaded, show the workflow below
     if has_broken_links or has_redirect_chains or has_image_alt_text or has_backlink_reclaim:
-        st.markdown("---")
+        st.divider()
 
         # Show task switcher if multiple tasks
         render_task_switcher()
@@ -5119,19 +5667,19 @@ def main():
 
         if current_task == 'redirect_chains' and has_redirect_chains:
             # Redirect Chains workflow
-            st.markdown('<p class="section-header">🔄 Redirect Chains</p>', unsafe_allow_html=True)
+            st.html('<p class="section-header">🔄 Redirect Chains</p>')
             render_rc_metrics()
-            st.markdown("---")
+            st.divider()
             render_rc_warnings()
             render_rc_spreadsheet()
-            st.markdown("---")
+            st.divider()
             render_wordpress_section()
-            st.markdown("---")
+            st.divider()
             render_rc_export_section()
 
         elif current_task == 'broken_links' and has_broken_links:
             # Broken Links workflow (existing)
-            st.markdown('<p class="section-header">🔗 Broken Links</p>', unsafe_allow_html=True)
+            st.html('<p class="section-header">🔗 Broken Links</p>')
 
             # Show guidance box based on WordPress connection status
             if not st.session_state.get('wp_connected'):
@@ -5146,16 +5694,16 @@ def main():
                 st.success("✅ WordPress connected. Set fixes below, then click 'Publish to WordPress' when ready.")
 
             render_metrics()
-            st.markdown("---")
+            st.divider()
             render_spreadsheet()
-            st.markdown("---")
+            st.divider()
             render_wordpress_section()
-            st.markdown("---")
+            st.divider()
             render_export_section()
 
         elif current_task == 'image_alt_text' and has_image_alt_text:
             # Image Alt Text workflow
-            st.markdown('<p class="section-header">🖼️ Image Alt Text</p>', unsafe_allow_html=True)
+            st.html('<p class="section-header">🖼️ Image Alt Text</p>')
 
             # Show guidance box based on WordPress connection status
             if not st.session_state.get('wp_connected'):
@@ -5170,25 +5718,24 @@ def main():
                 st.success("✅ WordPress connected. Set alt text below, then click 'Publish to WordPress' when ready.")
 
             render_iat_metrics()
-            st.markdown("---")
+            st.divider()
             render_iat_spreadsheet()
-            st.markdown("---")
+            st.divider()
             render_wordpress_section()
-            st.markdown("---")
+            st.divider()
             render_iat_export_section()
 
         elif current_task == 'backlink_reclaim' and has_backlink_reclaim:
             # Backlink Reclaim workflow
             # Add anchor div for scrolling from landing page
             st.markdown('<div id="backlink-reclaim-section"></div>', unsafe_allow_html=True)
-            st.markdown('<p class="section-header">🔙 Backlink Reclaim</p>', unsafe_allow_html=True)
+            st.html('<p class="section-header">🔙 Backlink Reclaim</p>')
 
             # Auto-scroll to section if coming from landing page or after scan
             if st.session_state.get('br_scroll_to_section') or st.session_state.get('br_should_scroll'):
                 st.session_state.br_scroll_to_section = False
                 st.session_state.br_should_scroll = False
                 # Use components.html to execute JavaScript for scrolling
-                import streamlit.components.v1 as components
                 components.html("""
                     <script>
                         // Find the backlink results section and scroll to it
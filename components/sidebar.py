@@ -3,16 +3,15 @@ Sidebar/Integrations Panel Components for Screaming Fixes.
 Handles the integrations setup panel with progressive steps.
 """
 
+import importlib.util
 from typing import Dict, Callable, Optional, Any
 
 import streamlit as st
 
-# Optional WordPress client import
-try:
-    from wordpress_client import WordPressClient
-    WP_AVAILABLE = True
-except ImportError:
-    WP_AVAILABLE = False
+# Optional WordPress client - checked without importing; utils/wp_connection.py loads it when connecting
+WP_AVAILABLE = importlib.util.find_spec("wordpress_client") is not None
+
+from utils.wp_connection import get_wp_client, disconnect_wp_client
 
 # Optional DataForSEO client import
 try:
@@ -769,16 +768,11 @@ def render_integrations_panel(process_post_id_upload: Callable):
             else:
                 with st.spinner("Connecting..."):
                     try:
-                        client = WordPressClient(wp_url, wp_username, wp_password)
-                        result = client.test_connection()
-
-                        if result["success"]:
-                            st.session_state.wp_connected = True
-                            st.session_state.wp_client = client
-                            st.success(f"✅ {result['message']}")
-                            st.rerun()
-                        else:
-                            st.error(result["message"])
+                        st.session_state.wp_client = get_wp_client(wp_url, wp_username, wp_password)
+                        st.session_state.wp_connected = True
+                        st.rerun()
+                    except ConnectionError as e:
+                        st.error(str(e))
                     except Exception as e:
                         st.error(f"Connection failed: {str(e)}")
 
@@ -794,10 +788,7 @@ def render_integrations_panel(process_post_id_upload: Callable):
         render_detected_plugins()
 
         if st.button("🔌 Disconnect WordPress", key="disconnect_wp_integration"):
-            if st.session_state.wp_client:
-                st.session_state.wp_client.close()
-            st.session_state.wp_connected = False
-            st.session_state.wp_client = None
+            disconnect_wp_client()
             # Clear SEO detection cache
             if 'seo_detection_summary' in st.session_state:
                 del st.session_state.seo_detection_summary
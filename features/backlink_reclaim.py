@@ -10,6 +10,7 @@ import re
 import json
 import csv
 import io
+import importlib.util
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 
@@ -18,15 +19,9 @@ import streamlit as st
 # Import config for API keys
 from config import AGENT_MODE_API_KEY
 
-# Optional imports
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except Exception as e:
-    ANTHROPIC_AVAILABLE = False
-    ANTHROPIC_IMPORT_ERROR = str(e)
-else:
-    ANTHROPIC_IMPORT_ERROR = ""
+# Optional imports - checked without loading; the SDK is imported when a suggestion is requested
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+ANTHROPIC_IMPORT_ERROR = "" if ANTHROPIC_AVAILABLE else "No module named 'anthropic'"
 
 try:
     from services.wordpress import SEOService, NoCapablePluginError
@@ -34,11 +29,10 @@ try:
 except ImportError:
     SEO_SERVICE_AVAILABLE = False
 
-try:
-    from wordpress_client import WordPressClient
-    WP_CLIENT_AVAILABLE = True
-except ImportError:
-    WP_CLIENT_AVAILABLE = False
+# The client itself is imported by utils/wp_connection.py when connecting
+WP_CLIENT_AVAILABLE = importlib.util.find_spec("wordpress_client") is not None
+
+from utils.wp_connection import get_wp_client
 
 try:
     from services.claude_api import track_event
@@ -193,6 +187,11 @@ def get_redirect_suggestion(
         "anchor_count": len(anchor_texts),
     })
 
+    try:
+        from anthropic import Anthropic
+    except Exception as e:
+        return {'target': '', 'notes': '', 'error': f'Anthropic library error: {e}'}
+
     try:
         client = Anthropic(api_key=api_key)
 
@@ -877,16 +876,11 @@ def render_apply_section():
             else:
                 with st.spinner("Connecting..."):
                     try:
-                        client = WordPressClient(wp_url, wp_username, wp_password)
-                        result = client.test_connection()
-
-                        if result["success"]:
-                            st.session_state.wp_connected = True
-                            st.session_state.wp_client = client
-                            st.success(f"✅ {result['message']}")
-                            st.rerun()
-                        else:
-                            st.error(result["message"])
+                        st.session_state.wp_client = get_wp_client(wp_url, wp_username, wp_password)
+                        st.session_state.wp_connected = True
+                        st.rerun()
+                    except ConnectionError as e:
+                        st.error(str(e))
                     except Exception as e:
                         st.error(f"Connection failed: {str(e)}")
 
@@ -6,40 +6,112 @@ Handles all AI-powered suggestions for broken links and image alt text.
 import os
 import re
 import json
+import time
+import queue
+import threading
+import importlib.util
 from typing import Dict, Optional, Callable
 
 from config import AGENT_MODE_API_KEY, LANGSMITH_ENABLED
 
-# Optional imports
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# Optional imports - only checked for here; both SDKs are heavy, so they are imported on first use
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
 # LangSmith tracking (optional)
-try:
-    from langsmith import Client as LangSmithClient
-    LANGSMITH_AVAILABLE = True
-except ImportError:
-    LANGSMITH_AVAILABLE = False
+LANGSMITH_AVAILABLE = importlib.util.find_spec("langsmith") is not None
+
+# Client-side pacing for Anthropic requests (Tier 1 default is ~50 RPM)
+AI_REQUESTS_PER_MINUTE = 40
+AI_RATE_LIMIT_RETRIES = 3  # Attempts per request on rate limits, overload and other transient errors
+
+_bucket_lock = threading.Lock()
+_bucket = {'tokens': float(AI_REQUESTS_PER_MINUTE), 'last': time.monotonic()}
+
+
+def _acquire_request_slot():
+    """Block until the shared token bucket allows another API request"""
+    with _bucket_lock:
+        now = time.monotonic()
+        refill = (now - _bucket['last']) * AI_REQUESTS_PER_MINUTE / 60
+        _bucket['tokens'] = min(float(AI_REQUESTS_PER_MINUTE), _bucket['tokens'] + refill)
+        _bucket['last'] = now
+        # Reserve a token now; a negative balance queues later callers behind us
+        wait = (1 - _bucket['tokens']) * 60 / AI_REQUESTS_PER_MINUTE if _bucket['tokens'] < 1 else 0
+        _bucket['tokens'] -= 1
+    if wait:
+        time.sleep(wait)
+
+
+def transient_api_errors() -> tuple:
+    """
+    Anthropic errors worth retrying: rate limits (429), connection failures and timeouts,
+    server errors and overload (529 - its own OverloadedError class on newer SDKs).
+    """
+    import anthropic
+    
+    names = ('RateLimitError', 'APIConnectionError', 'InternalServerError', 'OverloadedError')
+    return tuple(getattr(anthropic, name) for name in names if hasattr(anthropic, name))
+
+
+def _throttled_create(client, **kwargs):
+    """Call client.messages.create paced by the token bucket, backing off on transient errors"""
+    retryable = transient_api_errors()
+    
+    for attempt in range(AI_RATE_LIMIT_RETRIES):
+        _acquire_request_slot()
+        try:
+            return client.messages.create(**kwargs)
+        except retryable:
+            if attempt == AI_RATE_LIMIT_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
+# Analytics events waiting for the background sender; new events are dropped when full
+TRACK_QUEUE_SIZE = 1000
+
+_tracker_lock = threading.Lock()
+_tracker = {'queue': None}
+
+
+def _event_queue() -> "queue.Queue":
+    """Queue drained by a single background sender thread, started with the first tracked event"""
+    with _tracker_lock:
+        if _tracker['queue'] is None:
+            events = queue.Queue(maxsize=TRACK_QUEUE_SIZE)
+            threading.Thread(target=_send_events, args=(events,), name="langsmith-events", daemon=True).start()
+            _tracker['queue'] = events
+        return _tracker['queue']
+
+
+def _send_events(events: "queue.Queue"):
+    """Send queued events to LangSmith, reusing one client (and one connection) for all of them"""
+    client = None
+    while True:
+        run = events.get()
+        try:
+            if client is None:
+                from langsmith import Client as LangSmithClient
+                client = LangSmithClient()
+            client.create_run(**run)
+        except Exception:
+            pass  # Silent fail - tracking never affects the app
 
 
 def track_event(event_name: str, metadata: Dict = None):
-    """Track an analytics event to LangSmith (silent, non-blocking)"""
+    """Track an analytics event to LangSmith (silent, non-blocking - queued for a background thread)"""
     if not LANGSMITH_ENABLED or not LANGSMITH_AVAILABLE:
         return
 
     try:
-        client = LangSmithClient()
-        client.create_run(
-            name=event_name,
-            run_type="chain",
-            inputs=metadata or {},
-            project_name=os.environ.get("LANGCHAIN_PROJECT", "screaming-fixes"),
-        )
-    except Exception:
-        pass  # Silent fail - don't interrupt user experience
+        _event_queue().put_nowait({
+            'name': event_name,
+            'run_type': "chain",
+            'inputs': metadata or {},
+            'project_name': os.environ.get("LANGCHAIN_PROJECT", "screaming-fixes"),
+        })
+    except queue.Full:
+        pass  # Sender is behind - drop the event rather than block the user
 
 
 def get_ai_suggestion(broken_url: str, info: Dict, domain: str, api_key: str) -> Dict[str, str]:
@@ -58,7 +130,9 @@ def get_ai_suggestion(broken_url: str, info: Dict, domain: str, api_key: str) ->
         return {'action': 'remove', 'url': None, 'notes': 'Anthropic library not installed.'}
 
     try:
-        client = Anthropic(api_key=api_key)
+        from anthropic import Anthropic
+        
+        client = Anthropic(api_key=api_key, max_retries=0)  # Retries handled by _throttled_create
 
         anchors_text = ', '.join(f'"{a}"' for a in info['anchors'][:5])
         if len(info['anchors']) > 5:
@@ -89,7 +163,8 @@ Respond in JSON format:
 
 Only output the JSON."""
 
-        response = client.messages.create(
+        response = _throttled_create(
+            client,
             model="claude-sonnet-4-20250514",
             max_tokens=500,
             tools=[{
@@ -146,7 +221,9 @@ def get_ai_alt_text_suggestion(image_url: str, info: Dict, domain: str, api_key:
         return {'alt_text': '', 'notes': 'Anthropic library not installed.'}
 
     try:
-        client = Anthropic(api_key=api_key)
+        from anthropic import Anthropic
+        
+        client = Anthropic(api_key=api_key, max_retries=0)  # Retries handled by _throttled_create
 
         # Get context from source pages
         source_urls = info['sources'][:3]  # First 3 source pages for context
@@ -204,7 +281,8 @@ Only output the JSON."""
             # Fallback to text-only if image URL is relative/invalid
             messages = [{"role": "user", "content": prompt}]
 
-        response = client.messages.create(
+        response = _throttled_create(
+            client,
             model="claude-sonnet-4-20250514",
             max_tokens=500,
             messages=messages
@@ -0,0 +1,117 @@
+"""
+Tests for WordPressClient post ID lookups.
+Run with: python -m pytest tests
+"""
+
+import httpx
+
+from wordpress_client import WordPressClient
+
+
+def _client_with_posts(posts_by_type):
+    """WordPressClient whose REST API answers ?slug= list queries from posts_by_type"""
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        rest_base = request.url.path.rstrip('/').split('/')[-1]
+        wanted = request.url.params.get('slug', '').split(',')
+        # WordPress sanitizes the requested slugs the same way before matching
+        wanted = {slug.lower() for slug in wanted}
+        posts = [post for post in posts_by_type.get(rest_base, []) if post['slug'] in wanted]
+        return httpx.Response(200, json=posts)
+
+    client = WordPressClient("https://example.com", "admin", "xxxx xxxx")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client, requests_seen
+
+
+def test_find_post_ids_by_slug_matches_sanitized_slugs():
+    client, requests_seen = _client_with_posts({
+        'posts': [{'id': 11, 'slug': 'caf%c3%a9-guide'}],
+        'pages': [{'id': 22, 'slug': 'about-us'}],
+    })
+    urls = [
+        "https://example.com/blog/Caf%C3%A9-Guide/",
+        "https://example.com/About-Us/",
+        "https://example.com/missing-page/",
+    ]
+
+    found = client.find_post_ids_by_slug(urls)
+
+    assert found == {urls[0]: 11, urls[1]: 22}
+    # One list request per post type, not one per page
+    assert len(requests_seen) == 2
+
+
+def _client_for_batch(batch_response):
+    """WordPressClient serving two posts' content and answering /batch/v1 with batch_response"""
+    individual_saves = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith('/batch/v1'):
+            return batch_response
+        if request.method == 'GET' and path.endswith('/wp/v2/posts'):
+            return httpx.Response(200, json=[
+                {'id': post_id, 'content': {'raw': '<a href="https://old.example/">link</a>'}}
+                for post_id in (1, 2)
+            ])
+        if request.method == 'POST':
+            individual_saves.append(path)
+            return httpx.Response(200, json={})
+        return httpx.Response(200, json=[])
+
+    client = WordPressClient("https://example.com", "admin", "xxxx xxxx")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client, individual_saves
+
+
+_FIXES = [
+    {'post_id': post_id, 'broken_url': 'https://old.example/', 'action': 'replace',
+     'replacement_url': 'https://new.example/'}
+    for post_id in (1, 2)
+]
+
+
+def test_batch_apply_fixes_reports_validation_failure_as_not_applied():
+    client, individual_saves = _client_for_batch(httpx.Response(207, json={
+        'failed': 'validation',
+        'responses': [
+            None,
+            {'status': 400, 'body': {'code': 'rest_invalid_param', 'message': 'Invalid parameter(s): content'}},
+        ],
+    }))
+
+    results = client.batch_apply_fixes(_FIXES)
+
+    assert [r['success'] for r in results] == [False, False]
+    assert 'failed validation' in results[0]['message']
+    assert results[1]['message'] == 'Invalid parameter(s): content'
+    # Rejected batches are not retried one post at a time
+    assert individual_saves == []
+
+
+def test_batch_apply_fixes_survives_non_json_batch_response():
+    client, individual_saves = _client_for_batch(httpx.Response(200, text='<html>Blocked</html>'))
+
+    results = client.batch_apply_fixes(_FIXES)
+
+    assert [r['success'] for r in results] == [False, False]
+    assert individual_saves == []
+
+
+def test_batch_apply_fixes_saves_individually_without_batch_endpoint():
+    client, _ = _client_for_batch(httpx.Response(404, json={'code': 'rest_no_route'}))
+    saved = []
+
+    async def fake_update(updates):
+        saved.extend(post_id for post_id, _, _, _ in updates)
+        return [True] * len(updates)
+
+    client._update_posts_concurrently = fake_update
+
+    results = client.batch_apply_fixes(_FIXES)
+
+    assert [r['success'] for r in results] == [True, True]
+    assert saved == [1, 2]
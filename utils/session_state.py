@@ -3,6 +3,9 @@ Session state initialization for Screaming Fixes.
 Centralizes all session state defaults in one place.
 """
 
+from collections import deque, Counter
+from typing import Dict
+
 import streamlit as st
 
 from config import AGENT_MODE_FREE_SUGGESTIONS
@@ -20,14 +23,25 @@ def init_session_state():
         'domain': None,
         'broken_urls': {},
         'decisions': {},
+        'broken_url_index': {},  # URL -> position in broken_url_counts
+        'broken_url_counts': None,  # numpy array of page counts per broken URL
+        'broken_urls_total_impact': 0,  # Sum of page counts across broken URLs
+        'sources_by_broken_url': {},  # Broken URL -> frozenset of source pages
+        'broken_pending_count': 0,  # Decisions with no approved_action yet
+        'decisions_version': 0,  # Bumped whenever a broken link decision changes
+        'broken_fix_count': 0,  # Decisions approved with an action other than ignore
+        'broken_fix_count_sig': None,  # Decisions version the fix count was taken at
 
         # Redirect Chains data
         'rc_df': None,
         'rc_domain': None,
         'rc_redirects': {},  # Grouped redirect data
         'rc_decisions': {},
+        'rc_pending_count': 0,  # Redirect decisions with no approved_action yet
         'rc_sitewide': [],  # Sitewide links (informational)
         'rc_loops': [],  # Loop redirects (informational)
+        'rc_sitewide_open': False,  # Sitewide links section expanded
+        'rc_loops_open': False,  # Loops section expanded
 
         # Redirect Chain filters
         'rc_filter_301': True,
@@ -37,13 +51,20 @@ def init_session_state():
         'rc_show_pending': True,
         'rc_page': 0,
         'rc_editing_url': None,
+        'rc_sources_open': {},  # Redirect keys whose affected-pages list is shown
         'rc_show_approve_warning': False,  # Warning modal for 302s
+        'rc_index': {'301': set(), '302': set(), 'pending': set(), 'approved': set()},  # Redirect keys by type/state
+        'rc_source_pages_to_fix': Counter(),  # Approved redirects per source page
+        'rc_decisions_version': 0,  # Bumped whenever a redirect decision changes
+        'rc_filtered_total': 0,  # Redirects matching the current filters
+        'rc_filtered_total_sig': None,  # Filter signature the total was counted for
 
         # Image Alt Text data
         'iat_df': None,  # Raw dataframe
         'iat_domain': None,
         'iat_images': {},  # Grouped image data by image URL
         'iat_decisions': {},
+        'iat_pending_count': 0,  # Image decisions with no approved_action yet
         'iat_excluded_count': 0,  # Count of filtered out images
 
         # Image Alt Text filters
@@ -51,6 +72,14 @@ def init_session_state():
         'iat_show_pending': True,
         'iat_page': 0,
         'iat_editing_url': None,
+        'iat_decisions_version': 0,  # Bumped whenever an image decision changes or images reload
+        'iat_alt_counts': {},  # Images per alt_status
+        'iat_alt_counts_sig': None,  # Data signature the counts were taken for
+        'iat_filtered_keys': [],  # Filtered image URLs in impact order
+        'iat_filtered_sig': None,  # Filter signature the keys were built for
+        'iat_fix_targets': frozenset(),  # Source pages with an approved alt text fix
+        'iat_fixes_to_apply': [],  # One {source_url, image_url, new_alt} per page/image to update
+        'iat_fix_targets_sig': None,  # Data signature the pages and fixes were collected for
 
         # WordPress connection (shared)
         'wp_connected': False,
@@ -92,8 +121,19 @@ def init_session_state():
         'post_id_check_done': False,  # Sample check completed
         'post_id_check_passed': False,  # Sample check found Post IDs
         'post_id_cache': {},  # Cache of URL -> Post ID (found or manual)
+        'post_id_negative_cache': {},  # URL -> time of last failed Post ID lookup
+        'apply_in_progress': False,  # WordPress fixes are being applied
         'full_mode_available': False,  # Post IDs available for unlimited fixes
 
+        # Upload section state
+        'scroll_to_upload': False,  # Scroll to upload section on next render
+        'expand_upload': None,  # Which upload expander to open
+
+        # Export state
+        'show_gsheets_export': False,  # Google Sheets export modal open
+        'gsheets_export_data': None,  # Generated report bytes
+        'gsheets_export_sheets': (),  # Tabs included in the generated report
+
         # Integrations panel state
         'show_integrations': False,  # Whether integrations panel is expanded
         'scroll_to_integrations': False,  # Scroll to integrations section
@@ -108,11 +148,117 @@ def init_session_state():
         'bulk_ai_results_summary': {'replace': 0, 'remove': 0, 'error': 0},
         'bulk_ai_start_time': 0,
         'bulk_ai_just_completed': False,
-        'bulk_ai_recent_results': [],  # Recent results for display
+        'bulk_ai_recent_results': deque(maxlen=10),  # Recent results for display
         'bulk_ai_paused_until': 0,  # Timestamp for rate limit pause
         'bulk_ai_pause_reason': '',  # Reason for pause
         'bulk_ai_error_state': None,  # Current error state dict
+        'bulk_ai_batch_size': 10,  # Adaptive batch size (5-25)
+        'bulk_ai_batches_done': 0,  # Batches completed or skipped this run
+        'bulk_ai_clean_batches': 0,  # Consecutive batches without errors
+        'batch_lat_ema': None,  # Moving average of batch latency (seconds)
     }
     for k, v in defaults.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
+        st.session_state.setdefault(k, v)
+
+
+# Pending-decision counter for each task's decisions dict
+PENDING_COUNT_KEYS = {
+    'decisions': 'broken_pending_count',
+    'rc_decisions': 'rc_pending_count',
+    'iat_decisions': 'iat_pending_count',
+}
+
+
+# Key-by-state index kept alongside a task's decisions dict
+DECISION_INDEX_KEYS = {
+    'rc_decisions': 'rc_index',
+}
+
+
+def build_rc_index():
+    """Index redirect keys by redirect type and approval state after redirects are loaded or cleared"""
+    redirects = st.session_state.rc_redirects
+    decisions = st.session_state.rc_decisions
+    index = {'301': set(), '302': set(), 'pending': set(), 'approved': set()}
+    for key, info in redirects.items():
+        index['302' if info['is_temp_redirect'] else '301'].add(key)
+        index['approved' if decisions[key]['approved_action'] else 'pending'].add(key)
+    st.session_state.rc_index = index
+    st.session_state.rc_source_pages_to_fix = Counter()
+    _count_rc_sources(index['approved'], approved=True)
+
+
+def _count_rc_sources(keys, approved: bool):
+    """Add or remove the source pages of approved redirects, dropping pages that reach zero"""
+    counter = st.session_state.rc_source_pages_to_fix
+    redirects = st.session_state.rc_redirects
+    for key in keys:
+        sources = redirects[key]['sources']
+        if approved:
+            counter.update(sources)
+            continue
+        counter.subtract(sources)
+        for source in sources:
+            if counter[source] <= 0:
+                del counter[source]
+
+
+def _move_in_index(decisions_key: str, keys, approved: bool):
+    """Move keys between the pending and approved sets of a task's index, if it has one"""
+    index = st.session_state.get(DECISION_INDEX_KEYS.get(decisions_key, ''))
+    if not index:
+        return
+    source, target = ('pending', 'approved') if approved else ('approved', 'pending')
+    moved = index[source].intersection(keys)
+    index[source] -= moved
+    index[target] |= moved
+    if decisions_key == 'rc_decisions':
+        _count_rc_sources(moved, approved)
+
+
+def _bump_decisions_version(decisions_key: str):
+    """Invalidate views cached against a task's decisions"""
+    version_key = f'{decisions_key}_version'
+    st.session_state[version_key] = st.session_state.get(version_key, 0) + 1
+
+
+def reset_pending_count(decisions_key: str):
+    """Recount pending decisions after a task's data is loaded or cleared"""
+    decisions = st.session_state.get(decisions_key) or {}
+    _bump_decisions_version(decisions_key)
+    st.session_state[PENDING_COUNT_KEYS[decisions_key]] = sum(
+        1 for d in decisions.values() if not d.get('approved_action')
+    )
+
+
+def set_approved_action(decisions_key: str, decision: Dict, action: str, fix: str = '', key: str = None):
+    """Set a decision's approved action and fix, keeping the pending counter (and index, given the key) in sync"""
+    counter_key = PENDING_COUNT_KEYS[decisions_key]
+    delta = (not decision.get('approved_action')) - (not action)
+    if delta:
+        st.session_state[counter_key] += delta
+        if key is not None:
+            _move_in_index(decisions_key, (key,), bool(action))
+    if decision.get('approved_action') != action or decision.get('approved_fix') != fix:
+        _bump_decisions_version(decisions_key)
+    decision['approved_action'] = action
+    decision['approved_fix'] = fix
+
+
+def set_approved_actions(decisions_key: str, fixes: Dict[str, str], action: str):
+    """Set the same approved action on many decisions at once ({key: fix}), keeping the pending counter in sync"""
+    decisions = st.session_state[decisions_key]
+    flipped = sum(1 for key in fixes if bool(decisions[key].get('approved_action')) != bool(action))
+    changed = any(
+        decisions[key].get('approved_action') != action or decisions[key].get('approved_fix') != fix
+        for key, fix in fixes.items()
+    )
+    decisions.update({
+        key: {**decisions[key], 'approved_action': action, 'approved_fix': fix}
+        for key, fix in fixes.items()
+    })
+    if flipped:
+        st.session_state[PENDING_COUNT_KEYS[decisions_key]] += -flipped if action else flipped
+        _move_in_index(decisions_key, fixes.keys(), bool(action))
+    if changed:
+        _bump_decisions_version(decisions_key)
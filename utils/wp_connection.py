@@ -0,0 +1,49 @@
+"""
+WordPress connection handling for Screaming Fixes.
+Keeps one tested WordPressClient per session.
+"""
+
+import importlib.util
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+if TYPE_CHECKING:
+    from wordpress_client import WordPressClient
+
+# Checked without importing; the client module is loaded on the first connection
+WP_AVAILABLE = importlib.util.find_spec("wordpress_client") is not None
+
+
+def get_wp_client(site_url: str, username: str, app_password: str) -> "WordPressClient":
+    """
+    Return this session's tested WordPress client, reusing it if the credentials are unchanged.
+    Clients are per session, so one user disconnecting never affects another.
+    Raises ConnectionError if the connection test fails.
+    """
+    current = st.session_state.get('wp_client')
+    if current is not None:
+        creds = current.credentials
+        if (creds.site_url, creds.username, creds.password) == (site_url, username, app_password):
+            return current
+    
+    from wordpress_client import WordPressClient
+    
+    client = WordPressClient(site_url, username, app_password)
+    result = client.test_connection()
+    if not result["success"]:
+        client.close()
+        raise ConnectionError(result["message"])
+    # The session's previous client (other credentials) is replaced, so release its connections
+    if current is not None:
+        current.close()
+    return client
+
+
+def disconnect_wp_client():
+    """Drop the session's WordPress connection and close its HTTP connection pool"""
+    client = st.session_state.get('wp_client')
+    if client is not None:
+        client.close()
+    st.session_state.wp_connected = False
+    st.session_state.wp_client = None